@@ -1,10 +1,12 @@
 """Contains show related classes."""
 import re
 from collections import namedtuple
+from time import perf_counter
 
 from typing import List, Dict, Any, Optional
 
 from mpf.core.assets import AssetPool
+from mpf.core.cache import BoundedCache
 from mpf.core.config_validator import RuntimeToken
 from mpf.core.utility_functions import Util
 from mpf.exceptions.config_file_error import ConfigFileError
@@ -85,7 +87,7 @@ class Show:
         self.name = name
         self.total_steps = None
         self.show_steps = []      # type: List[Dict[str, Any]]
-        self._step_cache = {}
+        self._step_cache = BoundedCache("show_steps", 256)
 
     def __lt__(self, other):
         """Compare two instances."""
@@ -410,8 +412,9 @@ class Show:
         """Get show steps and replace additional tokens."""
         if show_tokens and self.tokens:
             token_hash = hash(str(show_tokens))
-            if token_hash in self._step_cache:
-                return self._step_cache[token_hash]
+            show_steps = self._step_cache.get(token_hash)
+            if show_steps is not None:
+                return show_steps
 
             show_steps = self.get_show_steps()
             # if we need to replace more tokens copy the show
@@ -423,7 +426,7 @@ class Show:
                     if key in self.machine.show_controller.show_players.keys():
                         step[key] = self.machine.show_controller.show_players[key].expand_config_entry(value)
 
-            self._step_cache[token_hash] = show_steps
+            self._step_cache.put(token_hash, show_steps)
             return show_steps
 
         # otherwise return show steps. the caller should not change them
@@ -677,6 +680,9 @@ class RunningShow:
 
         self.current_step_index = self.next_step_index
 
+        profiler = self.machine.events.profiler
+        start = perf_counter() if profiler and profiler.should_sample() else None
+
         for item_type, item_dict in self.show_steps[self.current_step_index].items():
 
             if item_type == 'duration':
@@ -697,6 +703,9 @@ class RunningShow:
 
             self._players.add(item_type)
 
+        if start is not None:
+            profiler.add_sample("show_step", self.name, perf_counter() - start)
+
         if events:
             self._post_events(events)
 
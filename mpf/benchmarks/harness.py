@@ -0,0 +1,108 @@
+"""Structured benchmark harness.
+
+Scenarios are registered with the :func:`scenario` decorator. Each scenario runs a number of iterations and returns
+the duration of every iteration in seconds. :func:`run_benchmarks` turns these samples into percentiles and
+:func:`compare` checks them against a stored baseline.
+"""
+import datetime
+import json
+import platform
+from collections import namedtuple, OrderedDict
+from typing import Callable, Dict, List, Optional
+
+from mpf._version import version
+
+Scenario = namedtuple("Scenario", ["name", "callback", "iterations", "description"])
+Regression = namedtuple("Regression", ["scenario", "metric", "baseline", "current", "change"])
+
+SCENARIOS = OrderedDict()     # type: Dict[str, Scenario]
+
+JSON_FORMAT_VERSION = 1
+
+
+def scenario(name: str, iterations: int = 20):
+    """Register a benchmark scenario.
+
+    The decorated function is called with the number of iterations and returns a list of durations in seconds.
+    """
+    def _decorator(func: Callable[[int], List[float]]):
+        SCENARIOS[name] = Scenario(name, func, iterations, (func.__doc__ or "").strip().split("\n")[0])
+        return func
+    return _decorator
+
+
+def percentile(sorted_samples: List[float], percent: float) -> float:
+    """Return the percentile of sorted samples (nearest rank)."""
+    if not sorted_samples:
+        raise ValueError("Cannot calculate a percentile without samples.")
+    index = int(round(percent / 100 * (len(sorted_samples) - 1)))
+    return sorted_samples[index]
+
+
+def get_stats(samples: List[float]) -> Dict[str, float]:
+    """Return stats in ms for a list of durations in seconds."""
+    samples = sorted(samples)
+    return OrderedDict([
+        ("count", len(samples)),
+        ("mean", 1000 * sum(samples) / len(samples)),
+        ("min", 1000 * samples[0]),
+        ("p50", 1000 * percentile(samples, 50)),
+        ("p95", 1000 * percentile(samples, 95)),
+        ("p99", 1000 * percentile(samples, 99)),
+        ("max", 1000 * samples[-1]),
+    ])
+
+
+def run_benchmarks(names: Optional[List[str]] = None, iterations: Optional[int] = None,
+                   progress: Optional[Callable[[str, Dict[str, float]], None]] = None) -> dict:
+    """Run scenarios and return the JSON serializable results.
+
+    Runs all registered scenarios if names is empty. Unknown names raise a KeyError.
+    """
+    if not names:
+        names = list(SCENARIOS.keys())
+    results = OrderedDict()
+    for name in names:
+        entry = SCENARIOS[name]
+        stats = get_stats(entry.callback(iterations or entry.iterations))
+        results[name] = stats
+        if progress:
+            progress(name, stats)
+
+    return OrderedDict([
+        ("format", JSON_FORMAT_VERSION),
+        ("mpf_version", version),
+        ("python", platform.python_version()),
+        ("platform", platform.platform()),
+        ("timestamp", datetime.datetime.now().isoformat()),
+        ("results", results),
+    ])
+
+
+def compare(results: dict, baseline: dict, tolerance: float = 20.0, metric: str = "p50") -> List[Regression]:
+    """Return all scenarios which got slower than the baseline by more than tolerance percent.
+
+    Scenarios which are missing in either of both are ignored.
+    """
+    regressions = []
+    for name, stats in results["results"].items():
+        baseline_stats = baseline["results"].get(name)
+        if not baseline_stats or not baseline_stats.get(metric):
+            continue
+        change = 100 * (stats[metric] - baseline_stats[metric]) / baseline_stats[metric]
+        if change > tolerance:
+            regressions.append(Regression(name, metric, baseline_stats[metric], stats[metric], change))
+    return regressions
+
+
+def load_results(filename: str) -> dict:
+    """Load results or a baseline from a JSON file."""
+    with open(filename, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_results(results: dict, filename: str):
+    """Save results to a JSON file."""
+    with open(filename, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+        f.write("\n")
@@ -0,0 +1,415 @@
+"""Scenarios for the benchmark harness.
+
+Machine based scenarios use the unit test infrastructure with the virtual platform and a time travel loop. Only the
+wall clock time spent inside MPF is measured.
+"""
+import logging
+import os
+import shutil
+import subprocess   # nosec
+import sys
+import tempfile
+import time
+from types import SimpleNamespace
+
+from mpf.benchmarks.harness import scenario
+from mpf.core.bcp.bcp_socket_client import encode_command_string, decode_command_string
+from mpf.core.log_pipeline import LogPipeline
+from mpf.core.logging import LogMixin
+from mpf.core.rgb_color import RGBColor
+from mpf.core.segment_mappings import TextToSegmentMapper, FOURTEEN_SEGMENTS
+from mpf.devices.segment_display.segment_display_text import SegmentDisplayText
+from mpf.platforms.fast.communicators.base import FastSerialCommunicator
+from mpf.tests.MpfFakeGameTestCase import MpfFakeGameTestCase
+from mpf.tests.MpfTestCase import MpfTestCase
+
+
+class BenchmarkMachine(MpfTestCase):
+
+    """Machine with the virtual platform for benchmark scenarios."""
+
+    machine_path = 'benchmarks/machine_files/mode_start/'
+
+    def get_config_file(self):
+        return 'config.yaml'
+
+    def get_machine_path(self):
+        return self.machine_path
+
+    def get_options(self):
+        options = super().get_options()
+        options["production"] = True
+        return options
+
+    def get_platform(self):
+        return 'virtual'
+
+    def runTest(self):
+        """Do nothing. Scenarios drive the machine directly."""
+
+    def setUp(self):
+        LogMixin.unit_test = False
+        super().setUp()
+
+
+class BenchmarkShowMachine(BenchmarkMachine):
+
+    """Machine with tagged lights and token shows."""
+
+    machine_path = 'benchmarks/machine_files/shows/'
+
+
+class BenchmarkGameMachine(MpfFakeGameTestCase):
+
+    """Machine with scoring, shows and a fake playfield to play full games."""
+
+    def get_config_file(self):
+        return 'config.yaml'
+
+    def get_machine_path(self):
+        return 'benchmarks/machine_files/game/'
+
+    def get_options(self):
+        options = super().get_options()
+        options["production"] = True
+        return options
+
+    def get_platform(self):
+        return 'virtual'
+
+    def runTest(self):
+        """Do nothing. Scenarios drive the machine directly."""
+
+    def setUp(self):
+        LogMixin.unit_test = False
+        super().setUp()
+
+
+def _start_machine(test_class):
+    machine = test_class("runTest")
+    machine.setUp()
+    return machine
+
+
+def _measure(callback, iterations):
+    samples = []
+    for i in range(iterations):
+        start = time.perf_counter()
+        callback(i)
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def _startup(iterations, config_cache):
+    old_cache = MpfTestCase.config_cache
+    MpfTestCase.config_cache = config_cache
+    try:
+        samples = []
+        for _ in range(iterations):
+            start = time.perf_counter()
+            machine = _start_machine(BenchmarkMachine)
+            samples.append(time.perf_counter() - start)
+            machine.tearDown()
+    finally:
+        MpfTestCase.config_cache = old_cache
+    return samples
+
+
+@scenario("startup_cold", iterations=5)
+def startup_cold(iterations):
+    """Start a machine and load and validate all config files."""
+    return _startup(iterations, None)
+
+
+@scenario("startup_warm", iterations=5)
+def startup_warm(iterations):
+    """Start a machine with an already validated config."""
+    config_cache = {}
+    # fill the cache
+    _startup(1, config_cache)
+    return _startup(iterations, config_cache)
+
+
+def _get_import_time(machine_path):
+    """Run "mpf game" until the machine is ready and return the time spent in top level imports."""
+    package_path = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir, os.pardir))
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [package_path, os.environ.get("PYTHONPATH")])))
+    process = subprocess.run([sys.executable, "-X", "importtime", "-m", "mpf", "game", machine_path, "-x", "-t", "-b"],
+                             env=env, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, timeout=120, check=True,
+                             universal_newlines=True)     # nosec
+    total_us = 0
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        # nested imports are indented and already part of the cumulative time of their parent
+        if not name.startswith("  "):
+            total_us += int(cumulative)
+    return total_us / 1000000
+
+
+@scenario("game_import_time", iterations=5)
+def game_import_time(iterations):
+    """Import time of "mpf game" with a minimal config which quits when the machine is ready."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        machine_path = os.path.join(tmp_dir, "minimal")
+        shutil.copytree(os.path.join(os.path.dirname(__file__), "machine_files", "minimal"), machine_path)
+        # create the config cache
+        _get_import_time(machine_path)
+        return [_get_import_time(machine_path) for _ in range(iterations)]
+
+
+@scenario("mode_start_stop", iterations=100)
+def mode_start_stop(iterations):
+    """Start and stop a mode with 220 player entries."""
+    machine = _start_machine(BenchmarkMachine)
+    mode = machine.machine.modes["big_mode"]
+
+    def _start_stop(_):
+        mode.start()
+        machine.machine_run()
+        mode.stop()
+        machine.machine_run()
+
+    try:
+        # the first start creates the activation plan
+        _start_stop(0)
+        return _measure(_start_stop, iterations)
+    finally:
+        machine.tearDown()
+
+
+@scenario("bcp_encode_decode", iterations=50)
+def bcp_encode_decode(iterations):
+    """Encode and decode 100 BCP commands with typed parameters."""
+    def _encode_decode(i):
+        for j in range(100):
+            decode_command_string(encode_command_string(
+                "player_variable", name="score", value=i * j, prev_value=i, change=j, player_num=1,
+                text="Hit the ramp!", ratio=.5, json_list=[i, j], enabled=True))
+
+    return _measure(_encode_decode, iterations)
+
+
+@scenario("placeholder_evaluation", iterations=50)
+def placeholder_evaluation(iterations):
+    """Evaluate 100 int and bool placeholders with parameters and machine variables."""
+    machine = _start_machine(BenchmarkMachine)
+    placeholder_manager = machine.machine.placeholder_manager
+    machine.machine.variables.set_machine_var("multiplier", 3)
+    int_template = placeholder_manager.build_int_template("value * machine.multiplier + 100")
+    bool_template = placeholder_manager.build_bool_template("value > 10 and machine.multiplier == 3")
+
+    def _evaluate(i):
+        for j in range(100):
+            int_template.evaluate({"value": i + j})
+            bool_template.evaluate({"value": i + j})
+
+    try:
+        return _measure(_evaluate, iterations)
+    finally:
+        machine.tearDown()
+
+
+@scenario("show_token_expansion", iterations=50)
+def show_token_expansion(iterations):
+    """Expand the tokens of a multi step show with new token values."""
+    machine = _start_machine(BenchmarkShowMachine)
+    show = machine.machine.shows["multi_step_tags"]
+
+    def _expand(i):
+        # new colors every time so the step cache of the show does not hit
+        show.get_show_steps_with_token({
+            "tag1": "light_group_1", "tag2": "light_group_2", "tag3": "light_group_3", "tag4": "playfield",
+            "color1": "{:06X}".format(i), "color2": "{:06X}".format(i + 1), "color3": "{:06X}".format(i + 2)})
+
+    try:
+        return _measure(_expand, iterations)
+    finally:
+        machine.tearDown()
+
+
+@scenario("show_churn", iterations=50)
+def show_churn(iterations):
+    """Play and stop two single light show_player entries with static settings 100 times."""
+    machine = _start_machine(BenchmarkShowMachine)
+    events = machine.machine.events
+
+    def _play_stop(_):
+        for _ in range(100):
+            events.post("play_minimal_light_show")
+            events.post("play_minimal_light_show_token")
+            machine.machine_run()
+            events.post("stop_minimal_light_show")
+            events.post("stop_minimal_light_show_token")
+            machine.machine_run()
+
+    try:
+        return _measure(_play_stop, iterations)
+    finally:
+        machine.tearDown()
+
+
+@scenario("light_stack", iterations=50)
+def light_stack(iterations):
+    """Add and remove 200 entries on a light with 100 layered keys."""
+    machine = _start_machine(BenchmarkShowMachine)
+    light = machine.machine.lights["light_1"]
+    keys = ["show_{}".format(i) for i in range(100)]
+    for i, key in enumerate(keys):
+        light.color("red", priority=i % 10, key=key)
+
+    def _add_remove(i):
+        for j in range(100):
+            key = keys[(i * 37 + j * 13) % 100]
+            light.remove_from_stack_by_key(key)
+            light.color("blue", priority=(i + j) % 10, key=key)
+            light.get_color()
+
+    try:
+        return _measure(_add_remove, iterations)
+    finally:
+        machine.tearDown()
+
+
+@scenario("delay_churn", iterations=50)
+def delay_churn(iterations):
+    """Add, reset and cancel 1000 named and anonymous delays and run 100 of them."""
+    machine = _start_machine(BenchmarkMachine)
+    delay = machine.machine.delay
+
+    def _callback(**kwargs):
+        del kwargs
+
+    def _churn(_):
+        handles = []
+        for i in range(250):
+            delay.reset(100, _callback, "timer_{}".format(i % 10), value=i)
+            handles.append(delay.add(50, _callback, value=i))
+        for handle in handles[:150]:
+            delay.remove(handle)
+        for i in range(250):
+            delay.schedule(10, _callback, value=i).cancel()
+        for i in range(250):
+            delay.schedule(20, _callback, value=i)
+        delay.clear()
+        for i in range(100):
+            delay.add(1, _callback, value=i)
+        machine.advance_time_and_run(.01)
+
+    try:
+        return _measure(_churn, iterations)
+    finally:
+        machine.tearDown()
+
+
+@scenario("segment_display_rendering", iterations=50)
+def segment_display_rendering(iterations):
+    """Render and map 1000 score texts of which most were shown before."""
+    colors = [RGBColor("red"), RGBColor("white")]
+    scores = ["{:,}".format(i * 1250) for i in range(50)]
+
+    def _render(i):
+        for j in range(1000):
+            text = SegmentDisplayText.from_str(scores[(i + j) % len(scores)], 7, True, True, False, colors)
+            TextToSegmentMapper.map_segment_text_to_segments(text, 7, FOURTEEN_SEGMENTS)
+
+    return _measure(_render, iterations)
+
+
+class _SlowStorageHandler(logging.Handler):
+
+    """Handler which formats records and waits 0.2ms per write like a slow SD card."""
+
+    def emit(self, record):
+        self.format(record)
+        # like file I/O, sleep releases the GIL
+        time.sleep(0.0002)
+
+
+class _LoggingDevice(LogMixin):
+
+    machine = None
+
+
+def _logging_jitter(iterations, use_pipeline):
+    logger = logging.getLogger("benchmark_logging")
+    logger.setLevel(logging.DEBUG)
+    logger.propagate = False
+    handler = _SlowStorageHandler()
+    handler.setFormatter(logging.Formatter('%(asctime)s : %(levelname)s : %(name)s : %(message)s'))
+    pipeline = None
+    if use_pipeline:
+        pipeline = LogPipeline([handler], logger=logger)
+        pipeline.start()
+    else:
+        logger.addHandler(handler)
+    device = _LoggingDevice()
+    device.configure_logging("benchmark_logging.device", "full", "full")
+
+    def _log(i):
+        for j in range(20):
+            device.debug_log("Switch %s changed to %s after %sms", j, i % 2, j * 1.5)
+
+    try:
+        return _measure(_log, iterations)
+    finally:
+        if pipeline:
+            pipeline.stop()
+        else:
+            logger.removeHandler(handler)
+
+
+@scenario("logging_sync", iterations=50)
+def logging_sync(iterations):
+    """Log 20 debug lines to a slow handler on the calling thread."""
+    return _logging_jitter(iterations, False)
+
+
+@scenario("logging_pipeline", iterations=50)
+def logging_pipeline(iterations):
+    """Log 20 debug lines to a slow handler through the logging pipeline."""
+    return _logging_jitter(iterations, True)
+
+
+@scenario("serial_frame_parsing", iterations=50)
+def serial_frame_parsing(iterations):
+    """Split and dispatch 1000 FAST switch frames which arrive in arbitrary chunks."""
+    platform = SimpleNamespace(machine=SimpleNamespace(is_shutting_down=False, options={'production': True}),
+                               debug=False)
+    communicator = FastSerialCommunicator(platform, "net", {'debug': False})
+    received = []
+    communicator.message_processors['-N:'] = received.append
+    communicator.message_processors['/N:'] = received.append
+
+    data = b''.join('-N:{0:02X}\r/N:{0:02X}\r'.format(i % 104).encode() for i in range(500))
+    chunks = [data[pos:pos + 37] for pos in range(0, len(data), 37)]
+
+    def _parse(_):
+        received.clear()
+        for chunk in chunks:
+            communicator.parse_incoming_raw_bytes(chunk)
+        assert len(received) == 1000
+
+    return _measure(_parse, iterations)
+
+
+@scenario("simulated_game", iterations=5)
+def simulated_game(iterations):
+    """Play a three ball game with 50 scoring switch hits per ball."""
+    machine = _start_machine(BenchmarkGameMachine)
+    switches = ["s_target_0", "s_target_1", "s_target_2", "s_target_3", "s_ramp"]
+
+    def _play(_):
+        machine.start_game()
+        for _ in range(3):
+            for hit in range(50):
+                machine.hit_and_release_switch(switches[hit % len(switches)])
+                machine.advance_time_and_run(.05)
+            machine.drain_all_balls()
+        assert not machine.machine.game
+
+    try:
+        return _measure(_play, iterations)
+    finally:
+        machine.tearDown()
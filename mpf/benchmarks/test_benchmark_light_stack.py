@@ -0,0 +1,63 @@
+import random
+import time
+
+from mpf.core.logging import LogMixin
+
+from mpf.tests.MpfTestCase import MpfTestCase
+
+
+class BenchmarkLightStack(MpfTestCase):
+
+    """Add and remove entries on light stacks with many layered keys."""
+
+    def get_config_file(self):
+        return 'config.yaml'
+
+    def get_machine_path(self):
+        return 'benchmarks/machine_files/shows/'
+
+    def get_options(self):
+        options = super().get_options()
+        if self.unittest_verbosity() <= 1:
+            options["production"] = True
+        return options
+
+    def get_platform(self):
+        return 'virtual'
+
+    def setUp(self):
+        LogMixin.unit_test = False
+        super().setUp()
+
+    def _output(self, name, start, end, num):
+        print("{}: Duration {:.5f}ms Per second: {:2f}".format(
+            name, (1000 * (end - start) / num), num / (end - start)))
+
+    def _benchmark(self, layers, num=10000, iterations=5):
+        light = self.machine.lights["light_1"]
+        keys = ["show_{}".format(i) for i in range(layers)]
+        rnd = random.Random(layers)
+        total = 0
+        for _ in range(iterations):
+            light.clear_stack()
+            for i, key in enumerate(keys):
+                light.color("red", priority=i % 10, key=key)
+
+            start = time.time()
+            for i in range(num):
+                key = keys[rnd.randrange(layers)]
+                if i % 2:
+                    light.remove_from_stack_by_key(key)
+                else:
+                    light.color("blue" if i % 4 else "green", priority=rnd.randrange(10), key=key)
+                light.get_color()
+            end = time.time()
+            total += (end - start) / num
+            self._output("{} layers".format(layers), start, end, num)
+
+        print("Total average {:.5f}ms".format(total * 1000 / iterations))
+        return total / iterations
+
+    def testBenchmark(self):
+        results = [(layers, self._benchmark(layers)) for layers in (1, 10, 50, 200)]
+        print("; ".join("{} layers: {:.5f}ms".format(layers, duration * 1000) for layers, duration in results))
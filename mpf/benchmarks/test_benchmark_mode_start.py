@@ -0,0 +1,59 @@
+import time
+
+from mpf.core.logging import LogMixin
+
+from mpf.tests.MpfTestCase import MpfTestCase
+
+
+class BenchmarkModeStart(MpfTestCase):
+
+    """Benchmark start and stop of a mode with 220 player entries."""
+
+    def get_config_file(self):
+        return 'config.yaml'
+
+    def get_machine_path(self):
+        return 'benchmarks/machine_files/mode_start/'
+
+    def get_options(self):
+        options = super().get_options()
+        if self.unittest_verbosity() <= 1:
+            options["production"] = True
+        return options
+
+    def get_platform(self):
+        return 'virtual'
+
+    def setUp(self):
+        LogMixin.unit_test = False
+        super().setUp()
+
+    def _start_stop(self, num):
+        start_time = 0
+        stop_time = 0
+        for _ in range(num):
+            start = time.perf_counter()
+            self.machine.modes["big_mode"].start()
+            self.machine_run()
+            end = time.perf_counter()
+            self.machine.modes["big_mode"].stop()
+            self.machine_run()
+            end2 = time.perf_counter()
+            start_time += end - start
+            stop_time += end2 - end
+        return start_time / num, stop_time / num
+
+    def testBenchmark(self):
+        start = time.perf_counter()
+        self.machine.modes["big_mode"].start()
+        self.machine_run()
+        first_start = time.perf_counter() - start
+        self.assertModeRunning("big_mode")
+        self.machine.modes["big_mode"].stop()
+        self.machine_run()
+        self.assertModeNotRunning("big_mode")
+
+        print("First start (creates activation plan): {:.3f}ms".format(first_start * 1000))
+        for _ in range(10):
+            start_time, stop_time = self._start_stop(100)
+            print("Mode start: {:.3f}ms Mode stop: {:.3f}ms".format(start_time * 1000, stop_time * 1000))
@@ -0,0 +1,92 @@
+import asyncio
+import logging
+import time
+import unittest
+from collections import deque
+from threading import Thread
+
+from mpf.platforms import p_roc_common
+
+
+class FakePinProc:
+
+    """Fake libpinproc which returns injected switch events."""
+
+    def __init__(self, machine_type):
+        del machine_type
+        self.events = deque()
+
+    def reset(self, flags):
+        del flags
+
+    def inject_event(self):
+        self.events.append({'type': 1, 'value': 23, 'time': time.perf_counter()})
+
+    def get_events(self):
+        events = list(self.events)
+        self.events.clear()
+        return events
+
+    def watchdog_tickle(self):
+        pass
+
+    def flush(self):
+        pass
+
+
+class FakePinProcModule:
+
+    PinPROC = FakePinProc
+
+
+class BenchmarkPRocSwitchLatency(unittest.TestCase):
+
+    """Benchmark the latency of switch events from the pinproc thread to the MPF loop."""
+
+    def setUp(self):
+        self._old_pinproc = p_roc_common.pinproc
+        p_roc_common.pinproc = FakePinProcModule
+
+    def tearDown(self):
+        p_roc_common.pinproc = self._old_pinproc
+
+    def _measure(self, poll_interval, num):
+        latencies = []
+        loop = asyncio.new_event_loop()
+        proc_loop = asyncio.new_event_loop()
+        proc_process = p_roc_common.ProcProcess()
+        proc_thread = Thread(target=proc_process.start_proc_process,
+                             args=(p_roc_common.pinproc.PinPROC, proc_loop, False, logging.getLogger("P-Roc")))
+        proc_thread.start()
+        while not proc_process.proc:
+            time.sleep(.01)
+
+        def process_events(events):
+            now = time.perf_counter()
+            for event in events:
+                latencies.append(now - event['time'])
+
+        async def run():
+            poller = asyncio.wrap_future(asyncio.run_coroutine_threadsafe(
+                proc_process.deliver_events(poll_interval, .1, loop, process_events), proc_loop))
+            for _ in range(num):
+                proc_process.proc.inject_event()
+                # simulate work in the MPF loop between switch events
+                await asyncio.sleep(poll_interval * 1.3)
+            await asyncio.sleep(poll_interval * 2)
+            poller.cancel()
+            await asyncio.wait([poller])
+
+        loop.run_until_complete(run())
+        proc_loop.call_soon_threadsafe(proc_process.stop)
+        proc_thread.join()
+        loop.close()
+        latencies.sort()
+        return latencies
+
+    def testBenchmark(self):
+        for poll_interval in (.01, .001):
+            latencies = self._measure(poll_interval, 200)
+            print("Poll interval {}ms: {} events. Latency avg: {:.3f}ms p95: {:.3f}ms max: {:.3f}ms".format(
+                poll_interval * 1000, len(latencies), 1000 * sum(latencies) / len(latencies),
+                1000 * latencies[int(len(latencies) * .95)], 1000 * latencies[-1]))
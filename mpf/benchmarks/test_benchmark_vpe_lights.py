@@ -0,0 +1,74 @@
+import time
+
+from mpf.core.logging import LogMixin
+
+from mpf.tests.MpfTestCase import MpfTestCase
+
+
+class MockServer:
+
+    async def stop(self, grace):
+        pass
+
+    async def wait_for_termination(self):
+        pass
+
+
+class BenchmarkVpeLights(MpfTestCase):
+
+    """Benchmark light shows on VPE using the in-process VPE stand-in."""
+
+    def get_options(self):
+        options = super().get_options()
+        if self.unittest_verbosity() <= 1:
+            options["production"] = True
+        return options
+
+    def get_config_file(self):
+        return 'config.yaml'
+
+    def get_machine_path(self):
+        return 'benchmarks/machine_files/vpe_lights/'
+
+    def get_platform(self):
+        return False
+
+    async def _connect_to_mock_client(self, service, port):
+        del port
+        await self.simulator.connect(service)
+        return MockServer()
+
+    def _mock_loop(self):
+        self.simulator.init_async()
+
+    def setUp(self):
+        try:
+            from mpf.tests.vpe_simulator import VpeSimulation
+        except (SyntaxError, ImportError) as e:
+            self.skipTest("Cannot import VPE simulator because {}".format(e))
+            return
+
+        LogMixin.unit_test = False
+        self.simulator = VpeSimulation({})
+        import mpf.platforms.visual_pinball_engine.visual_pinball_engine
+        mpf.platforms.visual_pinball_engine.visual_pinball_engine.VisualPinballEnginePlatform.listen = \
+            self._connect_to_mock_client
+        super().setUp()
+
+    def tearDown(self):
+        self.simulator.stop()
+        super().tearDown()
+
+    def testBenchmark(self):
+        num = 1000
+        for _ in range(10):
+            fade_commands = self.simulator.fade_commands
+            start = time.time()
+            self.post_event("play_all_leds")
+            for _ in range(num):
+                self.advance_time_and_run(.05)
+            self.post_event("stop_all_leds")
+            end = time.time()
+            self.advance_time_and_run(1)
+            print("32 RGB LEDs show: {:.5f}ms per step. {:.2f} fade commands per step".format(
+                1000 * (end - start) / num, (self.simulator.fade_commands - fade_commands) / num))
@@ -3,11 +3,10 @@ import argparse
 from importlib import import_module
 import os
 import sys
-from pkg_resources import iter_entry_points
-
 
 import mpf.core
 from mpf.core.config_loader import ProductionConfigLoader
+from mpf.core.utility_functions import Util
 from mpf._version import version
 
 EXAMPLES_FOLDER = 'examples'
@@ -130,14 +129,13 @@ class CommandLineUtility(MpfCommandLineParser):
         """Initialize CLI entry point."""
         super().__init__(path=path, args=sys.argv[:])
         self.external_commands = dict()
-        self.get_external_commands()
 
-    def get_external_commands(self):
+    def get_external_commands(self, name=None):
         """Entry point to hook more commands.
 
-        This is used from mpf mc.
+        This is used from mpf mc. If name is passed only the entry point with that name is loaded.
         """
-        for entry_point in iter_entry_points(group='mpf.command', name=None):
+        for entry_point in Util.get_entry_points('mpf.command', name):
             command, function_ref = entry_point.load()()
             self.external_commands[command] = function_ref
 
@@ -163,6 +161,8 @@ class CommandLineUtility(MpfCommandLineParser):
 
         if len(self.argv) > 1:
 
+            # only import the external command which is actually used
+            self.get_external_commands(self.argv[1])
             if self.argv[1] in self.external_commands:
                 command = self.argv.pop(1)
                 self.external_commands[command](self.mpf_path,
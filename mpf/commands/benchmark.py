@@ -0,0 +1,73 @@
+"""Run benchmark scenarios and compare them against a baseline."""
+import argparse
+import json
+import logging
+import sys
+
+from mpf.benchmarks import harness
+from mpf.commands import MpfCommandLineParser
+from mpf.benchmarks import scenarios  # noqa: F401 pylint: disable-msg=unused-import
+
+SUBCOMMAND = True
+
+
+class Command(MpfCommandLineParser):
+
+    """Run benchmark scenarios from cli."""
+
+    def __init__(self, args, path):
+        """Parse args and run benchmarks."""
+        super().__init__(args, path)
+        parser = argparse.ArgumentParser(description='Run MPF benchmark scenarios and output JSON.')
+
+        parser.add_argument("-s", "--scenario", action="append", dest="scenarios", default=[],
+                            help="Scenario to run. Can be passed multiple times. Runs all scenarios by default.")
+        parser.add_argument("-i", "--iterations", type=int, default=None,
+                            help="Number of iterations per scenario. Every scenario has its own default.")
+        parser.add_argument("-o", "--output", default=None,
+                            help="Write the JSON results to this file instead of stdout.")
+        parser.add_argument("-b", "--baseline", default=None,
+                            help="Compare the results against this JSON file. Exits with 1 on regressions.")
+        parser.add_argument("-t", "--tolerance", type=float, default=20.0,
+                            help="Allowed slowdown in percent before a scenario counts as regression.")
+        parser.add_argument("--metric", default="p50", choices=["mean", "p50", "p95", "p99"],
+                            help="Metric to compare against the baseline.")
+        parser.add_argument("-l", "--list", action="store_true", default=False, dest="list_scenarios",
+                            help="List all scenarios and exit.")
+
+        args = parser.parse_args(self.argv[1:])
+
+        if args.list_scenarios:
+            for entry in harness.SCENARIOS.values():
+                print("{:<25} {}".format(entry.name, entry.description))
+            return
+
+        unknown = [name for name in args.scenarios if name not in harness.SCENARIOS]
+        if unknown:
+            parser.error("Unknown scenarios: {}. Use --list to show all scenarios.".format(", ".join(unknown)))
+
+        # benchmarks should not pay for logging
+        logging.basicConfig(level=99)
+
+        results = harness.run_benchmarks(args.scenarios, args.iterations, self._print_progress)
+
+        if args.output:
+            harness.save_results(results, args.output)
+        else:
+            print(json.dumps(results, indent=2))
+
+        if args.baseline:
+            regressions = harness.compare(results, harness.load_results(args.baseline), args.tolerance,
+                                          args.metric)
+            for regression in regressions:
+                print("Regression in {}: {} {:.3f}ms -> {:.3f}ms (+{:.1f}%)".format(
+                    regression.scenario, regression.metric, regression.baseline, regression.current,
+                    regression.change), file=sys.stderr)
+            if regressions:
+                sys.exit(1)
+            print("No regressions compared to {}.".format(args.baseline), file=sys.stderr)
+
+    @staticmethod
+    def _print_progress(name, stats):
+        print("{:<25} p50: {:9.3f}ms p95: {:9.3f}ms max: {:9.3f}ms".format(
+            name, stats["p50"], stats["p95"], stats["max"]), file=sys.stderr)
@@ -1,7 +1,9 @@
 """Command to build artifacts for non-dev operations."""
+import os
 import pickle
 
 import argparse
+from mpf.core.asset_index import AssetIndex
 from mpf.core.utility_functions import Util
 
 from mpf.core.config_loader import YamlMultifileConfigLoader, ProductionConfigLoader
@@ -69,4 +71,21 @@ class Command(MpfCommandLineParser):
         if self.args.mc:
             with open(ProductionConfigLoader.get_mpf_mc_bundle_path(self.machine_path), "wb") as mc_file:
                 pickle.dump(mc_config, mc_file)
+
+        self._build_asset_index()
         print("Success.")
+
+    def _build_asset_index(self):
+        """Index all asset and show folders of the machine.
+
+        Folders of the built-in modes are not part of the bundle because they depend on the MPF installation of the
+        target. They are scanned when they are loaded.
+        """
+        asset_index = AssetIndex(ProductionConfigLoader.get_asset_index_bundle_path(self.machine_path),
+                                 load_cache=False, store_cache=True)
+        for _ in asset_index.walk(self.machine_path):
+            pass
+
+        if self.args.dest_path:
+            asset_index.rebase(self.machine_path, os.path.abspath(self.args.dest_path))
+        asset_index.save()
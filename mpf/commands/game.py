@@ -8,11 +8,10 @@ import socket
 import sys
 import datetime
 import logging
-from logging.handlers import QueueHandler, SysLogHandler
-
-from queue import Queue
+from logging.handlers import SysLogHandler
 
 from mpf.core.crash_reporter import report_crash
+from mpf.core.log_pipeline import LogPipeline, BLOCK, DROP
 from mpf.core.machine import MachineController
 from mpf.core.utility_functions import Util
 from mpf.core.config_loader import YamlMultifileConfigLoader, ProductionConfigLoader
@@ -133,6 +132,15 @@ class Command:
                                  "Alternatively, you an specify host:port for "
                                  "remote logging over UDP.")
 
+        parser.add_argument("--log-queue-size",
+                            action="store", dest="log_queue_size", type=int, default=10000,
+                            help="Maximum number of log records which wait to be written by the logging thread.")
+
+        parser.add_argument("--log-queue-policy",
+                            action="store", dest="log_queue_policy", choices=[BLOCK, DROP], default=BLOCK,
+                            help="What to do when the log queue is full. block waits until there is space. drop "
+                                 "drops the record and logs how many records were dropped.")
+
         parser.add_argument("-X",
                             action="store_const", dest="force_platform",
                             const='smart_virtual',
@@ -180,13 +188,6 @@ class Command:
         console_log.setFormatter(logging.Formatter(
             '%(asctime)s.%(msecs)03d : %(levelname)s [%(name)s] %(message)s', "%H:%M:%S"))
 
-        # initialize async handler for console
-        console_log_queue = Queue()
-        console_queue_handler = QueueHandler(console_log_queue)
-        self.console_queue_listener = logging.handlers.QueueListener(
-            console_log_queue, console_log, respect_handler_level=True)
-        self.console_queue_listener.start()
-
         # initialize file log
         file_log = logging.FileHandler(full_logfile_path)
         if self.args.jsonlogging:
@@ -195,19 +196,7 @@ class Command:
             formatter = logging.Formatter('%(asctime)s : %(levelname)s : %(name)s : %(message)s')
         file_log.setFormatter(formatter)
 
-        # initialize async handler for file log
-        file_log_queue = Queue()
-        file_queue_handler = QueueHandler(file_log_queue)
-        self.file_queue_listener = logging.handlers.QueueListener(
-            file_log_queue, file_log)
-        self.file_queue_listener.start()
-
-        # add loggers
-        logger = logging.getLogger()
-        logger.addHandler(console_queue_handler)
-        logger.addHandler(file_queue_handler)
-        logger.setLevel(self.args.loglevel)
-        logger.info("Loading config.")
+        handlers = [console_log, file_log]
 
         if self.args.syslog_address:
             try:
@@ -217,7 +206,15 @@ class Command:
             else:
                 syslog_logger = SysLogHandler((host, int(port)))
 
-            logger.addHandler(syslog_logger)
+            handlers.append(syslog_logger)
+
+        # format and write all records in a background thread
+        self.log_pipeline = LogPipeline(handlers, self.args.log_queue_size, self.args.log_queue_policy)
+        self.log_pipeline.start()
+
+        logger = logging.getLogger()
+        logger.setLevel(self.args.loglevel)
+        logger.info("Loading config.")
 
         signal.signal(signal.SIGINT, self.sigint_handler)
 
@@ -272,9 +269,8 @@ class Command:
         if exception:
             logging.exception(exception)
 
+        self.log_pipeline.stop()
         logging.shutdown()
-        self.console_queue_listener.stop()
-        self.file_queue_listener.stop()
 
         if self.args.pause:
             input('Press ENTER to continue...')     # nosec
@@ -0,0 +1,325 @@
+"""Play simulated games on a machine config to soak test MPF."""
+import argparse
+import asyncio
+import gc
+import json
+import logging
+import os
+import random
+import time
+from collections import namedtuple
+from typing import List, Optional
+
+from psutil import Process
+
+import mpf.core
+from mpf.core.file_manager import FileManager
+from mpf.core.logging import LogMixin
+from mpf.core.utility_functions import Util
+from mpf.tests.loop import TimeTravelLoop, TestClock
+from mpf.tests.MpfTestCase import TestMachineController, UnitTestConfigLoader
+
+SimulationSample = namedtuple("SimulationSample", ["games", "simulated_time", "wall_time", "throughput", "rss",
+                                                   "objects", "event_handlers", "switch_handlers", "timers"])
+
+DEFAULT_SCRIPT = {
+    "start_switch": None,       # defaults to the first switch tagged start
+    "players": 1,
+    "switches": None,           # switch name -> weight. defaults to all switches tagged playfield_active
+    "hit_interval": "500ms",    # mean simulated time between two switch hits
+    "hit_duration": "20ms",     # how long a switch stays active when hit
+    "ball_duration": "30s",     # mean simulated time until a ball drains
+    "drain_device": None,       # defaults to the first ball device tagged drain
+    "max_game_duration": "1h",  # a game which takes longer than this is considered to hang
+}
+
+
+class SimulationError(AssertionError):
+
+    """The simulation could not continue."""
+
+
+class SwitchEventGenerator:
+
+    """Generates switch hits and ball times from a script.
+
+    The same seed and script always produce the same sequence.
+    """
+
+    __slots__ = ["_random", "_switches", "_weights", "_hit_interval", "_ball_duration"]
+
+    def __init__(self, switches: List[str], weights: List[float], hit_interval: float, ball_duration: float,
+                 seed=None) -> None:
+        """Initialize generator."""
+        if not switches:
+            raise SimulationError("Simulation needs at least one switch to hit.")
+        self._random = random.Random(seed)
+        self._switches = switches
+        self._weights = weights
+        self._hit_interval = hit_interval
+        self._ball_duration = ball_duration
+
+    def next_hit_delay(self) -> float:
+        """Return the simulated time until the next switch hit."""
+        return self._random.expovariate(1 / self._hit_interval)
+
+    def next_switch(self) -> str:
+        """Return the switch to hit next."""
+        return self._random.choices(self._switches, self._weights)[0]
+
+    def next_ball_duration(self) -> float:
+        """Return the simulated time until the current ball drains."""
+        return self._random.expovariate(1 / self._ball_duration)
+
+
+class Simulator:
+
+    """Runs a machine under simulated time and plays games.
+
+    The machine uses the time travel loop from the unit tests. Time only advances when nothing is left to do so
+    simulated hours pass in wall seconds.
+    """
+
+    __slots__ = ["machine", "loop", "script", "generator", "games", "samples", "_start_wall_time",
+                 "_last_sample", "_drain_device", "_process"]
+
+    def __init__(self, machine_path: str, config_files: List[str], script: Optional[dict] = None,
+                 platform: str = "smart_virtual", seed=None, config_patches: Optional[dict] = None) -> None:
+        """Load config and initialize machine.
+
+        Config patches are merged into the machine config. BCP is always disabled because no media controller is
+        connected.
+        """
+        self.script = dict(DEFAULT_SCRIPT)
+        if script:
+            unknown = set(script) - set(DEFAULT_SCRIPT)
+            if unknown:
+                raise SimulationError("Unknown settings in simulation script: {}".format(", ".join(sorted(unknown))))
+            self.script.update(script)
+
+        mpfconfig = os.path.abspath(os.path.join(mpf.core.__path__[0], os.pardir, 'mpfconfig.yaml'))
+        options = {
+            'force_platform': platform,
+            'production': False,
+            'mpfconfigfile': mpfconfig,
+            'configfile': config_files,
+            'debug': False,
+            'bcp': False,
+            'no_load_cache': False,
+            'create_config_cache': True,
+            'platform_integration_test': False,
+            'text_ui': False,
+        }
+        patches = {"bcp": []}
+        if config_patches:
+            patches.update(config_patches)
+        config = UnitTestConfigLoader(machine_path, config_files, {}, patches, {}).load_mpf_config()
+
+        self.loop = TimeTravelLoop()
+        asyncio.set_event_loop(self.loop)
+        self.machine = TestMachineController(options, config, patches, {}, TestClock(self.loop), {}, True)
+        self.generator = None       # type: Optional[SwitchEventGenerator]
+        self.games = 0
+        self.samples = []           # type: List[SimulationSample]
+        self._start_wall_time = None
+        self._last_sample = None
+        self._drain_device = None
+        self._process = Process()
+        self._initialize(seed)
+
+    def _initialize(self, seed):
+        init = asyncio.ensure_future(self.machine.initialize(), loop=self.loop)
+        self.loop.run_until_complete(init)
+        self.machine.events.process_event_queue()
+        self.loop.run_until_complete(asyncio.sleep(.001))
+
+        if not hasattr(self.machine.default_platform, "add_ball_to_device"):
+            raise SimulationError("Simulation needs the smart_virtual platform to drain balls.")
+
+        if self.script["drain_device"]:
+            self._drain_device = self.machine.ball_devices[self.script["drain_device"]]
+        else:
+            drain_devices = self.machine.ball_devices.items_tagged("drain")
+            if not drain_devices:
+                raise SimulationError("No ball device is tagged drain. Set drain_device in the script.")
+            self._drain_device = drain_devices[0]
+
+        if not self.script["start_switch"]:
+            start_switches = self.machine.switches.items_tagged("start")
+            if not start_switches:
+                raise SimulationError("No switch is tagged start. Set start_switch in the script.")
+            self.script["start_switch"] = start_switches[0].name
+
+        switches = self.script["switches"]
+        if not switches:
+            switches = {switch.name: 1 for switch in self.machine.switches.items_tagged("playfield_active")}
+        for switch in switches:
+            if switch not in self.machine.switches:
+                raise SimulationError("Unknown switch {} in simulation script.".format(switch))
+
+        self.generator = SwitchEventGenerator(list(switches.keys()), list(switches.values()),
+                                              Util.string_to_secs(self.script["hit_interval"]),
+                                              Util.string_to_secs(self.script["ball_duration"]), seed)
+
+    def run(self, games: Optional[int] = None, duration: Optional[float] = None, sample_interval: float = 600,
+            progress=None) -> List[SimulationSample]:
+        """Play games until the number of games or the simulated duration is reached.
+
+        A sample is taken every sample_interval simulated seconds and after the last game. Progress is called with
+        every sample.
+        """
+        if not games and not duration:
+            raise SimulationError("Simulation needs a number of games or a duration.")
+        self._start_wall_time = time.perf_counter()
+        self._take_sample(progress)
+        self.loop.run_until_complete(self._run(games, duration, sample_interval, progress))
+        self._take_sample(progress)
+        return self.samples
+
+    async def _run(self, games, duration, sample_interval, progress):
+        end_time = self.loop.time() + duration if duration else None
+        next_sample = self.loop.time() + sample_interval
+        while (not games or self.games < games) and (not end_time or self.loop.time() < end_time):
+            game = asyncio.ensure_future(self._play_game())
+            while not game.done():
+                await asyncio.wait([game], timeout=max(next_sample - self.loop.time(), 0))
+                if self.loop.time() >= next_sample:
+                    self._take_sample(progress)
+                    next_sample += sample_interval
+            game.result()
+            self.games += 1
+
+    async def _play_game(self):
+        max_game_duration = Util.string_to_secs(self.script["max_game_duration"])
+        await self._wait_for(lambda: self.machine.modes["attract"].active, max_game_duration, "attract mode")
+
+        self._hit_switch(self.script["start_switch"])
+        await self._wait_for(lambda: self.machine.game and self.machine.game.player, 30, "game start")
+        for _ in range(self.script["players"] - 1):
+            await asyncio.sleep(.1)
+            self._hit_switch(self.script["start_switch"])
+
+        game_end = self.loop.time() + max_game_duration
+        while self.machine.game:
+            if self.loop.time() > game_end:
+                raise SimulationError("Game {} did not end after {}s.".format(self.games + 1, max_game_duration))
+            ball_end = self.loop.time() + self.generator.next_ball_duration()
+            while self.machine.game and self.loop.time() < ball_end:
+                await asyncio.sleep(self.generator.next_hit_delay())
+                if self.machine.playfield.balls > 0:
+                    self._hit_switch(self.generator.next_switch())
+            self._drain_balls()
+            await asyncio.sleep(1)
+
+    async def _wait_for(self, condition, timeout, name):
+        end = self.loop.time() + timeout
+        while not condition():
+            if self.loop.time() > end:
+                raise SimulationError("Timeout while waiting for {}.".format(name))
+            await asyncio.sleep(.1)
+
+    def _hit_switch(self, name):
+        self.machine.switch_controller.process_switch(name, 1, True)
+        self.loop.call_later(Util.string_to_secs(self.script["hit_duration"]),
+                             self.machine.switch_controller.process_switch, name, 0, True)
+
+    def _drain_balls(self):
+        for _ in range(self.machine.playfield.balls):
+            if self._drain_device.balls >= self._drain_device.capacity:
+                break
+            self.machine.default_platform.add_ball_to_device(self._drain_device)
+
+    def _take_sample(self, progress=None):
+        wall_time = time.perf_counter() - self._start_wall_time
+        simulated_time = self.loop.time()
+        if self._last_sample and wall_time > self._last_sample.wall_time:
+            throughput = (simulated_time - self._last_sample.simulated_time) / (wall_time - self._last_sample.wall_time)
+        else:
+            throughput = 0.0
+        sample = SimulationSample(
+            games=self.games,
+            simulated_time=simulated_time,
+            wall_time=wall_time,
+            throughput=throughput,
+            rss=self._process.memory_info().rss,
+            objects=len(gc.get_objects()),
+            event_handlers=sum(len(handlers) for handlers in self.machine.events.registered_handlers.values()),
+            switch_handlers=sum(len(handlers[0]) + len(handlers[1]) for handlers in
+                                self.machine.switch_controller.registered_switches.values()),
+            timers=len(self.loop._scheduled))     # pylint: disable-msg=protected-access
+        self.samples.append(sample)
+        self._last_sample = sample
+        if progress:
+            progress(sample)
+
+    def stop(self):
+        """Stop the machine and close the loop."""
+        self.machine.events.post('shutdown')
+        self.machine.events.process_event_queue()
+        self.machine.shutdown()
+        asyncio.set_event_loop(None)
+
+
+class Command:
+
+    """Play simulated games under simulated time and record throughput, memory and handler counts."""
+
+    def __init__(self, mpf_path, machine_path, args):
+        """Parse args and run the simulation."""
+        del mpf_path
+        parser = argparse.ArgumentParser(description='Play simulated games on a machine config')
+
+        parser.add_argument("-c", action="store", dest="configfile", default="config.yaml", metavar='config_file',
+                            help="The name of a config file to load. Default is config.yaml. Multiple files can be "
+                                 "used via a comma-separated list (no spaces between)")
+        parser.add_argument("-g", "--games", type=int, default=None,
+                            help="Number of games to play. Default is 100 if no duration is given.")
+        parser.add_argument("-d", "--duration", default=None,
+                            help="Simulated time to run, e.g. 24h.")
+        parser.add_argument("-s", "--script", default=None,
+                            help="YAML file with the simulation script (switches, weights and timings).")
+        parser.add_argument("--seed", type=int, default=0,
+                            help="Seed for the switch event generator. The same seed plays the same games.")
+        parser.add_argument("-i", "--sample-interval", default="10m", dest="sample_interval",
+                            help="Simulated time between two samples. Default is 10m.")
+        parser.add_argument("-x", action="store_const", dest="platform", const='virtual', default='smart_virtual',
+                            help="Use the virtual platform instead of smart_virtual.")
+        parser.add_argument("-o", "--output", default=None,
+                            help="Write all samples as JSON to this file.")
+        parser.add_argument("-v", action="store_const", dest="loglevel", const=logging.DEBUG, default=logging.ERROR,
+                            help="Enables verbose logging.")
+
+        args = parser.parse_args(args)
+        logging.basicConfig(level=args.loglevel)
+        LogMixin.unit_test = False
+
+        duration = Util.string_to_secs(args.duration) if args.duration else None
+        games = args.games if args.games or duration else 100
+        script = FileManager.load(args.script) if args.script else None
+
+        print("{:>7} {:>12} {:>9} {:>9} {:>9} {:>10} {:>9} {:>9} {:>7}".format(
+            "games", "simulated", "wall", "speed", "rss MB", "objects", "events", "switches", "timers"))
+        simulator = Simulator(machine_path, Util.string_to_event_list(args.configfile), script, args.platform,
+                              args.seed)
+        try:
+            samples = simulator.run(games, duration, Util.string_to_secs(args.sample_interval), self._print_sample)
+        finally:
+            simulator.stop()
+
+        first, last = samples[0], samples[-1]
+        print("Played {} games in {:.0f}s simulated time and {:.1f}s wall time ({:.0f}x). RSS grew by {:.1f}MB, "
+              "event handlers by {}, switch handlers by {}.".format(
+                  last.games, last.simulated_time, last.wall_time,
+                  last.simulated_time / last.wall_time if last.wall_time else 0,
+                  (last.rss - first.rss) / 1024 / 1024, last.event_handlers - first.event_handlers,
+                  last.switch_handlers - first.switch_handlers))
+
+        if args.output:
+            with open(args.output, "w", encoding="utf-8") as f:
+                json.dump({"seed": args.seed, "samples": [sample._asdict() for sample in samples]}, f, indent=2)
+
+    @staticmethod
+    def _print_sample(sample: SimulationSample):
+        print("{:>7} {:>11.0f}s {:>8.1f}s {:>8.0f}x {:>9.1f} {:>10} {:>9} {:>9} {:>7}".format(
+            sample.games, sample.simulated_time, sample.wall_time, sample.throughput, sample.rss / 1024 / 1024,
+            sample.objects, sample.event_handlers, sample.switch_handlers, sample.timers))
@@ -1,5 +1,8 @@
 """Show config player."""
-from mpf.core.placeholder_manager import ConditionalEvent
+from typing import Dict, Optional, Tuple
+
+from mpf.assets.show import ShowConfig
+from mpf.core.placeholder_manager import ConditionalEvent, NativeTypeTemplate
 
 from mpf.config_players.device_config_player import DeviceConfigPlayer
 
@@ -9,6 +12,80 @@ RESERVED_KEYS = ["show", "priority", "speed", "block_queue", "start_step", "loop
                  "events_when_stepped_back", "events_when_updated", "events_when_completed"]
 
 
+def _split_template(template) -> Tuple[object, Optional[object]]:
+    """Return (value, None) for static templates and (None, template) for real placeholders."""
+    if isinstance(template, NativeTypeTemplate):
+        return template.value, None
+    return None, template
+
+
+class ShowPlayerEntry:
+
+    """Precompiled settings of one show_player entry.
+
+    All settings which are not placeholders are resolved once when the config is validated. If speed and all
+    show_tokens are static the ShowConfig is created on the first play and reused for every later play.
+    """
+
+    __slots__ = ["start_step", "start_step_template", "start_running", "start_running_template", "speed",
+                 "speed_template", "static_tokens", "token_templates", "_show_configs"]
+
+    def __init__(self, settings: dict) -> None:
+        """Split settings into static values and templates."""
+        self.start_step, self.start_step_template = _split_template(settings['start_step'])
+        self.start_running, self.start_running_template = _split_template(settings['start_running'])
+        self.speed, self.speed_template = _split_template(settings['speed'])
+        self.static_tokens = {}     # type: Dict[str, object]
+        self.token_templates = {}   # type: Dict[str, object]
+        for name, template in settings['show_tokens'].items():
+            value, template = _split_template(template)
+            if template is None:
+                self.static_tokens[name] = value
+            else:
+                self.token_templates[name] = template
+        self._show_configs = {}     # type: Dict[Tuple[str, int], ShowConfig]
+
+    def get_start_step(self, placeholder_args):
+        """Return start_step."""
+        if self.start_step_template is None:
+            return self.start_step
+        return self.start_step_template.evaluate(placeholder_args)
+
+    def get_start_running(self, placeholder_args):
+        """Return start_running."""
+        if self.start_running_template is None:
+            return self.start_running
+        return self.start_running_template.evaluate(placeholder_args)
+
+    def get_show_config(self, show_controller, show, settings, placeholder_args) -> ShowConfig:
+        """Return the cached show config or create a new one if speed or show_tokens contain placeholders."""
+        if self.speed_template is None and not self.token_templates:
+            # priority may differ per play when the player is called with a priority offset
+            cache_key = (show, settings['priority'])
+            show_config = self._show_configs.get(cache_key)
+            if show_config is None:
+                show_config = self._create_show_config(show_controller, show, settings, self.speed,
+                                                       self.static_tokens)
+                self._show_configs[cache_key] = show_config
+            return show_config
+
+        speed = self.speed if self.speed_template is None else self.speed_template.evaluate(placeholder_args)
+        show_tokens = dict(self.static_tokens)
+        for name, template in self.token_templates.items():
+            show_tokens[name] = template.evaluate(placeholder_args)
+        return self._create_show_config(show_controller, show, settings, speed, show_tokens)
+
+    @staticmethod
+    def _create_show_config(show_controller, show, settings, speed, show_tokens) -> ShowConfig:
+        return show_controller.create_show_config(
+            show, settings['priority'], speed, settings['loops'], settings['sync_ms'],
+            settings['manual_advance'], show_tokens, settings['events_when_played'],
+            settings['events_when_stopped'], settings['events_when_looped'],
+            settings['events_when_paused'], settings['events_when_resumed'],
+            settings['events_when_advanced'], settings['events_when_stepped_back'],
+            settings['events_when_updated'], settings['events_when_completed'])
+
+
 class ShowPlayer(DeviceConfigPlayer):
 
     """Plays, starts, stops, pauses, resumes or advances shows based on config."""
@@ -68,13 +145,23 @@ class ShowPlayer(DeviceConfigPlayer):
         return devices
 
     def _expand_device_config(self, device_settings):
-        """Validate show_tokens."""
+        """Validate show_tokens and precompile the entry."""
         for key in RESERVED_KEYS:
             if key in device_settings["show_tokens"]:
                 self.raise_config_error("Key {} is not allowed in show_tokens of your show_player because it is also "
                                         "an option in show_player. Did you indent that option too far?".format(key), 1)
+        # this is called again after show tokens have been replaced in show steps
+        device_settings["_precompiled"] = ShowPlayerEntry(device_settings)
         return device_settings
 
+    @staticmethod
+    def _get_entry(show_settings) -> ShowPlayerEntry:
+        entry = show_settings.get("_precompiled")
+        if entry is None:
+            # settings which did not pass validation of the show_player
+            entry = ShowPlayerEntry(show_settings)
+        return entry
+
     def handle_subscription_change(self, value, settings, priority, context, key):
         """Handle subscriptions."""
         instance_dict = self._get_instance_dict(context)
@@ -99,18 +186,11 @@ class ShowPlayer(DeviceConfigPlayer):
                 raise AssertionError("block_queue can only be used with a queue event.")
             queue.wait()
             stop_callback = queue.clear
-        start_step = show_settings['start_step'].evaluate(placeholder_args)
-        start_running = show_settings['start_running'].evaluate(placeholder_args)
-        show_tokens = {k: v.evaluate(placeholder_args) for k, v in show_settings['show_tokens'].items()}
-        speed = show_settings['speed'].evaluate(placeholder_args)
-
-        show_config = self.machine.show_controller.create_show_config(
-            show, show_settings['priority'], speed, show_settings['loops'], show_settings['sync_ms'],
-            show_settings['manual_advance'], show_tokens, show_settings['events_when_played'],
-            show_settings['events_when_stopped'], show_settings['events_when_looped'],
-            show_settings['events_when_paused'], show_settings['events_when_resumed'],
-            show_settings['events_when_advanced'], show_settings['events_when_stepped_back'],
-            show_settings['events_when_updated'], show_settings['events_when_completed'])
+        entry = self._get_entry(show_settings)
+        show_config = entry.get_show_config(self.machine.show_controller, show, show_settings, placeholder_args)
+
+        start_step = entry.get_start_step(placeholder_args)
+        start_running = entry.get_start_running(placeholder_args)
 
         previous_show = instance_dict.get(key, None)
 
@@ -127,19 +207,10 @@ class ShowPlayer(DeviceConfigPlayer):
         if show_settings['block_queue']:
             raise AssertionError("Cannot use queue with block_queue.")
 
-        start_step = show_settings['start_step'].evaluate(placeholder_args)
-        show_tokens = {k: v.evaluate(placeholder_args) for k, v in show_settings['show_tokens'].items()}
-        speed = show_settings['speed'].evaluate(placeholder_args)
-
-        show_config = self.machine.show_controller.create_show_config(
-            show, show_settings['priority'], speed, show_settings['loops'], show_settings['sync_ms'],
-            show_settings['manual_advance'], show_tokens, show_settings['events_when_played'],
-            show_settings['events_when_stopped'], show_settings['events_when_looped'],
-            show_settings['events_when_paused'], show_settings['events_when_resumed'],
-            show_settings['events_when_advanced'], show_settings['events_when_stepped_back'],
-            show_settings['events_when_updated'], show_settings['events_when_completed'])
+        entry = self._get_entry(show_settings)
+        show_config = entry.get_show_config(self.machine.show_controller, show, show_settings, placeholder_args)
 
-        show_settings["show_queue"].enqueue_show(show_config, start_step)
+        show_settings["show_queue"].enqueue_show(show_config, entry.get_start_step(placeholder_args))
 
     @staticmethod
     def _stop(key, instance_dict, show, show_settings, queue, start_time, placeholder_args):
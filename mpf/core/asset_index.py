@@ -0,0 +1,174 @@
+"""Persistent index of asset and show folders."""
+import hashlib
+import logging
+import os
+import pickle   # nosec
+import tempfile
+import time
+
+from typing import Dict, Iterator, List, Optional, Tuple
+
+# folder path -> (mtime in ns, subfolder names, file names)
+IndexEntry = Tuple[int, Tuple[str, ...], Tuple[str, ...]]
+
+# folders modified less than this ago are scanned again next time because
+# filesystems such as FAT only store mtimes with a two second resolution
+RACY_MTIME_NS = 2 * 10 ** 9
+
+
+class AssetIndex:
+
+    """Cached directory listing of asset and show folders.
+
+    Every folder is stored with its mtime and its direct subfolders and files. Adding, removing or renaming an entry
+    changes the mtime of the containing folder. Therefore, a folder only has to be listed again when its mtime
+    changed. Unchanged folders cost a single stat call instead of a full directory scan.
+
+    A trusted index (used for production bundles) skips the mtime check completely and only scans folders which are
+    not part of the index.
+    """
+
+    __slots__ = ["log", "index_file", "_folders", "_dirty", "_store_cache", "_trusted"]
+
+    # pylint: disable-msg=too-many-arguments
+    def __init__(self, index_file: str, load_cache: bool = True, store_cache: bool = True,
+                 trusted: bool = False) -> None:
+        """Initialize asset index.
+
+        Args:
+        ----
+            index_file: Path of the file which persists the index.
+            load_cache: Load the index from index_file if it exists.
+            store_cache: Write the index back to index_file in save().
+            trusted: Do not check folder mtimes of indexed folders.
+        """
+        self.log = logging.getLogger("AssetIndex")
+        self.index_file = index_file
+        self._folders = {}  # type: Dict[str, IndexEntry]
+        self._dirty = False
+        self._store_cache = store_cache
+        self._trusted = trusted
+
+        if load_cache:
+            self._load()
+
+    @staticmethod
+    def get_cache_filename(machine_path: str) -> str:
+        """Return the index cache file for a machine folder."""
+        path_hash = hashlib.md5(bytes(os.path.abspath(machine_path), 'UTF-8')).hexdigest()     # nosec
+        return os.path.join(tempfile.gettempdir(), path_hash + ".mpf_asset_index")
+
+    def _load(self) -> None:
+        """Load index from disk."""
+        if not os.path.isfile(self.index_file):
+            return
+        try:
+            with open(self.index_file, 'rb') as f:
+                data = pickle.load(f)   # nosec
+        # unfortunately pickle can raise all kinds of exceptions and we dont want to crash on corrupted cache
+        # pylint: disable-msg=broad-except
+        except Exception:   # pragma: no cover
+            self.log.warning("Could not load asset index: %s", self.index_file)
+            return
+
+        if isinstance(data, dict):
+            self._folders = data
+
+    def save(self) -> None:
+        """Write index to disk if it changed."""
+        if not self._store_cache or not self._dirty:
+            return
+        try:
+            with open(self.index_file, 'wb') as f:
+                pickle.dump(self._folders, f, protocol=4)
+        except OSError:     # pragma: no cover
+            self.log.warning("Could not write asset index: %s", self.index_file)
+            return
+        self._dirty = False
+        self.log.debug("Asset index written: %s", self.index_file)
+
+    def rebase(self, old_path: str, new_path: str) -> None:
+        """Move all indexed folders below old_path to new_path.
+
+        This is used when a production bundle is built for a different machine path.
+        """
+        old_path = os.path.abspath(old_path)
+        folders = {}
+        for path, entry in self._folders.items():
+            if path == old_path or path.startswith(old_path + os.sep):
+                path = new_path + path[len(old_path):]
+            folders[path] = entry
+        self._folders = folders
+        self._dirty = True
+
+    def _forget(self, path: str) -> None:
+        """Remove a folder and all its subfolders from the index."""
+        entry = self._folders.pop(path, None)
+        if not entry:
+            return
+        self._dirty = True
+        for folder in entry[1]:
+            self._forget(os.path.join(path, folder))
+
+    def _scan(self, path: str, mtime: int) -> IndexEntry:
+        """List a folder and store it in the index."""
+        folders = []    # type: List[str]
+        files = []      # type: List[str]
+        with os.scandir(path) as it:
+            for dir_entry in it:
+                try:
+                    # follows symlinks like os.walk(followlinks=True)
+                    is_dir = dir_entry.is_dir()
+                except OSError:     # pragma: no cover
+                    is_dir = False
+                if is_dir:
+                    folders.append(dir_entry.name)
+                else:
+                    files.append(dir_entry.name)
+
+        old_entry = self._folders.get(path)
+        if old_entry:
+            for removed_folder in set(old_entry[1]) - set(folders):
+                self._forget(os.path.join(path, removed_folder))
+
+        if time.time_ns() - mtime < RACY_MTIME_NS:
+            # the folder might change again without changing its mtime
+            mtime = -1
+        entry = (mtime, tuple(folders), tuple(files))
+        self._folders[path] = entry
+        self._dirty = True
+        return entry
+
+    def _get_folder(self, path: str) -> Optional[IndexEntry]:
+        """Return index entry for a folder and revalidate it if needed."""
+        path = os.path.abspath(path)
+        entry = self._folders.get(path)
+        if entry and self._trusted:
+            return entry
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            self._forget(path)
+            return None
+        if entry and entry[0] == mtime:
+            return entry
+        try:
+            return self._scan(path, mtime)
+        except OSError:     # pragma: no cover
+            self._forget(path)
+            return None
+
+    def walk(self, root_path: str) -> Iterator[Tuple[str, Tuple[str, ...]]]:
+        """Yield (folder, files) for root_path and all its subfolders.
+
+        This is a drop-in for os.walk(root_path, followlinks=True) which only returns files. Folders are visited
+        top-down. Missing folders are silently skipped.
+        """
+        pending = [root_path]
+        while pending:
+            path = pending.pop()
+            entry = self._get_folder(path)
+            if not entry:
+                continue
+            yield path, entry[2]
+            pending.extend(os.path.join(path, folder) for folder in reversed(entry[1]))
@@ -13,6 +13,8 @@ from pathlib import PurePath
 from typing import Iterable, Optional, Set, Callable, Tuple, Union
 from typing import List
 
+from mpf.core.asset_index import AssetIndex
+from mpf.core.config_loader import ProductionConfigLoader
 from mpf.core.mode import Mode
 
 from mpf.core.machine import MachineController
@@ -35,7 +37,8 @@ class BaseAssetManager(MpfController, LogMixin):
     config_name = 'asset_manager'
 
     __slots__ = ["_asset_classes", "num_assets_to_load", "num_assets_loaded", "num_bcp_assets_to_load",
-                 "num_bcp_assets_loaded", "_next_id", "_last_asset_event_time", "initial_assets_loaded", "_start_time"]
+                 "num_bcp_assets_loaded", "_next_id", "_last_asset_event_time", "initial_assets_loaded", "_start_time",
+                 "_asset_index"]
 
     def __init__(self, machine: MachineController) -> None:
         """Initialize asset manager.
@@ -90,6 +93,30 @@ class BaseAssetManager(MpfController, LogMixin):
 
         self._start_time = time.time()
 
+        self._asset_index = None    # type: Optional[AssetIndex]
+
+    def _get_asset_index(self) -> AssetIndex:
+        """Return the index of asset folders.
+
+        Production bundles ship a prebuilt index of the machine folder which is trusted as is. Folders which are not
+        part of it (e.g. the built-in modes of MPF) are scanned. Otherwise, the index is cached in the temp dir and
+        revalidated using the mtimes of all folders.
+        """
+        if self._asset_index:
+            return self._asset_index
+
+        options = self.machine.options
+        if options.get('production', False):
+            self._asset_index = AssetIndex(
+                ProductionConfigLoader.get_asset_index_bundle_path(self.machine.machine_path),
+                load_cache=True, store_cache=False, trusted=True)
+        else:
+            self._asset_index = AssetIndex(
+                AssetIndex.get_cache_filename(self.machine.machine_path),
+                load_cache=not options.get('no_load_cache', False),
+                store_cache=options.get('create_config_cache', True))
+        return self._asset_index
+
     def get_next_id(self) -> int:
         """Return the next free id."""
         self._next_id += 1
@@ -208,6 +235,8 @@ class BaseAssetManager(MpfController, LogMixin):
             self._create_assets_from_disk(config=mode.config, mode=mode)
             self._create_asset_groups(config=mode.config, mode=mode)
 
+        self._get_asset_index().save()
+
         # load the assets marked for preload:
         preload_assets = list()
 
@@ -393,7 +422,7 @@ class BaseAssetManager(MpfController, LogMixin):
         ignore_files = ("desktop.ini", "Thumbs.db")
 
         # walk files in the asset root directory (include all subfolders)
-        for this_path, _, files in os.walk(root_path, followlinks=True):
+        for this_path, files in self._get_asset_index().walk(root_path):
             # Determine the first-level sub-folder of the current path relative to the
             # asset root path.  The first level sub-folder is used to determine the
             # default asset keys based on the assets config section.
@@ -312,6 +312,10 @@ class BcpInterface(MpfController):
             self._monitor_service_events(client)
         elif category == "status_request":
             self._monitor_status_request(client)
+        elif category == "profiler":
+            self._monitor_profiler(client)
+        elif category == "memory":
+            self._monitor_memory(client)
         else:
             self.machine.bcp.transport.send_to_client(client,
                                                       "error",
@@ -342,6 +346,10 @@ class BcpInterface(MpfController):
             self._monitor_service_events_stop(client)
         elif category == "status_request":
             self._monitor_status_request_stop(client)
+        elif category == "profiler":
+            self._monitor_profiler_stop(client)
+        elif category == "memory":
+            self._monitor_memory_stop(client)
         else:
             self.machine.bcp.transport.send_to_client(client,
                                                       "error",
@@ -356,6 +364,25 @@ class BcpInterface(MpfController):
         """Monitor all drivers."""
         self.machine.bcp.transport.remove_transport_from_handle("_monitor_drivers", client)
 
+    def _monitor_profiler(self, client):
+        """Send the startup report and profiler stats to client periodically."""
+        self.machine.bcp.transport.add_handler_to_transport("_profiler", client)
+        self.machine.profiler.send_stats_to_monitors()
+        self.machine.profiler.send_startup_report_to_monitors(client)
+
+    def _monitor_profiler_stop(self, client):
+        """Stop sending profiler stats to client."""
+        self.machine.bcp.transport.remove_transport_from_handle("_profiler", client)
+
+    def _monitor_memory(self, client):
+        """Send memory stats to client on every sample."""
+        self.machine.bcp.transport.add_handler_to_transport("_memory_monitor", client)
+        self.machine.memory_monitor.send_stats_to_monitors()
+
+    def _monitor_memory_stop(self, client):
+        """Stop sending memory stats to client."""
+        self.machine.bcp.transport.remove_transport_from_handle("_memory_monitor", client)
+
     def _monitor_events(self, client):
         """Monitor all events."""
         self.machine.bcp.transport.add_handler_to_transport("_monitor_events", client)
@@ -401,6 +428,8 @@ class BcpInterface(MpfController):
     def _monitor_devices_stop(self, client):
         """Remove client to no longer get notified of device changes."""
         self.machine.bcp.transport.remove_transport_from_handle("_devices", client)
+        if not self.machine.bcp.transport.get_transports_for_handler("_devices"):
+            self.machine.light_controller.stop_monitoring_lights()
 
     def notify_device_changes(self, device, attribute_name, old_value, new_value):
         """Notify all listeners about device change."""
@@ -0,0 +1,160 @@
+"""Bounded caches with hit, miss and eviction counters and a registry to list and clear them at runtime."""
+import time
+import weakref
+from collections import OrderedDict
+from functools import wraps
+from typing import Any, Callable, Dict, List, Optional
+
+_MISSING = object()
+_KWARGS_MARK = object()
+
+
+class BoundedCache:
+
+    """LRU cache with an optional size and TTL bound.
+
+    The least recently used entry is evicted when max_size is exceeded. With a ttl, entries expire ttl seconds after
+    they were put. All caches register themselves in the cache registry unless register is false.
+    """
+
+    __slots__ = ["name", "max_size", "ttl", "hits", "misses", "evictions", "_data", "_time", "__weakref__"]
+
+    def __init__(self, name: str, max_size: Optional[int] = 1024, ttl: Optional[float] = None,
+                 time_func: Callable[[], float] = time.monotonic, register: bool = True) -> None:
+        """Initialize empty cache."""
+        self.name = name
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._data = OrderedDict()      # type: OrderedDict[Any, Any]
+        self._time = time_func
+        if register:
+            cache_registry.register(self)
+
+    def __len__(self):
+        """Return number of entries."""
+        return len(self._data)
+
+    def __contains__(self, key):
+        """Return true if key is cached and did not expire. Does not count as hit or miss."""
+        entry = self._data.get(key, _MISSING)
+        return entry is not _MISSING and (entry[1] is None or entry[1] > self._time())
+
+    def get(self, key, default=None):
+        """Return the cached value or default."""
+        try:
+            value, expires = self._data[key]
+        except KeyError:
+            self.misses += 1
+            return default
+        if expires is not None and expires <= self._time():
+            del self._data[key]
+            self.evictions += 1
+            self.misses += 1
+            return default
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key, value) -> None:
+        """Add or replace an entry and evict the least recently used entry if the cache is full."""
+        self._data[key] = (value, self._time() + self.ttl if self.ttl else None)
+        self._data.move_to_end(key)
+        if self.max_size and len(self._data) > self.max_size:
+            self._data.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self) -> int:
+        """Remove all entries and return how many were removed."""
+        size = len(self._data)
+        self._data.clear()
+        return size
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return size, bounds and counters."""
+        requests = self.hits + self.misses
+        return {
+            "size": len(self._data),
+            "max_size": self.max_size,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / requests, 3) if requests else 0.0,
+        }
+
+
+class CacheRegistry:
+
+    """Weak registry of all bounded caches.
+
+    Caches with the same name (e.g. one per show) are listed together.
+    """
+
+    __slots__ = ["_caches"]
+
+    def __init__(self) -> None:
+        """Initialize empty registry."""
+        self._caches = weakref.WeakSet()
+
+    def register(self, cache: BoundedCache) -> None:
+        """Add a cache to the registry."""
+        self._caches.add(cache)
+
+    def get_caches(self, name: Optional[str] = None) -> List[BoundedCache]:
+        """Return all caches or all caches with a name."""
+        return [cache for cache in list(self._caches) if name is None or cache.name == name]
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Return stats per cache name. Sizes and counters of caches with the same name are summed up."""
+        stats = {}      # type: Dict[str, Dict[str, Any]]
+        for cache in self.get_caches():
+            cache_stats = cache.get_stats()
+            entry = stats.get(cache.name)
+            if entry is None:
+                stats[cache.name] = dict(cache_stats, caches=1)
+                continue
+            entry["caches"] += 1
+            for key in ("size", "hits", "misses", "evictions"):
+                entry[key] += cache_stats[key]
+            requests = entry["hits"] + entry["misses"]
+            entry["hit_rate"] = round(entry["hits"] / requests, 3) if requests else 0.0
+        return dict(sorted(stats.items()))
+
+    def clear(self, name: Optional[str] = None) -> int:
+        """Clear all caches or all caches with a name and return how many entries were removed."""
+        return sum(cache.clear() for cache in self.get_caches(name))
+
+
+cache_registry = CacheRegistry()
+
+
+def cached(name: str, max_size: Optional[int] = 1024, ttl: Optional[float] = None, typed: bool = False):
+    """Cache the results of a function in a bounded cache.
+
+    This replaces functools.lru_cache. Arguments have to be hashable. For methods the instance is part of the key.
+    The cache is available as cache attribute of the decorated function.
+    """
+    def _decorator(func):
+        cache = BoundedCache(name, max_size, ttl)
+
+        @wraps(func)
+        def _wrapper(*args, **kwargs):
+            key = args
+            if kwargs:
+                key += (_KWARGS_MARK,) + tuple(sorted(kwargs.items()))
+            if typed:
+                key += tuple(type(arg) for arg in args) + tuple(type(arg) for arg in kwargs.values())
+            value = cache.get(key, _MISSING)
+            if value is _MISSING:
+                value = func(*args, **kwargs)
+                cache.put(key, value)
+            return value
+
+        _wrapper.cache = cache
+        _wrapper.cache_clear = cache.clear
+        return _wrapper
+
+    return _decorator
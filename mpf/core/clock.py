@@ -1,8 +1,7 @@
 """MPF clock and main loop."""
 import asyncio
 import datetime
-from typing import Tuple
-from serial_asyncio import create_serial_connection
+from typing import Dict, List, Optional, Tuple
 from mpf.core.logging import LogMixin
 
 
@@ -42,11 +41,157 @@ class PeriodicTask:
         self._canceled = True
 
 
+# callbacks which would first tick within this many seconds of a group's next tick join that group
+TICK_PHASE_TOLERANCE = 0.001
+
+
+class TickHandle:
+
+    """A periodic callback in the TickService."""
+
+    __slots__ = ["_service", "callback", "interval", "align", "group"]
+
+    def __init__(self, service: "TickService", callback, interval: float, align: bool) -> None:
+        """Initialize tick handle."""
+        self._service = service
+        self.callback = callback
+        self.interval = interval
+        self.align = align
+        self.group = None     # type: Optional[TickGroup]
+
+    @property
+    def active(self) -> bool:
+        """Return true if the callback is currently ticking."""
+        return self.group is not None
+
+    def pause(self) -> None:
+        """Stop ticking until resume is called."""
+        self._service.leave_group(self)
+
+    def resume(self) -> None:
+        """(Re)start ticking. The first tick happens one interval from now (or on the next aligned tick)."""
+        self._service.leave_group(self)
+        self._service.join_group(self)
+
+    def set_interval(self, interval: float) -> None:
+        """Change the interval and restart ticking."""
+        self.interval = interval
+        self.resume()
+
+    def cancel(self) -> None:
+        """Stop ticking. Same as pause. Compatible to PeriodicTask."""
+        self.pause()
+
+
+class TickGroup:
+
+    """Callbacks with the same interval and phase which run from one loop callback."""
+
+    __slots__ = ["interval", "next_tick", "members", "_loop", "_handle"]
+
+    def __init__(self, interval: float, loop) -> None:
+        """Initialize tick group and schedule the first tick."""
+        self.interval = interval
+        self._loop = loop
+        self.next_tick = loop.time() + interval
+        self.members = {}       # type: Dict[TickHandle, None]
+        self._handle = loop.call_at(self.next_tick, self._run)
+
+    def _run(self):
+        self.next_tick += self.interval
+        # members may leave or rejoin while we run them
+        for member in list(self.members):
+            if member.group is self:
+                self._run_member(member)
+        if self.members:
+            self._handle = self._loop.call_at(self.next_tick, self._run)
+        else:
+            self._handle = None
+
+    def _run_member(self, member: TickHandle) -> None:
+        """Run one callback and pass exceptions to the loop so the other members keep ticking."""
+        try:
+            member.callback()
+        except (SystemExit, KeyboardInterrupt):
+            raise
+        except BaseException as exc:    # pylint: disable-msg=broad-except
+            self._loop.call_exception_handler({
+                'message': 'Exception in tick callback {!r}'.format(member.callback),
+                'exception': exc,
+            })
+
+    def cancel(self):
+        """Stop this group."""
+        if self._handle:
+            self._handle.cancel()
+            self._handle = None
+
+
+class TickService:
+
+    """Runs periodic callbacks with the same interval from one shared loop callback.
+
+    Callbacks which are added at the same time (e.g. timers started by the same event) tick in the same group.
+    Callbacks added with align=True join any group with the same interval and tick on its next tick. Pause, resume
+    and interval changes only move a callback between groups. A group schedules a loop callback only while it has
+    members.
+    """
+
+    __slots__ = ["_loop", "_groups"]
+
+    def __init__(self, loop) -> None:
+        """Initialize tick service."""
+        self._loop = loop
+        self._groups = {}       # type: Dict[float, List[TickGroup]]
+
+    def add(self, callback, interval: float, align: bool = False) -> TickHandle:
+        """Call callback every interval seconds and return a TickHandle to control it."""
+        if not callable(callback):
+            raise AssertionError('callback must be a callable, got {}'.format(callback))
+        if interval <= 0:
+            raise AssertionError('interval must be positive, got {}'.format(interval))
+        handle = TickHandle(self, callback, interval, align)
+        self.join_group(handle)
+        return handle
+
+    def join_group(self, handle: TickHandle) -> None:
+        """Add handle to a matching group or create a new one."""
+        groups = self._groups.setdefault(handle.interval, [])
+        first_tick = self._loop.time() + handle.interval
+        for group in groups:
+            # groups which tick one interval from now run in the same phase
+            if handle.align or abs(group.next_tick - first_tick) < TICK_PHASE_TOLERANCE:
+                break
+        else:
+            group = TickGroup(handle.interval, self._loop)
+            groups.append(group)
+        group.members[handle] = None
+        handle.group = group
+
+    def leave_group(self, handle: TickHandle) -> None:
+        """Remove handle from its group and stop the group if it is empty."""
+        group = handle.group
+        if not group:
+            return
+        handle.group = None
+        del group.members[handle]
+        if not group.members:
+            group.cancel()
+            groups = self._groups[group.interval]
+            groups.remove(group)
+            if not groups:
+                del self._groups[group.interval]
+
+    def get_group_count(self) -> int:
+        """Return the number of scheduled groups."""
+        return sum(len(groups) for groups in self._groups.values())
+
+
 class ClockBase(LogMixin):
 
     """A clock object with event support."""
 
-    __slots__ = ["machine", "loop"]
+    __slots__ = ["machine", "loop", "tick_service"]
 
     def __init__(self, machine=None, loop=None):
         """Initialize clock."""
@@ -69,6 +214,7 @@ class ClockBase(LogMixin):
             self.loop = loop                        # type: asyncio.AbstractEventLoop
 
         asyncio.set_event_loop(self.loop)
+        self.tick_service = TickService(self.loop)
 
     def _create_event_loop(self):
         try:
@@ -146,6 +292,10 @@ class ClockBase(LogMixin):
             # pylint: disable-msg=protected-access
             limit = asyncio.streams._DEFAULT_LIMIT      # type: ignore
 
+        # only import pyserial when a platform uses a serial port
+        # pylint: disable-msg=import-outside-toplevel
+        from serial_asyncio import create_serial_connection
+
         reader = asyncio.StreamReader(limit=limit, loop=self.loop)
         protocol = asyncio.StreamReaderProtocol(reader, loop=self.loop)
         transport, _ = await create_serial_connection(
@@ -8,6 +8,7 @@ import sys
 
 from pathlib import PurePath
 
+from mpf.core.asset_index import AssetIndex
 from mpf.core.config_processor import ConfigProcessor
 from mpf.core.config_spec_loader import ConfigSpecLoader
 
@@ -136,7 +137,7 @@ class YamlMultifileConfigLoader(ConfigLoader):
 
     """Loads MPF configs from machine folder with config and modes."""
 
-    __slots__ = ["configfile", "machine_path", "config_processor", "log", "mpf_path", "mc_path"]
+    __slots__ = ["configfile", "machine_path", "config_processor", "log", "mpf_path", "mc_path", "asset_index"]
 
     # pylint: disable-msg=too-many-arguments
     def __init__(self, machine_path, configfile, load_cache, store_cache):
@@ -144,6 +145,7 @@ class YamlMultifileConfigLoader(ConfigLoader):
         self.configfile = configfile
         self.machine_path = machine_path
         self.config_processor = ConfigProcessor(load_cache, store_cache)
+        self.asset_index = AssetIndex(AssetIndex.get_cache_filename(machine_path), load_cache, store_cache)
         self.log = logging.getLogger("YamlMultifileConfigLoader")
         try:
             # pylint: disable-msg=import-outside-toplevel
@@ -165,6 +167,7 @@ class YamlMultifileConfigLoader(ConfigLoader):
         config_spec = self._load_additional_config_spec(config_spec, machine_config)
         mode_config = self._load_modes(config_spec, machine_config)
         show_config = self._load_shows(config_spec, machine_config, mode_config)
+        self.asset_index.save()
         return MpfConfig(config_spec, machine_config, mode_config, show_config, self.machine_path, self.mpf_path)
 
     def load_mc_config(self) -> MpfMcConfig:
@@ -265,7 +268,7 @@ class YamlMultifileConfigLoader(ConfigLoader):
         # do not get fooled by windows or mac garbage
         ignore_files = ("desktop.ini", "Thumbs.db")
 
-        for this_path, _, files in os.walk(folder, followlinks=True):
+        for this_path, files in self.asset_index.walk(folder):
             relative_path = PurePath(this_path).relative_to(folder)
             for show_file_name in [f for f in files if f.endswith(".yaml") and not f.startswith(ignore_prefixes) and
                                    f != ignore_files]:
@@ -322,6 +325,11 @@ class ProductionConfigLoader(ConfigLoader):
         """Return the path for the MPF bundle."""
         return os.path.join(machine_path, "mpf_mc_config.bundle")
 
+    @staticmethod
+    def get_asset_index_bundle_path(machine_path):
+        """Return the path for the asset index bundle."""
+        return os.path.join(machine_path, "mpf_asset_index.bundle")
+
     def load_mpf_config(self) -> MpfConfig:
         """Load and return a MPF config."""
         with open(self.get_mpf_bundle_path(self.machine_path), "rb") as f:
@@ -3,7 +3,7 @@ import abc
 import asyncio
 import re
 from functools import partial
-from typing import List
+from typing import Any, Callable, List, Tuple
 
 from mpf.core.machine import MachineController
 from mpf.core.mode import Mode
@@ -15,6 +15,7 @@ MYPY = False
 if MYPY:   # pragma: no cover
     from mpf.core.placeholder_manager import BoolTemplate   # pylint: disable-msg=cyclic-import,unused-import
     from typing import Dict     # pylint: disable-msg=cyclic-import,unused-import
+    from mpf.core.events import PreparedHandler     # pylint: disable-msg=cyclic-import,unused-import
 
 
 class ConfigPlayer(LogMixin, metaclass=abc.ABCMeta):
@@ -25,7 +26,8 @@ class ConfigPlayer(LogMixin, metaclass=abc.ABCMeta):
     show_section = None                 # type: str
     machine_collection_name = None      # type: str
 
-    __slots__ = ["device_collection", "machine", "mode_event_keys", "instances", "_global_keys"]
+    __slots__ = ["device_collection", "machine", "mode_event_keys", "instances", "_global_keys",
+                 "_compiled_mode_events"]
 
     def __init__(self, machine):
         """Initialize config player."""
@@ -34,6 +36,7 @@ class ConfigPlayer(LogMixin, metaclass=abc.ABCMeta):
 
         self.machine = machine      # type: MachineController
         self._global_keys = ({}, {})
+        self._compiled_mode_events = {}     # type: Dict[Mode, Tuple[Tuple[PreparedHandler, ...], tuple]]
 
         # MPF only
         if hasattr(self.machine, "show_controller") and self.show_section:
@@ -279,11 +282,11 @@ class ConfigPlayer(LogMixin, metaclass=abc.ABCMeta):
         del key
         raise AssertionError("Subscriptions are not supported in this player ({}).".format(self.__class__))
 
-    def register_player_events(self, config, mode: Mode = None, priority=0):
-        """Register events for standalone player."""
-        # config is localized
-        key_list = list()
-        subscription_list = dict()      # type: Dict[BoolTemplate, asyncio.Future]
+    def _compile_player_events(self, config, mode: Mode = None) -> Tuple[Tuple["PreparedHandler", ...],
+                                                                          Tuple[Tuple[str, Any], ...]]:
+        """Validate player entries and return prepared handlers and subscriptions to register them."""
+        handlers = []       # type: List[Tuple[str, Callable, int, dict]]
+        subscriptions = []  # type: List[Tuple[str, Any]]
 
         if config:
             for event, settings in config.items():
@@ -293,8 +296,7 @@ class ConfigPlayer(LogMixin, metaclass=abc.ABCMeta):
                         self, event, settings, mode
                     ), 1, self.config_file_section)
                 if event.startswith("{") and event.endswith("}"):
-                    condition = event[1:-1]
-                    self._create_subscription(condition, subscription_list, settings, priority, mode)
+                    subscriptions.append((event[1:-1], settings))
                 else:
                     if mode and event in mode.config['mode']['start_events']:
                         self.machine.log.error(
@@ -311,14 +313,29 @@ class ConfigPlayer(LogMixin, metaclass=abc.ABCMeta):
                             "\"mode_{0}_started:\"".format(
                                 mode.name, self.config_file_section, event))
 
-                    key_list.append(
-                        self.machine.events.add_handler(
-                            event=event,
-                            handler=self.config_play_callback,
-                            calling_context=event,
-                            priority=priority,
-                            mode=mode,
-                            settings=settings))
+                    handlers.append((event, self.config_play_callback, 0,
+                                     dict(calling_context=event, mode=mode, settings=settings)))
+
+        return self.machine.events.prepare_handlers(handlers), tuple(subscriptions)
+
+    def register_player_events(self, config, mode: Mode = None, priority=0):
+        """Register events for standalone player."""
+        # config is localized
+        if mode:
+            # config of a mode never changes. only validate it on the first start
+            try:
+                handlers, subscriptions = self._compiled_mode_events[mode]
+            except KeyError:
+                handlers, subscriptions = self._compile_player_events(config, mode)
+                self._compiled_mode_events[mode] = handlers, subscriptions
+        else:
+            handlers, subscriptions = self._compile_player_events(config)
+
+        subscription_list = dict()      # type: Dict[BoolTemplate, asyncio.Future]
+        for condition, settings in subscriptions:
+            self._create_subscription(condition, subscription_list, settings, priority, mode)
+
+        key_list = self.machine.events.add_prepared_handlers(handlers, priority)
 
         return key_list, subscription_list
 
@@ -326,7 +343,7 @@ class ConfigPlayer(LogMixin, metaclass=abc.ABCMeta):
         """Remove event for standalone player."""
         for future in key_list[1].values():
             future.cancel()
-        self.machine.events.remove_handlers_by_keys(key_list[0])
+        self.machine.events.remove_handlers_bulk(key_list[0])
 
     def config_play_callback(self, settings, calling_context, priority=0, mode=None, **kwargs):
         """Handle play callback for standalone player."""
@@ -1,6 +1,4 @@
 """Parse config_spec."""
-from pkg_resources import iter_entry_points
-
 from mpf.core.utility_functions import Util
 from mpf.file_interfaces.yaml_interface import YamlInterface
 
@@ -37,7 +35,7 @@ class ConfigSpecLoader:
     @staticmethod
     def load_external_platform_config_specs(config):
         """Load config spec for external platforms."""
-        for platform_entry in iter_entry_points(group='mpf.platforms'):
+        for platform_entry in Util.get_entry_points('mpf.platforms'):
             config_spec = platform_entry.load().get_config_spec()
 
             if config_spec:
@@ -48,8 +46,15 @@ class ConfigSpecLoader:
 
     @staticmethod
     def load_device_config_specs(config_spec, machine_config):
-        """Load device config specs."""
-        for device_type in machine_config['mpf']['device_modules'].values():
+        """Load device config specs.
+
+        Devices which are part of MPF keep their spec in config_spec.yaml. Their modules are only imported here if the
+        machine config uses them (they will be imported to create the devices anyway). Other device modules are always
+        imported because they may add a spec which is used in modes.
+        """
+        for collection_name, device_type in machine_config['mpf']['device_modules'].items():
+            if device_type.startswith("mpf.devices.") and collection_name not in machine_config:
+                continue
             device_cls = Util.string_to_class(device_type)      # type: Device
             if device_cls.get_config_spec():
                 # add specific config spec if device has any
@@ -1,14 +1,13 @@
 """Config specs and validator."""
 import logging
-from functools import lru_cache
 
 import re
 from collections import namedtuple
 from copy import deepcopy
 
-from typing import Any
-from typing import Dict
+from typing import Any, Callable, Dict, Tuple
 
+from mpf.core.cache import cached
 from mpf.core.config_spec_loader import ConfigSpecLoader
 from mpf.core.rgb_color import NAMED_RGB_COLORS, RGBColor
 from mpf.exceptions.config_file_error import ConfigFileError
@@ -36,12 +35,32 @@ class RuntimeToken:
 
 ValidationPath = namedtuple("ValidationPath", ["parent", "item"])
 
+_ITEM_NOT_IN_CONFIG = 'item not in config!@#'
+_DEFAULT_REQUIRED = 'default required!@#'
+
+
+class CompiledSpec:
+
+    """Config spec of a section with prebuilt validators for all entries.
+
+    Entries are tuples of key, the spec path of a list of sub configs (or None) and the validator of the item.
+    """
+
+    __slots__ = ["spec", "allow_others", "entries"]
+
+    def __init__(self, spec, entries) -> None:
+        """Initialize compiled spec."""
+        self.spec = spec
+        self.allow_others = '__allow_others__' in spec
+        self.entries = entries
+
 
 class ConfigValidator:
 
     """Validates config against config specs."""
 
-    __slots__ = ["machine", "config_spec", "log", "validator_list"]
+    __slots__ = ["machine", "config_spec", "log", "validator_list", "_item_validators", "_validators",
+                 "_dict_validators"]
 
     def __init__(self, machine, config_spec):
         """Initialize validator."""
@@ -88,6 +107,11 @@ class ConfigValidator:
             "machine": self._validate_type_machine,
         }
 
+        # prebuilt validators by spec
+        self._item_validators = {}      # type: Dict[Any, Callable[[Any, ValidationPath], Any]]
+        self._validators = {}           # type: Dict[str, Callable[[Any, ValidationPath], Any]]
+        self._dict_validators = {}      # type: Dict[Tuple[str, str], Callable[[Any, ValidationPath], Any]]
+
     @staticmethod
     def _validate_type_or_token(func):
         def _validate_type_or_token_real(item, validation_failure_info, param=None):
@@ -113,7 +137,7 @@ class ConfigValidator:
         """Return config spec."""
         return self.config_spec
 
-    @lru_cache(1024)
+    @cached("config_specs", 1024)
     def build_spec(self, config_spec, base_spec):
         """Build config spec out of two or more specs."""
         # build up the actual config spec we're going to use
@@ -164,17 +188,34 @@ class ConfigValidator:
         return self._validate_config(config_spec, source, base_spec=base_spec, add_missing_keys=add_missing_keys,
                                      validation_failure_info=validation_failure_info)
 
-    # pylint: disable-msg=too-many-arguments,too-many-branches
+    @cached("compiled_specs", 1024)
+    def compile_spec(self, config_spec, base_spec) -> CompiledSpec:
+        """Build the spec of a section and prebuild the validators of all its entries."""
+        this_spec = self.build_spec(config_spec, base_spec)
+        entries = []
+        for k, spec in this_spec.items():
+            if spec == 'ignore' or k[0] == '_':
+                continue
+
+            if isinstance(spec, dict):
+                # This means we're looking for a list of dicts
+                entries.append((k, config_spec + ':' + k, None))
+            else:
+                entries.append((k, None, self._get_item_validator(spec)))
+
+        return CompiledSpec(this_spec, entries)
+
+    # pylint: disable-msg=too-many-arguments
     def _validate_config(self, config_spec, source, base_spec=None, add_missing_keys=True,
                          validation_failure_info=None) -> Dict[str, Any]:
         """Validate a config dict against spec."""
         # config_spec, str i.e. "device:shot"
         # source is dict
         # section_name is str used for logging failures
-        this_spec = self.build_spec(config_spec, base_spec)
+        compiled_spec = self.compile_spec(config_spec, base_spec)
 
-        if '__allow_others__' not in this_spec:
-            self.check_for_invalid_sections(this_spec, source, validation_failure_info)
+        if not compiled_spec.allow_others:
+            self.check_for_invalid_sections(compiled_spec.spec, source, validation_failure_info)
 
         processed_config = source
 
@@ -182,126 +223,165 @@ class ConfigValidator:
             raise self.validation_error(source, validation_failure_info,
                                         "Config attribute should be dict but is {}".format(source.__class__))
 
-        for k in list(this_spec.keys()):
-            if this_spec[k] == 'ignore' or k[0] == '_':
-                continue
-
+        for k, sub_spec, validator in compiled_spec.entries:
             if k in source:  # validate the entry that exists
-
-                if isinstance(this_spec[k], dict):
-                    # This means we're looking for a list of dicts
-
-                    final_list = list()
-                    if k in source:
-                        for i in source[k]:  # individual step
-                            final_list.append(self._validate_config(
-                                config_spec + ':' + k, source=i,
-                                validation_failure_info=ValidationPath(validation_failure_info, k)))
-
-                    processed_config[k] = final_list
-
+                if sub_spec:
+                    processed_config[k] = [
+                        self._validate_config(sub_spec, source=i,
+                                              validation_failure_info=ValidationPath(validation_failure_info, k))
+                        for i in source[k]]     # individual step
                 else:
-                    processed_config[k] = self.validate_config_item(
-                        this_spec[k], item=source[k],
-                        validation_failure_info=ValidationPath(validation_failure_info, k))
+                    processed_config[k] = validator(source[k], ValidationPath(validation_failure_info, k))
 
             elif add_missing_keys:  # create the default entry
-
-                if isinstance(this_spec[k], dict):
+                if sub_spec:
                     processed_config[k] = list()
-
                 else:
-                    processed_config[k] = self.validate_config_item(
-                        this_spec[k],
-                        validation_failure_info=ValidationPath(validation_failure_info, k))
+                    processed_config[k] = validator(_ITEM_NOT_IN_CONFIG, ValidationPath(validation_failure_info, k))
 
         return processed_config
 
     def validate_config_item(self, spec, validation_failure_info,
-                             item='item not in config!@#', ):
+                             item=_ITEM_NOT_IN_CONFIG, ):
         """Validate a config item."""
+        return self._get_item_validator(spec)(item, validation_failure_info)
+
+    def _get_item_validator(self, spec) -> Callable[[Any, ValidationPath], Any]:
+        """Return the prebuilt validator for an item spec."""
+        if not isinstance(spec, (list, tuple)):
+            return self._compile_item_validator(spec)
+        key = tuple(spec)
+        validator = self._item_validators.get(key)
+        if validator is None:
+            validator = self._item_validators[key] = self._compile_item_validator(spec)
+        return validator
+
+    def _compile_item_validator(self, spec) -> Callable[[Any, ValidationPath], Any]:
+        """Build a validator for an item spec such as single|int|0.
+
+        Errors in the spec are raised when the validator is called to report the path of the item.
+        """
         try:
             item_type, validation, default = spec
         except (ValueError, AttributeError):
-            raise ValueError('Error in validator spec: {}:{}'.format(validation_failure_info, spec))
+            def _invalid_spec(item, validation_failure_info):
+                del item
+                raise ValueError('Error in validator spec: {}:{}'.format(validation_failure_info, spec))
+            return _invalid_spec
 
         if default.lower() == 'none':
             default = None
         elif not default:
-            default = 'default required!@#'
+            default = _DEFAULT_REQUIRED
+
+        validate_type = self._compile_item_type_validator(spec, item_type, validation)
+
+        def _validate_config_item(item, validation_failure_info):
+            if item == _ITEM_NOT_IN_CONFIG:
+                if default == _DEFAULT_REQUIRED:
+                    section = self._build_error_path(validation_failure_info.parent)
+                    raise self.validation_error(
+                        "None", validation_failure_info,
+                        f'Required setting "{validation_failure_info.item}:" is missing '
+                        f'from section "{section}:" in your config.', 9)
+                item = default
+            return validate_type(item, validation_failure_info)
 
-        if item == 'item not in config!@#':
-            if default == 'default required!@#':
-                section = self._build_error_path(validation_failure_info.parent)
-                raise self.validation_error(
-                    "None", validation_failure_info,
-                    f'Required setting "{validation_failure_info.item}:" is missing '
-                    f'from section "{section}:" in your config.', 9)
-            item = default
+        return _validate_config_item
 
+    def _compile_item_type_validator(self, spec, item_type, validation) -> Callable[[Any, ValidationPath], Any]:
+        """Build the validator for the type part of an item spec."""
         if item_type == 'single':
-            return self.validate_item(item, validation, validation_failure_info)
+            return self._get_validator(validation)
 
         if item_type == 'list':
+            validate = self._get_validator(validation)
             if validation in ("event_posted", "event_handler"):
-                item_list = Util.string_to_list(item)
+                string_to_list = Util.string_to_list
             else:
-                item_list = Util.string_to_event_list(item)
+                string_to_list = Util.string_to_event_list
 
-            new_list = list()
+            def _validate_list(item, validation_failure_info):
+                new_list = list()
+                for i in string_to_list(item):
+                    if i in ("", " "):
+                        raise self.validation_error(item, validation_failure_info,
+                                                    "List contains an empty element.", 15)
+                    new_list.append(validate(i, validation_failure_info))
+                return new_list
 
-            for i in item_list:
-                if i in ("", " "):
-                    raise self.validation_error(item, validation_failure_info, "List contains an empty element.", 15)
-                new_list.append(self.validate_item(i, validation, validation_failure_info))
-
-            return new_list
+            return _validate_list
 
         if item_type == 'set':
-            item_set = set(Util.string_to_list(item))
+            validate = self._get_validator(validation)
 
-            new_set = set()
+            def _validate_set(item, validation_failure_info):
+                return {validate(i, validation_failure_info) for i in set(Util.string_to_list(item))}
 
-            for i in item_set:
-                new_set.add(self.validate_item(i, validation, validation_failure_info))
+            return _validate_set
 
-            return new_set
         if item_type == "event_handler":
             if validation != "event_handler:ms":
-                raise AssertionError("event_handler should use event_handler:ms in config_spec: {}".format(spec))
-            return self._validate_dict(item_type, validation, validation_failure_info, item)
+                def _invalid_event_handler(item, validation_failure_info):
+                    del item
+                    del validation_failure_info
+                    raise AssertionError("event_handler should use event_handler:ms in config_spec: {}".format(spec))
+                return _invalid_event_handler
+            return self._get_dict_validator(item_type, validation)
         if item_type == 'dict':
-            return self._validate_dict(item_type, validation, validation_failure_info, item)
+            return self._get_dict_validator(item_type, validation)
+
+        def _invalid_type(item, validation_failure_info):
+            del item
+            raise ConfigFileError("Invalid Type '{}' in config spec {}".format(
+                item_type, self._build_error_path(validation_failure_info)), 1, self.log.name)
 
-        raise ConfigFileError("Invalid Type '{}' in config spec {}".format(item_type,
-                              self._build_error_path(validation_failure_info)), 1, self.log.name)
+        return _invalid_type
 
     def _validate_dict(self, item_type, validation, validation_failure_info, item):
+        return self._get_dict_validator(item_type, validation)(item, validation_failure_info)
+
+    def _get_dict_validator(self, item_type, validation) -> Callable[[Any, ValidationPath], Any]:
+        """Return the prebuilt validator for a dict or event_handler with key and value validators."""
+        validator = self._dict_validators.get((item_type, validation))
+        if validator is None:
+            validator = self._dict_validators[(item_type, validation)] = \
+                self._compile_dict_validator(item_type, validation)
+        return validator
+
+    def _compile_dict_validator(self, item_type, validation) -> Callable[[Any, ValidationPath], Any]:
         if ':' not in validation:
-            raise self.validation_error(item, validation_failure_info, "Missing : in dict validator.")
+            def _missing_colon(item, validation_failure_info):
+                raise self.validation_error(item, validation_failure_info, "Missing : in dict validator.")
+            return _missing_colon
 
         validators = validation.split(':')
+        validate_key = self._get_validator(validators[0])
+        validate_value = self._get_validator(validators[1])
 
-        if item_type == "dict":
-            item_dict = dict()
-            if item == "None" or item is None:
-                item = {}
-            if not isinstance(item, dict):
-                raise self.validation_error(item, validation_failure_info, "Item is not a dict.", 12)
-        elif item_type == "event_handler":
-            # item could be str, list, or list of dicts
-            item_dict = dict()
-            try:
-                item = Util.event_config_to_dict(item)
-            except TypeError:
-                raise self.validation_error(item, validation_failure_info, "Could not convert item to dict", 8)
-        else:
+        if item_type not in ("dict", "event_handler"):
             raise AssertionError("Invalid type {}".format(item_type))
 
-        for k, v in item.items():
-            item_dict[self.validate_item(k, validators[0], validation_failure_info)] = (
-                self.validate_item(v, validators[1], ValidationPath(validation_failure_info, k)))
-        return item_dict
+        def _validate_dict(item, validation_failure_info):
+            if item_type == "dict":
+                if item == "None" or item is None:
+                    item = {}
+                if not isinstance(item, dict):
+                    raise self.validation_error(item, validation_failure_info, "Item is not a dict.", 12)
+            else:
+                # item could be str, list, or list of dicts
+                try:
+                    item = Util.event_config_to_dict(item)
+                except TypeError:
+                    raise self.validation_error(item, validation_failure_info, "Could not convert item to dict", 8)
+
+            item_dict = dict()
+            for k, v in item.items():
+                item_dict[validate_key(k, validation_failure_info)] = (
+                    validate_value(v, ValidationPath(validation_failure_info, k)))
+            return item_dict
+
+        return _validate_dict
 
     def check_for_invalid_sections(self, spec, config, validation_failure_info):
         """Check if all attributes are defined in spec."""
@@ -673,22 +753,57 @@ class ConfigValidator:
 
     def validate_item(self, item, validator, validation_failure_info):
         """Validate an item using a validator."""
-        try:
-            if item.lower() == 'none':
-                item = None
-        except AttributeError:
-            pass
+        return self._get_validator(validator)(item, validation_failure_info)
 
+    def _get_validator(self, validator) -> Callable[[Any, ValidationPath], Any]:
+        """Return the prebuilt validator for a validator string such as int or machine(switches)."""
+        validate = self._validators.get(validator)
+        if validate is None:
+            validate = self._validators[validator] = self._compile_validator(validator)
+        return validate
+
+    def _compile_validator(self, validator) -> Callable[[Any, ValidationPath], Any]:
+        """Resolve a validator string to its function and parameter once."""
         if '(' in validator and validator[-1:] == ')':
             validator_parts = validator.split('(', maxsplit=1)
-            validator = validator_parts[0]
             param = validator_parts[1][:-1]
-            return self.validator_list[validator](item, validation_failure_info=validation_failure_info, param=param)
+            func = self.validator_list.get(validator_parts[0])
+            if func is None:
+                def _unknown_validator(item, validation_failure_info):
+                    del item
+                    del validation_failure_info
+                    raise KeyError(validator_parts[0])
+                return _unknown_validator
+
+            def _validate_with_param(item, validation_failure_info):
+                try:
+                    if item.lower() == 'none':
+                        item = None
+                except AttributeError:
+                    pass
+                return func(item, validation_failure_info=validation_failure_info, param=param)
+
+            return _validate_with_param
+
         if validator in self.validator_list:
-            return self.validator_list[validator](item, validation_failure_info=validation_failure_info)
+            func = self.validator_list[validator]
+
+            def _validate(item, validation_failure_info):
+                try:
+                    if item.lower() == 'none':
+                        item = None
+                except AttributeError:
+                    pass
+                return func(item, validation_failure_info=validation_failure_info)
+
+            return _validate
+
+        def _invalid_validator(item, validation_failure_info):
+            del item
+            raise ConfigFileError("Invalid Validator '{}' in config spec {}".format(
+                                  validator, self._build_error_path(validation_failure_info)), 4, self.log.name)
 
-        raise ConfigFileError("Invalid Validator '{}' in config spec {}".format(
-                              validator, self._build_error_path(validation_failure_info)), 4, self.log.name)
+        return _invalid_validator
 
     def _build_error_path(self, validation_failure_info):
         if validation_failure_info is None:
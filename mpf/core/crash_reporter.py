@@ -2,6 +2,7 @@
 
 Based on https://github.com/lobocv/crashreporter/tree/master (also MIT licensed).
 """
+import importlib.util
 import inspect
 import logging
 import re
@@ -9,11 +10,6 @@ import traceback
 from datetime import datetime
 from pprint import pprint
 from types import FunctionType, MethodType, ModuleType, BuiltinMethodType, BuiltinFunctionType
-try:
-    import requests
-except ImportError:
-    requests = None
-
 from mpf.exceptions.base_error import BaseError
 from mpf._version import __version__
 
@@ -176,6 +172,8 @@ def analyze_traceback(tb, inspection_level=None, limit=None):
 
 
 def _send_crash_report(report, reporting_url):
+    # pylint: disable-msg=import-outside-toplevel
+    import requests
     r = requests.post(reporting_url, json=report)
     if r.status_code != 200:
         print("Failed to send report. Got response code {}. Error: {}", r.status_code, r.content)
@@ -185,7 +183,8 @@ def _send_crash_report(report, reporting_url):
 
 def report_crash(e: BaseException, location, config):
     """Report crash."""
-    if not requests:
+    # requests is slow to import and only needed when a crash is reported
+    if not importlib.util.find_spec("requests"):
         print("Please install the crash_reporter feature to use the MPF crash reporter.")
         return
 
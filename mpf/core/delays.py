@@ -1,15 +1,71 @@
 """Contains the DelayManager base classes."""
 
-import uuid
-from functools import partial
-from typing import Any, Callable, Dict, Tuple
+from typing import Any, Callable, Dict, List, Optional, Set, Union
 from mpf.core.mpf_controller import MpfController
 
 MYPY = False
 if MYPY:    # pragma: no cover
     from mpf.core.machine import MachineController  # pylint: disable-msg=cyclic-import,unused-import
 
-__api__ = ['DelayManager']
+__api__ = ['DelayManager', 'DelayHandle']
+
+
+class DelayHandle:
+
+    """Handle of a delay which can be cancelled or run early.
+
+    Handles are returned by DelayManager.schedule() and by DelayManager.add() for delays without a name. A handle is
+    inactive once its delay ran or was cancelled. Call release() when you no longer use a handle to let the delay
+    manager reuse it for the next delay.
+    """
+
+    __slots__ = ["manager", "name", "callback", "kwargs", "timer"]
+
+    def __init__(self, manager: "DelayManager") -> None:
+        """Initialize inactive delay handle."""
+        self.manager = manager
+        self.name = None        # type: Optional[str]
+        self.callback = None    # type: Optional[Callable[..., None]]
+        self.kwargs = None      # type: Optional[Dict[str, Any]]
+        self.timer = None       # type: Any
+
+    @property
+    def active(self) -> bool:
+        """Return true if the delay did not run and was not cancelled."""
+        return self.timer is not None
+
+    def cancel(self) -> None:
+        """Cancel the delay. Nothing happens if it is not active."""
+        if self.timer is not None:
+            self.manager.machine.clock.unschedule(self.timer)
+            self.timer = None
+            self.manager.forget(self)
+
+    def run_now(self) -> None:
+        """Run the callback now instead of when the delay ends. Nothing happens if it is not active."""
+        if self.timer is not None:
+            callback = self.callback
+            kwargs = self.kwargs
+            self.cancel()
+            callback(**kwargs)
+
+    def release(self) -> None:
+        """Cancel the delay and return the handle to the pool of the delay manager.
+
+        The handle must not be used afterwards.
+        """
+        self.cancel()
+        self.manager.release(self)
+
+    def __call__(self):
+        """Run callback when the delay ends."""
+        self.timer = None
+        self.manager.forget(self)
+        self.manager.process_delay_callback(self)
+
+    def __repr__(self):
+        """Return string representation."""
+        return "<DelayHandle {} ({})>".format(self.name, self.callback)
 
 
 class DelayManager(MpfController):
@@ -25,17 +81,42 @@ class DelayManager(MpfController):
 
     """
 
-    __slots__ = ["delays", "registry"]
+    __slots__ = ["delays", "registry", "_handles", "_pool"]
 
     config_name = "delay_manager"
 
+    pool_size = 32
+    """Maximum number of released handles which are kept for reuse."""
+
     def __init__(self, machine: "MachineController") -> None:
         """Initialize delay manager."""
-        self.delays = {}        # type: Dict[str, Tuple[Any, Callable]]
+        self.delays = {}        # type: Dict[str, DelayHandle]
+        self._handles = set()   # type: Set[DelayHandle]
+        self._pool = []         # type: List[DelayHandle]
         super().__init__(machine)
 
+    def schedule(self, ms: int, callback: Callable[..., None], **kwargs) -> DelayHandle:
+        """Add a delay without a name and return its handle.
+
+        Args:
+        ----
+            ms: The number of milliseconds you want this delay to be for.
+            callback: The method that is called when this delay ends.
+            **kwargs: Any other (optional) kwarg pairs you pass will be
+                passed along as kwargs to the callback method.
+
+        Returns a DelayHandle which you can use to cancel the delay or to run
+        it early.
+        """
+        handle = self._pool.pop() if self._pool else DelayHandle(self)
+        handle.callback = callback
+        handle.kwargs = kwargs
+        handle.timer = self.machine.clock.schedule_once(handle, ms / 1000.0)
+        self._handles.add(handle)
+        return handle
+
     def add(self, ms: int, callback: Callable[..., None], name: str = None,
-            **kwargs) -> str:
+            **kwargs) -> Union[str, DelayHandle]:
         """Add a delay.
 
         Args:
@@ -44,33 +125,39 @@ class DelayManager(MpfController):
             callback: The method that is called when this delay ends.
             name: String name of this delay. This name is arbitrary and only
                 used to identify the delay later if you want to remove or
-                change it. If you don't provide it, a UUID4 name will be
-                created.
+                change it. If you don't provide it, the delay is anonymous.
             **kwargs: Any other (optional) kwarg pairs you pass will be
                 passed along as kwargs to the callback method.
 
-        Returns string name or UUID4 of the delay which you can use to remove it
-        later.
+        Returns the name of the delay which you can use to remove it later.
+        For anonymous delays a DelayHandle is returned which can be used
+        instead of the name.
         """
         if not name:
-            name = str(uuid.uuid4())
+            return self.schedule(ms, callback, **kwargs)
+
         self.debug_log("Adding delay. Name: '%s' ms: %s, callback: %s, "
                        "kwargs: %s", name, ms, callback, kwargs)
 
-        try:
-            delay = self.delays.pop(name)
-        except KeyError:
-            pass
-        else:
-            self.machine.clock.unschedule(delay[0])
+        handle = self.delays.pop(name, None)
+        if handle:
+            handle.cancel()
 
-        self.delays[name] = (self.machine.clock.schedule_once(
-            partial(self._process_delay_callback, name, callback, **kwargs),
-            ms / 1000.0), callback)
+        handle = DelayHandle(self)
+        handle.name = name
+        handle.callback = callback
+        handle.kwargs = kwargs
+        handle.timer = self.machine.clock.schedule_once(handle, ms / 1000.0)
+        self.delays[name] = handle
 
         return name
 
-    def remove(self, name: str):
+    def _get_handle(self, name: Union[str, DelayHandle]) -> Optional[DelayHandle]:
+        if isinstance(name, DelayHandle):
+            return name if name.active and name.manager is self else None
+        return self.delays.get(name)
+
+    def remove(self, name: Union[str, DelayHandle]):
         """Remove a delay by name.
 
         Removing a delay prevents the callback from being called and cancels
@@ -78,16 +165,13 @@ class DelayManager(MpfController):
 
         Args:
         ----
-            name: String name of the delay you want to remove. If there is no
-                delay with this name, that's ok. Nothing happens.
+            name: String name or handle of the delay you want to remove. If
+                there is no delay with this name, that's ok. Nothing happens.
         """
         self.debug_log("Removing delay: '%s'", name)
-        try:
-            delay = self.delays.pop(name)
-        except KeyError:
-            pass
-        else:
-            self.machine.clock.unschedule(delay[0])
+        handle = self._get_handle(name)
+        if handle:
+            handle.cancel()
 
     def add_if_doesnt_exist(self, ms: int, callback: Callable[..., None],
                             name: str, **kwargs) -> str:
@@ -111,16 +195,16 @@ class DelayManager(MpfController):
 
         return name
 
-    def check(self, delay: str) -> bool:
+    def check(self, delay: Union[str, DelayHandle]) -> bool:
         """Check to see if a delay exists.
 
         Args:
         ----
-            delay: A string of the delay you're checking for.
+            delay: A string or handle of the delay you're checking for.
 
         Returns true if the delay exists. False otherwise.
         """
-        return delay in self.delays
+        return self._get_handle(delay) is not None
 
     def reset(self, ms: int, callback: Callable[..., None], name: str,
               **kwargs) -> str:
@@ -137,13 +221,11 @@ class DelayManager(MpfController):
             callback: The method that is called when this delay ends.
             name: String name of this delay. This name is arbitrary and only
                 used to identify the delay later if you want to remove or
-                change it. If you don't provide it, a UUID4 name will be
-                created.
+                change it.
             **kwargs: Any other (optional) kwarg pairs you pass will be
                 passed along as kwargs to the callback method.
 
-        Returns string name or UUID4 of the delay which you can use to remove it
-        later.
+        Returns string name of the delay which you can use to remove it later.
         """
         if name in self.delays:
             self.remove(name)
@@ -152,39 +234,48 @@ class DelayManager(MpfController):
 
     def clear(self) -> None:
         """Remove (clear) all the delays associated with this DelayManager."""
-        for name in list(self.delays.keys()):
-            self.machine.clock.unschedule(self.delays[name][0])
-            self.remove(name)
+        for handle in list(self.delays.values()) + list(self._handles):
+            handle.cancel()
 
         self.delays = {}
+        self._handles = set()
 
-    def run_now(self, name: str):
+    def run_now(self, name: Union[str, DelayHandle]):
         """Run a delay callback now instead of waiting until its time comes.
 
         This will cancel the future running of the delay callback.
 
         Args:
         ----
-            name: Name of the delay to run. If this name is not an active
-                delay, that's fine. Nothing happens.
+            name: Name or handle of the delay to run. If this name is not an
+                active delay, that's fine. Nothing happens.
         """
-        if name in self.delays:
-            try:
-                # have to save the callback ref first, since if the callback
-                # schedules a new delay with the same name, then the removal
-                # will remove it
-                cb = self.delays[name][1]
-                self.remove(name)
-                cb()
-            except KeyError:
-                pass
-
-    def _process_delay_callback(self, name: str, callback: Callable[..., None], **kwargs):
-        # Process the delay callback and run the event queue afterwards
-        self.debug_log("---Processing delay: %s", name)
-        try:
-            del self.delays[name]
-        except KeyError:
-            pass
-        callback(**kwargs)
+        handle = self._get_handle(name)
+        if handle:
+            handle.run_now()
+
+    def forget(self, handle: DelayHandle) -> None:
+        """Remove a handle which is no longer active."""
+        if handle.name is None:
+            self._handles.discard(handle)
+        elif self.delays.get(handle.name) is handle:
+            del self.delays[handle.name]
+
+    def release(self, handle: DelayHandle) -> None:
+        """Keep an inactive anonymous handle for reuse. Handles which were already released are ignored."""
+        if handle.name is None and handle.callback is not None and len(self._pool) < self.pool_size:
+            handle.callback = None
+            handle.kwargs = None
+            self._pool.append(handle)
+
+    def process_delay_callback(self, handle: DelayHandle):
+        """Run the callback of a delay which ended and run the event queue afterwards."""
+        self.debug_log("---Processing delay: %s", handle)
+        callback = handle.callback
+        kwargs = handle.kwargs
+        profiler = self.machine.events.profiler
+        if profiler and profiler.should_sample():
+            profiler.time_call("delay", profiler.callback_name(callback), callback, kwargs)
+        else:
+            callback(**kwargs)
         self.machine.events.process_event_queue()
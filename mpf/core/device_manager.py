@@ -80,16 +80,20 @@ class DeviceManager(MpfController):
 
             # create the devices
             if config:
-                self.create_devices(collection_name, config)
+                with self.machine.startup_profiler.measure("create_devices", collection_name):
+                    self.create_devices(collection_name, config)
 
         self.machine.mode_controller.create_mode_devices()
 
         # step 2: load config and validate devices
-        self.load_devices_config(validate=True)
-        await self.machine.mode_controller.load_mode_devices()
+        with self.machine.startup_profiler.measure("device_manager", "load_devices_config"):
+            self.load_devices_config(validate=True)
+        with self.machine.startup_profiler.measure("device_manager", "load_mode_devices"):
+            await self.machine.mode_controller.load_mode_devices()
 
         # step 3: initialize devices (mode devices will be initialized when mode is started)
-        await self.initialize_devices()
+        with self.machine.startup_profiler.measure("device_manager", "initialize_devices"):
+            await self.initialize_devices()
 
     def stop_devices(self):
         """Stop all devices in the machine."""
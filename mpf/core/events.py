@@ -1,14 +1,15 @@
 """Classes for the EventManager and QueuedEvents."""
 import inspect
+from time import perf_counter
 from collections import deque, namedtuple, defaultdict
-import uuid
 
 import asyncio
-from functools import partial, lru_cache
+from functools import partial
 from unittest.mock import MagicMock
 
-from typing import Dict, Any, Tuple, Optional, Callable, List
+from typing import Dict, Any, Tuple, Optional, Callable, List, Iterable, Set
 
+from mpf.core.cache import cached
 from mpf.core.mpf_controller import MpfController
 
 MYPY = False
@@ -16,11 +17,15 @@ if MYPY:   # pragma: no cover
     from mpf.core.machine import MachineController      # pylint: disable-msg=cyclic-import,unused-import
     from mpf.core.placeholder_manager import BaseTemplate   # pylint: disable-msg=cyclic-import,unused-import
     from typing import Deque    # pylint: disable-msg=cyclic-import,unused-import
+    from mpf.core.profiler import Profiler  # pylint: disable-msg=cyclic-import,unused-import
+    from mpf.core.startup_profiler import StartupProfiler   # pylint: disable-msg=cyclic-import,unused-import
 
 EventHandlerKey = namedtuple("EventHandlerKey", ["key", "event"])
 RegisteredHandler = namedtuple("RegisteredHandler", ["callback", "priority", "kwargs", "key", "condition",
                                                      "blocking_facility"])
 PostedEvent = namedtuple("PostedEvent", ["event", "type", "callback", "kwargs"])
+PreparedHandler = namedtuple("PreparedHandler", ["event", "callback", "priority", "kwargs", "condition",
+                                                 "blocking_facility"])
 
 
 class EventHandlerException(Exception):
@@ -34,7 +39,9 @@ class EventManager(MpfController):
 
     config_name = "event_manager"
 
-    __slots__ = ["registered_handlers", "event_queue", "callback_queue", "monitor_events", "_queue_tasks", "_stopped"]
+    __slots__ = ["registered_handlers", "event_queue", "callback_queue", "monitor_events", "_queue_tasks", "_stopped",
+                 "profiler", "startup_profiler", "_next_handler_key", "_handlers_by_key", "_keys_by_callback",
+                 "drained_callbacks"]
 
     def __init__(self, machine: "MachineController") -> None:
         """Initialize EventManager."""
@@ -43,9 +50,19 @@ class EventManager(MpfController):
         self.registered_handlers = defaultdict(list)    # type: Dict[str, List[RegisteredHandler]]
         self.event_queue = deque([])        # type: Deque[PostedEvent]
         self.callback_queue = deque([])     # type: Deque[Tuple[Any, dict]]
+        # called once when the event and callback queues are empty
+        self.drained_callbacks = []         # type: List[Callable[[], None]]
         self.monitor_events = False
         self._queue_tasks = []              # type: List[asyncio.Task]
         self._stopped = False
+        self.profiler = None                # type: Optional[Profiler]
+        # set by the machine while init phases run to time every init handler
+        self.startup_profiler = None        # type: Optional[StartupProfiler]
+
+        # handler keys are increasing integers. every handler is indexed by its key and by its callback
+        self._next_handler_key = 0
+        self._handlers_by_key = {}          # type: Dict[int, Tuple[EventHandlerKey, RegisteredHandler]]
+        self._keys_by_callback = {}         # type: Dict[Any, Set[int]]
 
         self.add_handler("debug_dump_stats", self._debug_dump_events)
 
@@ -66,7 +83,7 @@ class EventManager(MpfController):
 
         self.log.info("--- DEBUG DUMP EVENTS END ---")
 
-    @lru_cache()
+    @cached("event_strings", 1024)
     def get_event_and_condition_from_string(self, event_string: str) -> Tuple[str, Optional["BaseTemplate"], int]:
         """Parse an event string to divide the event name from a possible placeholder / conditional in braces.
 
@@ -211,55 +228,158 @@ class EventManager(MpfController):
                     print("My custom mode code is starting")
                     my_handler = self.machine.events.add_handler('toggle_light', self.my_event_handler)
 
+        """
+        key, registered_handler = self._register_prepared_handler(
+            self._prepare_handler(event, handler, priority, blocking_facility, kwargs), 0)
+        handlers = self.registered_handlers[key.event]
+
+        # Insert the handler after all handlers with the same or a higher priority. This keeps the list sorted so we
+        # don't have to do that with each event post.
+        low = 0
+        high = len(handlers)
+        while low < high:
+            middle = (low + high) // 2
+            if handlers[middle].priority < registered_handler.priority:
+                high = middle
+            else:
+                low = middle + 1
+        handlers.insert(low, registered_handler)
+
+        if self._info:
+            self._verify_handlers(key.event, handlers)
+
+        return key
+
+    def add_handlers_bulk(self, handlers: Iterable[Tuple[str, Any, int, dict]]) -> List[EventHandlerKey]:
+        """Register many event handlers at once.
+
+        Every entry is a tuple of (event, handler, priority, kwargs) and behaves like
+        ``add_handler(event, handler, priority, **kwargs)``. The handler list of every event is only sorted and
+        verified once. Use this when registering a lot of handlers at once (e.g. on mode start).
+
+        Returns a list with one EventHandlerKey per entry which can be passed to ``remove_handlers_bulk``.
+        """
+        return self.add_prepared_handlers(self.prepare_handlers(handlers))
+
+    def prepare_handlers(self, handlers: Iterable[Tuple[str, Any, int, dict]]) -> Tuple[PreparedHandler, ...]:
+        """Validate handlers and parse their event strings without registering them.
+
+        Entries use the same format as in ``add_handlers_bulk``. The result can be registered (multiple times) via
+        ``add_prepared_handlers`` which skips all validation and parsing.
+        """
+        prepared_handlers = []
+        validated_handlers = set()
+        for event, handler, priority, kwargs in handlers:
+            kwargs = dict(kwargs)
+            blocking_facility = kwargs.pop("blocking_facility", None)
+            try:
+                validate_signature = handler not in validated_handlers
+                validated_handlers.add(handler)
+            except TypeError:
+                validate_signature = True
+            prepared_handlers.append(self._prepare_handler(event, handler, priority, blocking_facility, kwargs,
+                                                           validate_signature))
+        return tuple(prepared_handlers)
+
+    def add_prepared_handlers(self, prepared_handlers: Iterable[PreparedHandler],
+                              priority: int = 0) -> List[EventHandlerKey]:
+        """Register handlers returned by ``prepare_handlers``.
+
+        Args:
+        ----
+            prepared_handlers: Handlers from ``prepare_handlers``.
+            priority: Added to the priority of all handlers.
+
+        Returns a list with one EventHandlerKey per entry which can be passed to ``remove_handlers_bulk``.
+        """
+        keys = []               # type: List[EventHandlerKey]
+        changed_events = set()  # type: Set[str]
+        for prepared_handler in prepared_handlers:
+            key, registered_handler = self._register_prepared_handler(prepared_handler, priority)
+            self.registered_handlers[key.event].append(registered_handler)
+            changed_events.add(key.event)
+            keys.append(key)
+
+        for event in changed_events:
+            # sort is stable so handlers with the same priority stay in the order they were added
+            self.registered_handlers[event].sort(key=lambda x: x.priority, reverse=True)
+            if self._info:
+                self._verify_handlers(event, self.registered_handlers[event])
+
+        return keys
+
+    def _validate_event(self, event: str, handler: Any) -> None:
+        """Check that an event is not the name of a switch."""
+        if hasattr(self.machine, "switches") and event in self.machine.switches:
+            self.raise_config_error('Switch name "{name}" name used as event handler for {handler}. '
+                                    'Did you mean "{name}_active"?'.format(name=event, handler=handler), 1)
+
+    @staticmethod
+    def _validate_handler(event: str, handler: Any) -> None:
+        """Check that a handler can be called for an event."""
+        if not callable(handler):
+            raise AssertionError('Cannot add handler "{}" for event "{}". Did you '
+                                 'accidentally add parenthesis to the end of the '
+                                 'handler you passed?'.format(handler, event))
+
+        sig = inspect.signature(handler)
+        if 'kwargs' not in sig.parameters:
+            raise AssertionError("Handler {} for event '{}' is missing **kwargs. Actual signature: {}".format(
+                handler, event, sig))
+
+        if sig.parameters['kwargs'].kind != inspect.Parameter.VAR_KEYWORD:
+            raise AssertionError("Handler {} for event '{}' param kwargs is missing '**'. "
+                                 "Actual signature: {}".format(handler, event, sig))
+
+    # pylint: disable-msg=too-many-arguments
+    def _prepare_handler(self, event: str, handler: Any, priority: int, blocking_facility: Any,
+                         kwargs: dict, validate_signature: bool = True) -> PreparedHandler:
+        """Validate a handler and parse its event string.
+
+        The signature of the handler is only checked if validate_signature is set. The event is always checked.
         """
         if event is None:
             raise AssertionError("Cannot pass event None.")
         if not self.machine.options['production']:
-            if hasattr(self.machine, "switches") and event in self.machine.switches:
-                self.raise_config_error('Switch name "{name}" name used as event handler for {handler}. '
-                                        'Did you mean "{name}_active"?'.format(name=event, handler=handler), 1)
-            if not callable(handler):
-                raise AssertionError('Cannot add handler "{}" for event "{}". Did you '
-                                     'accidentally add parenthesis to the end of the '
-                                     'handler you passed?'.format(handler, event))
-
-            sig = inspect.signature(handler)
-            if 'kwargs' not in sig.parameters:
-                raise AssertionError("Handler {} for event '{}' is missing **kwargs. Actual signature: {}".format(
-                    handler, event, sig))
-
-            if sig.parameters['kwargs'].kind != inspect.Parameter.VAR_KEYWORD:
-                raise AssertionError("Handler {} for event '{}' param kwargs is missing '**'. "
-                                     "Actual signature: {}".format(handler, event, sig))
+            self._validate_event(event, handler)
+            if validate_signature:
+                self._validate_handler(event, handler)
 
         event, condition, additional_priority = self.get_event_and_condition_from_string(event)
         priority += additional_priority
 
-        key = uuid.uuid4()
-
-        # An event 'handler' in our case is a tuple with 4 elements:
-        # the handler method, priority, dict of kwargs, & uuid key
         if hasattr(handler, "relative_priority") and not isinstance(handler, MagicMock):
             priority += handler.relative_priority
 
-        self.registered_handlers[event].append(RegisteredHandler(handler, priority, kwargs, key, condition,
-                                                                 blocking_facility))
+        return PreparedHandler(event, handler, priority, kwargs, condition, blocking_facility)
+
+    def _register_prepared_handler(self, prepared_handler: PreparedHandler,
+                                   priority: int) -> Tuple[EventHandlerKey, RegisteredHandler]:
+        """Create a handler entry and add it to the key and callback index.
+
+        The caller has to add the entry to the handler list of its event.
+        """
+        event, handler, handler_priority, kwargs, condition, blocking_facility = prepared_handler
+        self._next_handler_key += 1
+        key = EventHandlerKey(self._next_handler_key, event)
+
+        # An event 'handler' in our case is a tuple with the handler method, priority, dict of kwargs, key,
+        # condition and blocking facility
+        registered_handler = RegisteredHandler(handler, handler_priority + priority, kwargs, key.key, condition,
+                                               blocking_facility)
+        self._handlers_by_key[key.key] = (key, registered_handler)
+        try:
+            self._keys_by_callback.setdefault(handler, set()).add(key.key)
+        except TypeError:
+            # unhashable handlers are only found by key or by scanning in remove_handler
+            pass
 
         if self._debug:
             self.debug_log("Registered %s as a handler for '%s', priority: %s, "
                            "kwargs: %s",
-                           self._pretty_format_handler(handler), event, priority, kwargs)
-
-        # Sort the handlers for this event based on priority. We do it now
-        # so the list is pre-sorted so we don't have to do that with each
-        # event post.
-        if len(self.registered_handlers[event]) > 1:
-            self.registered_handlers[event].sort(key=lambda x: x.priority, reverse=True)
-
-        if self._info:
-            self._verify_handlers(event, self.registered_handlers[event])
+                           self._pretty_format_handler(handler), event, registered_handler.priority, kwargs)
 
-        return EventHandlerKey(key, event)
+        return key, registered_handler
 
     def _get_handler_signature(self, handler):
         """Perform black magic to calculate a signature for a handler."""
@@ -326,17 +446,8 @@ class EventManager(MpfController):
         # If we don't have kwargs, then we'll look for just the handler meth.
         # If we have kwargs, we'll look for that combination. If it finds it,
         # remove it.
-        if event in self.registered_handlers:
-            if kwargs:
-                # slice the full list [:] to make a copy so we can delete from the
-                # original while iterating
-                for rh in self.registered_handlers[event][:]:
-                    if rh[0] == handler and rh[2] == kwargs:
-                        self.registered_handlers[event].remove(rh)
-            else:
-                for rh in self.registered_handlers[event][:]:
-                    if rh[0] == handler:
-                        self.registered_handlers[event].remove(rh)
+        self.remove_handlers_bulk([key for key in self._get_keys_for_callback(handler) if key.event == event and (
+            not kwargs or self._handlers_by_key[key.key][1].kwargs == kwargs)])
 
         return self.add_handler(event, handler, priority, **kwargs)
 
@@ -346,7 +457,8 @@ class EventManager(MpfController):
         Use carefully. This is currently used to remove handlers for all init events which only occur once.
         """
         if event in self.registered_handlers:
-            del self.registered_handlers[event]
+            for registered_handler in self.registered_handlers.pop(event):
+                self._remove_from_index(registered_handler.key)
 
     @staticmethod
     def _pretty_format_handler(handler):
@@ -358,6 +470,27 @@ class EventManager(MpfController):
         """Pretty log removed handler."""
         self.debug_log("Removing method %s from event %s", self._pretty_format_handler(handler), event)
 
+    def _get_keys_for_callback(self, method: Any) -> List[EventHandlerKey]:
+        """Return the keys of all registered handlers which call method."""
+        try:
+            keys = self._keys_by_callback.get(method, ())
+        except TypeError:
+            return [key for key, handler in self._handlers_by_key.values() if handler.callback == method]
+        return [self._handlers_by_key[key][0] for key in keys]
+
+    def _remove_from_index(self, key: int) -> Any:
+        """Remove a handler from the key and callback index and return its callback."""
+        callback = self._handlers_by_key.pop(key)[1].callback
+        try:
+            keys = self._keys_by_callback.get(callback)
+        except TypeError:
+            return callback
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_callback[callback]
+        return callback
+
     def remove_handler(self, method: Any) -> None:
         """Remove an event handler from all events a method is registered to handle.
 
@@ -365,17 +498,7 @@ class EventManager(MpfController):
         ----
             method : The method whose handlers you want to remove.
         """
-        events_to_delete_if_empty = []
-        for event, handler_list in self.registered_handlers.items():
-            for handler_tup in handler_list[:]:  # copy via slice
-                if handler_tup[0] == method:
-                    handler_list.remove(handler_tup)
-                    if self._debug:
-                        self._pretty_log_removed_handler(method, event)
-                    events_to_delete_if_empty.append(event)
-
-        for event in events_to_delete_if_empty:
-            self._remove_event_if_empty(event)
+        self.remove_handlers_bulk(self._get_keys_for_callback(method))
 
     def remove_handler_by_event(self, event: str, handler: Any) -> None:
         """Remove the handler you pass from the event you pass.
@@ -390,17 +513,7 @@ class EventManager(MpfController):
         handler / event combination, regardless of whether the keyword
         arguments match or not.
         """
-        events_to_delete_if_empty = []
-        if event in self.registered_handlers:
-            for handler_tup in self.registered_handlers[event][:]:
-                if handler_tup[0] == handler:
-                    self.registered_handlers[event].remove(handler_tup)
-                    if self._debug:
-                        self._pretty_log_removed_handler(handler, event)
-                    events_to_delete_if_empty.append(event)
-
-        for this_event in events_to_delete_if_empty:
-            self._remove_event_if_empty(this_event)
+        self.remove_handlers_bulk([key for key in self._get_keys_for_callback(handler) if key.event == event])
 
     def remove_handler_by_key(self, key: EventHandlerKey) -> None:
         """Remove a registered event handler by key.
@@ -409,16 +522,36 @@ class EventManager(MpfController):
         ----
             key: The key of the handler you want to remove
         """
-        if key.event not in self.registered_handlers:
-            return
-        events_to_delete_if_empty = []
-        for handler_tup in self.registered_handlers[key.event][:]:  # copy via slice
-            if handler_tup.key == key.key:
-                self.registered_handlers[key.event].remove(handler_tup)
-                if self._debug:
-                    self._pretty_log_removed_handler(handler_tup[0], key.event)
-                events_to_delete_if_empty.append(key.event)
-        for event in events_to_delete_if_empty:
+        self.remove_handlers_bulk([key])
+
+    def remove_handlers_bulk(self, key_list: Iterable[EventHandlerKey]) -> None:
+        """Remove many event handlers at once.
+
+        The handler list of every affected event is only rebuilt once.
+
+        Args:
+        ----
+            key_list: The keys of the handlers you want to remove
+        """
+        keys_by_event = defaultdict(set)    # type: Dict[str, Set[int]]
+        for key in key_list:
+            if key.key not in self._handlers_by_key:
+                continue
+            callback = self._remove_from_index(key.key)
+            keys_by_event[key.event].add(key.key)
+            if self._debug:
+                self._pretty_log_removed_handler(callback, key.event)
+
+        for event, keys in keys_by_event.items():
+            handlers = self.registered_handlers[event]
+            if len(keys) == 1:
+                key = next(iter(keys))
+                for index, handler in enumerate(handlers):
+                    if handler.key == key:
+                        del handlers[index]
+                        break
+            else:
+                handlers[:] = [handler for handler in handlers if handler.key not in keys]
             self._remove_event_if_empty(event)
 
     def remove_handlers_by_keys(self, key_list: List[EventHandlerKey]) -> None:
@@ -428,8 +561,7 @@ class EventManager(MpfController):
         ----
             key_list: A list of keys of the handlers you want to remove
         """
-        for key in key_list:
-            self.remove_handler_by_key(key)
+        self.remove_handlers_bulk(key_list)
 
     def _remove_event_if_empty(self, event: str) -> None:
         # Checks to see if the event doesn't have any more registered handlers,
@@ -705,12 +837,17 @@ class EventManager(MpfController):
             except KeyError:
                 queue = QueuedEvent(self.debug_log)
 
+            start = perf_counter()
             handler.callback(queue=queue, **merged_kwargs)
 
             if queue.waiter:
                 queue.event = asyncio.Event()
                 await queue.event.wait()
 
+            if self.startup_profiler:
+                self.startup_profiler.add(event, self.startup_profiler.handler_name(handler.callback), start,
+                                          perf_counter() - start)
+
         if self._debug:
             self.debug_log("vvvv Finished queue event '%s'. Callback: %s. "
                            "Args: %s", event, callback, kwargs)
@@ -718,8 +855,12 @@ class EventManager(MpfController):
         if callback:
             callback(**kwargs)
 
-    def _run_handlers(self, event: str, ev_type: Optional[str], kwargs: dict) -> Any:
-        """Run all handlers for an event."""
+    # pylint: disable-msg=too-many-branches
+    def _run_handlers(self, event: str, ev_type: Optional[str], kwargs: dict, profiler=None) -> Any:
+        """Run all handlers for an event.
+
+        If a profiler is passed, every handler call is timed.
+        """
         result = None
         for handler in self.registered_handlers[event][:]:
             # use slice above so we don't process new handlers that came
@@ -752,7 +893,11 @@ class EventManager(MpfController):
 
             # call the handler and save the results
             try:
-                result = handler.callback(**merged_kwargs)
+                if profiler:
+                    result = profiler.time_call("handler", profiler.callback_name(handler.callback),
+                                                handler.callback, merged_kwargs)
+                else:
+                    result = handler.callback(**merged_kwargs)
             except Exception as e:
                 raise EventHandlerException(
                     "Exception while processing {} for event {}. {}".format(handler, event, e)) from e
@@ -805,7 +950,12 @@ class EventManager(MpfController):
 
         # Now let's call the handlers one-by-one, including any kwargs
         if event in self.registered_handlers:
-            result = self._run_handlers(event, ev_type, kwargs)
+            if self.profiler and self.profiler.should_sample():
+                start = perf_counter()
+                result = self._run_handlers(event, ev_type, kwargs, self.profiler)
+                self.profiler.add_sample("event", event, perf_counter() - start)
+            else:
+                result = self._run_handlers(event, ev_type, kwargs)
 
         if self._debug:
             self.debug_log("vvvv Finished event '%s'. Type: %s. Callback: %s. "
@@ -822,10 +972,20 @@ class EventManager(MpfController):
 
             self.callback_queue.append((callback, kwargs))
 
+    def call_when_drained(self, callback: Callable[[], None]) -> None:
+        """Call callback once after all queued events and callbacks have been processed.
+
+        Events posted by the callback are processed in the same run of the queue.
+        """
+        if not self.event_queue and not self.callback_queue and not self.drained_callbacks and \
+                hasattr(self.machine.clock, "loop"):
+            self.machine.clock.loop.call_soon(self.process_event_queue)
+        self.drained_callbacks.append(callback)
+
     def process_event_queue(self) -> None:
         """Check if there are any other events that need to be processed, and then process them."""
         inner_queue = deque()   # type: Deque[Deque[PostedEvent]]
-        while self.event_queue or self.callback_queue:
+        while self.event_queue or self.callback_queue or self.drained_callbacks:
             # first process all events. if they post more events we will
             # process them in the same loop.
             if self.event_queue:
@@ -860,6 +1020,11 @@ class EventManager(MpfController):
             if self.callback_queue:
                 callback, kwargs = self.callback_queue.pop()
                 callback(**kwargs)
+            elif not self.event_queue and self.drained_callbacks:
+                drained_callbacks = self.drained_callbacks
+                self.drained_callbacks = []
+                for drained_callback in drained_callbacks:
+                    drained_callback()
 
 
 class QueuedEvent:
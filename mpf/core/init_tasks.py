@@ -0,0 +1,86 @@
+"""Run async initialization steps concurrently while honouring declared dependencies."""
+import asyncio
+from time import perf_counter
+
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+MYPY = False
+if MYPY:   # pragma: no cover
+    from mpf.core.startup_profiler import StartupProfiler     # pylint: disable-msg=cyclic-import,unused-import
+
+
+class InitTaskGraph:
+
+    """Set of named async init steps which may depend on each other.
+
+    Every step starts as soon as all steps listed in its dependencies finished. Steps without dependencies start
+    right away and run concurrently. If a profiler is passed the duration of every step is recorded with the category
+    of the graph.
+    """
+
+    __slots__ = ["category", "profiler", "_tasks"]
+
+    def __init__(self, category: str, profiler: Optional["StartupProfiler"] = None) -> None:
+        """Initialize empty graph."""
+        self.category = category
+        self.profiler = profiler
+        self._tasks = {}    # type: Dict[str, Tuple[Callable[[], Awaitable], List[str]]]
+
+    def add(self, name: str, coroutine_function: Callable[[], Awaitable], after: Iterable[str] = ()) -> None:
+        """Add a step which runs after all steps named in after."""
+        if name in self._tasks:
+            raise AssertionError("Init step {} was added twice to {}.".format(name, self.category))
+        self._tasks[name] = (coroutine_function, list(after))
+
+    def __len__(self):
+        """Return the number of steps."""
+        return len(self._tasks)
+
+    def validate(self) -> None:
+        """Raise if a step depends on an unknown step or if dependencies are circular."""
+        for name, (_, after) in self._tasks.items():
+            for dependency in after:
+                if dependency not in self._tasks:
+                    raise AssertionError("Init step {} in {} depends on unknown step {}.".format(
+                        name, self.category, dependency))
+
+        done = set()
+        for name in self._tasks:
+            self._check_cycle(name, [], done)
+
+    def _check_cycle(self, name: str, path: List[str], done: set) -> None:
+        if name in done:
+            return
+        if name in path:
+            raise AssertionError("Circular dependency between init steps in {}: {}".format(
+                self.category, " -> ".join(path[path.index(name):] + [name])))
+        for dependency in self._tasks[name][1]:
+            self._check_cycle(dependency, path + [name], done)
+        done.add(name)
+
+    async def run(self) -> None:
+        """Run all steps and wait until they are done.
+
+        If a step fails all steps which are still running are cancelled and the exception is raised.
+        """
+        self.validate()
+        running = {}    # type: Dict[str, asyncio.Task]
+        for name in self._tasks:
+            running[name] = asyncio.create_task(self._run_step(name, running))
+
+        try:
+            await asyncio.gather(*running.values())
+        except BaseException:
+            for task in running.values():
+                task.cancel()
+            raise
+
+    async def _run_step(self, name: str, running: Dict[str, asyncio.Task]) -> None:
+        coroutine_function, after = self._tasks[name]
+        if after:
+            await asyncio.gather(*[running[dependency] for dependency in after])
+
+        start = perf_counter()
+        await coroutine_function()
+        if self.profiler:
+            self.profiler.add(self.category, name, start, perf_counter() - start)
@@ -1,7 +1,7 @@
 """Handles all light updates."""
 import asyncio
 
-from typing import Dict, Optional
+from typing import Dict, Set, Any
 
 from mpf.core.machine import MachineController
 from mpf.core.settings_controller import SettingEntry
@@ -9,15 +9,18 @@ from mpf.core.settings_controller import SettingEntry
 from mpf.core.rgb_color import RGBColorCorrectionProfile, RGBColor
 
 from mpf.core.mpf_controller import MpfController
-from mpf.core.utility_functions import Util
+
+MYPY = False
+if MYPY:   # pragma: no cover
+    from mpf.devices.light import Light     # pylint: disable-msg=cyclic-import,unused-import
 
 
 class LightController(MpfController):
 
     """Handles light updates and light monitoring."""
 
-    __slots__ = ["light_color_correction_profiles", "_initialized", "_monitor_update_task", "brightness_factor",
-                 "_brightness_template"]
+    __slots__ = ["light_color_correction_profiles", "_initialized", "brightness_factor", "_brightness_template",
+                 "monitor_enabled", "_dirty_lights", "_monitor_colors", "_monitor_update_handle"]
 
     config_name = "light_controller"
 
@@ -34,7 +37,11 @@ class LightController(MpfController):
         self._brightness_template = self.machine.placeholder_manager.build_float_template("machine.brightness", 1.0)
         self._update_brightness()
 
-        self._monitor_update_task = None                    # type: Optional[asyncio.Task]
+        # lights are only tracked while a monitor is subscribed
+        self.monitor_enabled = False
+        self._dirty_lights = set()                          # type: Set[Light]
+        self._monitor_colors = {}                           # type: Dict[Light, RGBColor]
+        self._monitor_update_handle = None                  # type: Any
 
         if 'named_colors' in self.machine.config:
             self._load_named_colors()
@@ -94,18 +101,53 @@ class LightController(MpfController):
                                                        "standard"))
 
     def monitor_lights(self):
-        """Update the color of lights for the monitor."""
-        if not self._monitor_update_task:
-            self._monitor_update_task = asyncio.create_task(self._monitor_update_lights())
-            self._monitor_update_task.add_done_callback(Util.raise_exceptions)
-
-    async def _monitor_update_lights(self):
-        colors = {}
-        while not self.machine.is_shutting_down:
-            for light in self.machine.lights.values():
-                color = light.get_color()
-                old = colors.get(light, None)
-                if old != color:
-                    self.machine.device_manager.notify_device_changes(light, "color", old, color)
-                    colors[light] = color
-            await asyncio.sleep(1 / self.machine.config['mpf']['default_light_hw_update_hz'])
+        """Start to report color changes of lights to the monitor.
+
+        All lights are reported once. Afterwards, only lights which changed are visited.
+        """
+        if self.monitor_enabled:
+            return
+        self.monitor_enabled = True
+        self._monitor_colors = {}
+        for light in self.machine.lights.values():
+            self.mark_dirty(light)
+
+    def stop_monitoring_lights(self):
+        """Stop to report color changes of lights."""
+        self.monitor_enabled = False
+        self._dirty_lights = set()
+        self._monitor_colors = {}
+        if self._monitor_update_handle:
+            self._monitor_update_handle.cancel()
+            self._monitor_update_handle = None
+
+    def mark_dirty(self, light: "Light"):
+        """Mark a light as changed and report its color soon.
+
+        This is called by lights when their stack changed while a monitor is subscribed.
+        """
+        self._dirty_lights.add(light)
+        if not self._monitor_update_handle:
+            self._monitor_update_handle = self.machine.clock.loop.call_soon(self._monitor_update_lights)
+
+    def _monitor_update_lights(self):
+        """Report the color of all dirty lights and sample running fades again later."""
+        self._monitor_update_handle = None
+        if self.machine.is_shutting_down:
+            return
+        dirty_lights = self._dirty_lights
+        self._dirty_lights = set()
+        for light in dirty_lights:
+            color = light.get_color()
+            old = self._monitor_colors.get(light, None)
+            if old != color:
+                self.machine.device_manager.notify_device_changes(light, "color", old, color)
+                self._monitor_colors[light] = color
+            if light.fade_in_progress:
+                self._dirty_lights.add(light)
+
+        if self._dirty_lights:
+            update_hz = self.machine.config['light_settings']['monitor_fade_update_hz'] or \
+                self.machine.config['mpf']['default_light_hw_update_hz']
+            self._monitor_update_handle = self.machine.clock.loop.call_later(1 / update_hz,
+                                                                             self._monitor_update_lights)
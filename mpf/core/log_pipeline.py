@@ -0,0 +1,129 @@
+"""Logging pipeline which formats and writes log records in a background thread."""
+import logging
+from logging.handlers import QueueHandler, QueueListener
+from queue import Queue, Full
+from typing import List, Optional
+
+DROP = "drop"
+BLOCK = "block"
+
+# args of these types can be merged into the message on the background thread
+IMMUTABLE_ARG_TYPES = (str, int, float, bool, type(None))
+
+
+class PipelineQueueHandler(QueueHandler):
+
+    """Put records into the bounded queue of a log pipeline.
+
+    Unlike the QueueHandler of the standard library, records are not formatted on the calling thread. Messages with
+    only immutable scalar args are merged with their args in the background thread. All other messages are merged on
+    the calling thread because objects may change (or be changed while they are printed) after the call.
+    """
+
+    def __init__(self, pipeline: "LogPipeline") -> None:
+        """Initialize handler."""
+        super().__init__(pipeline.queue)
+        self.pipeline = pipeline
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Merge the message with its args if any arg is not an immutable scalar."""
+        args = record.args
+        if args and (not isinstance(args, tuple) or
+                     not all(isinstance(arg, IMMUTABLE_ARG_TYPES) for arg in args)):
+            record.msg = record.getMessage()
+            record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """Add record to the queue or drop it if the queue is full and the policy is drop."""
+        self.pipeline.enqueue(record)
+
+
+class PipelineQueueListener(QueueListener):
+
+    """Queue listener which can be stopped while the queue is full."""
+
+    def enqueue_sentinel(self):
+        """Wait for space in the queue to add the sentinel."""
+        self.queue.put(self._sentinel)
+
+
+class LogPipeline:
+
+    """Move record formatting and all handler I/O of the root logger to a background thread.
+
+    The pipeline replaces the given handlers on the root logger with a single handler which only puts records into a
+    bounded queue. All loggers which propagate to the root logger (which includes all loggers created by
+    configure_logging) go through the pipeline.
+
+    When the queue is full the policy decides what happens. With "block" the logging call waits until the background
+    thread caught up. With "drop" the record is dropped. The number of dropped records is counted and a warning is
+    logged once records can be queued again.
+    """
+
+    __slots__ = ["queue", "policy", "handlers", "handler", "listener", "dropped", "_unreported_drops", "_logger"]
+
+    def __init__(self, handlers: List[logging.Handler], queue_size: int = 10000, policy: str = BLOCK,
+                 logger: Optional[logging.Logger] = None) -> None:
+        """Initialize pipeline."""
+        if policy not in (DROP, BLOCK):
+            raise ValueError("Invalid log queue policy {}. Use {} or {}.".format(policy, DROP, BLOCK))
+        self.queue = Queue(maxsize=queue_size)      # type: Queue
+        self.policy = policy
+        self.handlers = handlers
+        self.handler = PipelineQueueHandler(self)
+        self.listener = PipelineQueueListener(self.queue, *handlers, respect_handler_level=True)
+        self.dropped = 0
+        self._unreported_drops = 0
+        self._logger = logger if logger else logging.getLogger()
+
+        # do not queue records which no handler wants
+        levels = [handler.level for handler in handlers]
+        if levels and all(levels):
+            self.handler.setLevel(min(levels))
+
+    def start(self) -> None:
+        """Start the background thread and add the pipeline to the logger."""
+        self.listener.start()
+        self._logger.addHandler(self.handler)
+
+    def stop(self) -> None:
+        """Remove the pipeline from the logger, write all queued records and stop the background thread."""
+        self._logger.removeHandler(self.handler)
+        self.listener.stop()
+        if self._unreported_drops:
+            # the background thread stopped. write the warning directly
+            record = self._get_drop_record()
+            self._unreported_drops = 0
+            for handler in self.handlers:
+                if record.levelno >= handler.level:
+                    handler.handle(record)
+        for handler in self.handlers:
+            handler.flush()
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """Add a record to the queue according to the policy."""
+        if self.policy == BLOCK:
+            self.queue.put(record)
+            return
+
+        if self._unreported_drops:
+            self._report_drops()
+        try:
+            self.queue.put_nowait(record)
+        except Full:
+            self.dropped += 1
+            self._unreported_drops += 1
+
+    def _get_drop_record(self) -> logging.LogRecord:
+        return self._logger.makeRecord(self._logger.name, logging.WARNING, __file__, 0,
+                                       "Log queue was full. Dropped %s log records (%s in total).",
+                                       (self._unreported_drops, self.dropped), None)
+
+    def _report_drops(self):
+        """Queue a warning with the number of records which were dropped since the last warning."""
+        try:
+            self.queue.put_nowait(self._get_drop_record())
+        except Full:
+            return
+        self._unreported_drops = 0
@@ -6,9 +6,6 @@ import sys
 import threading
 from typing import Any, Callable, Dict, List, Set, Optional
 
-from packaging import version
-from pkg_resources import iter_entry_points
-
 from mpf._version import __version__
 from mpf.core.clock import ClockBase
 from mpf.core.config_validator import ConfigValidator
@@ -16,11 +13,13 @@ from mpf.core.crash_reporter import report_crash
 from mpf.core.data_manager import DataManager
 from mpf.core.delays import DelayManager
 from mpf.core.device_manager import DeviceCollection
+from mpf.core.init_tasks import InitTaskGraph
 from mpf.core.logging import LogMixin
 from mpf.core.machine_vars import MachineVariables
 from mpf.core.utility_functions import Util
 from mpf.core.config_loader import MpfConfig
 from mpf.core.plugin import MpfPlugin
+from mpf.core.startup_profiler import StartupProfiler
 
 MYPY = False
 if MYPY:   # pragma: no cover
@@ -31,6 +30,10 @@ if MYPY:   # pragma: no cover
     from mpf.core.service_controller import ServiceController   # pylint: disable-msg=cyclic-import,unused-import
     from mpf.core.light_controller import LightController   # pylint: disable-msg=cyclic-import,unused-import
     from mpf.core.platform_controller import PlatformController     # pylint: disable-msg=cyclic-import,unused-import
+    from mpf.core.profiler import Profiler  # pylint: disable-msg=cyclic-import,unused-import
+    from mpf.core.memory_monitor import MemoryMonitor   # pylint: disable-msg=cyclic-import,unused-import
+    from mpf.core.sequence_matcher import SequenceMatcher   # pylint: disable-msg=cyclic-import,unused-import
+    from mpf.core.variable_batcher import VariableBatcher   # pylint: disable-msg=cyclic-import,unused-import
 
     from mpf.core.custom_code import CustomCode     # pylint: disable-msg=cyclic-import,unused-import
     from mpf.core.mode_controller import ModeController     # pylint: disable-msg=cyclic-import,unused-import
@@ -105,7 +108,7 @@ class MachineController(LogMixin):
                  "stop_future", "events", "switch_controller", "mode_controller", "settings",
                  "bcp", "ball_controller", "show_controller", "placeholder_manager", "device_manager", "auditor",
                  "tui", "service", "switches", "shows", "coils", "ball_devices", "lights", "playfield", "playfields",
-                 "autofire_coils", "_crash_handlers", "__dict__", "mpf_config", "is_shutting_down"]
+                 "autofire_coils", "_crash_handlers", "__dict__", "mpf_config", "is_shutting_down", "startup_profiler"]
 
     # pylint: disable-msg=too-many-statements
     def __init__(self, options: dict, config: MpfConfig) -> None:
@@ -129,6 +132,8 @@ class MachineController(LogMixin):
         self._exception = None      # type: Any
         self._boot_holds = set()    # type: Set[str]
         self.is_init_done = None    # type: Optional[asyncio.Event]
+        # records the duration of all startup steps from here until init is done
+        self.startup_profiler = StartupProfiler()
 
         self._done = False
         self.monitors = dict()      # type: Dict[str, Set[Callable]]
@@ -162,6 +167,10 @@ class MachineController(LogMixin):
             self.show_player = self.show_player                     # type: ShowPlayer
             self.light_controller = self.light_controller           # type: LightController
             self.platform_controller = self.platform_controller     # type: PlatformController
+            self.profiler = self.profiler                           # type: Profiler
+            self.memory_monitor = self.memory_monitor               # type: MemoryMonitor
+            self.sequence_matcher = self.sequence_matcher           # type: SequenceMatcher
+            self.variable_batcher = self.variable_batcher           # type: VariableBatcher
 
             # devices
             self.autofire_coils = {}                    # type: Dict[str, AutofireCoil]
@@ -231,17 +240,21 @@ class MachineController(LogMixin):
         self._boot_holds = set()
         self.is_init_done = asyncio.Event()
         self.register_boot_hold('init')
-        self._load_hardware_platforms()
+        with self.startup_profiler.measure("phase", "load_hardware_platforms"):
+            self._load_hardware_platforms()
 
-        self._load_core_modules()
+        with self.startup_profiler.measure("phase", "load_core_modules"):
+            self._load_core_modules()
         # order is specified in mpfconfig.yaml
 
-        self._validate_config()
+        with self.startup_profiler.measure("phase", "validate_config"):
+            self._validate_config()
 
         # This is called so hw platforms have a chance to register for events,
         # and/or anything else they need to do with core modules since
         # they're not set up yet when the hw platforms are constructed.
-        await self._initialize_platforms()
+        with self.startup_profiler.measure("phase", "initialize_platforms"):
+            await self._initialize_platforms()
 
     async def initialize(self) -> None:
         """Initialize machine."""
@@ -249,17 +262,23 @@ class MachineController(LogMixin):
 
         self._initialize_credit_string()
 
-        self._register_config_players()
+        with self.startup_profiler.measure("phase", "register_config_players"):
+            self._register_config_players()
         self._register_system_events()
-        self._load_machine_vars()
+        with self.startup_profiler.measure("phase", "load_machine_vars"):
+            self._load_machine_vars()
         await self._run_init_phases()
         self._init_phases_complete()
 
-        await self._start_platforms()
+        with self.startup_profiler.measure("phase", "start_platforms"):
+            await self._start_platforms()
 
         # wait until all boot holds were released
         assert self.is_init_done is not None
-        await self.is_init_done.wait()
+        with self.startup_profiler.measure("phase", "wait_for_boot_holds"):
+            await self.is_init_done.wait()
+        self.startup_profiler.finish()
+        self.profiler.report_startup(self.startup_profiler)
         await self.init_done()
 
     def _exception_handler(self, loop, context):    # pragma: no cover
@@ -280,35 +299,44 @@ class MachineController(LogMixin):
 
     async def _run_init_phases(self) -> None:
         """Run init phases."""
-        await self.events.post_queue_async("init_phase_1")
+        self.events.startup_profiler = self.startup_profiler
+        await self._run_init_phase("init_phase_1")
         '''event: init_phase_1
 
         desc: Posted during the initial boot up of MPF.
         '''
-        await self.events.post_queue_async("init_phase_2")
+        await self._run_init_phase("init_phase_2")
         '''event: init_phase_2
 
         desc: Posted during the initial boot up of MPF.
         '''
-        self._load_plugins()
-        await self.events.post_queue_async("init_phase_3")
+        with self.startup_profiler.measure("phase", "load_plugins"):
+            self._load_plugins()
+        await self._run_init_phase("init_phase_3")
         '''event: init_phase_3
 
         desc: Posted during the initial boot up of MPF.
         '''
-        self._load_custom_code()
+        with self.startup_profiler.measure("phase", "load_custom_code"):
+            self._load_custom_code()
 
-        await self.events.post_queue_async("init_phase_4")
+        await self._run_init_phase("init_phase_4")
         '''event: init_phase_4
 
         desc: Posted during the initial boot up of MPF.
         '''
 
-        await self.events.post_queue_async("init_phase_5")
+        await self._run_init_phase("init_phase_5")
         '''event: init_phase_5
 
         desc: Posted during the initial boot up of MPF.
         '''
+        self.events.startup_profiler = None
+
+    async def _run_init_phase(self, phase: str) -> None:
+        """Post an init phase and measure how long its handlers took."""
+        with self.startup_profiler.measure("phase", phase):
+            await self.events.post_queue_async(phase)
 
     def _init_phases_complete(self, **kwargs) -> None:
         """Cleanup after init and remove boot holds."""
@@ -321,22 +349,32 @@ class MachineController(LogMixin):
 
         self.clear_boot_hold('init')
 
+    def _get_platform_init_tasks(self, category: str, method: str) -> InitTaskGraph:
+        """Return an init step for every platform which calls method after the platforms it depends on.
+
+        Platforms without declared dependencies wait for all platforms which were loaded before them.
+        """
+        init_tasks = InitTaskGraph(category, self.startup_profiler)
+        previous_platforms = []     # type: List[str]
+        for name, hardware_platform in self.hardware_platforms.items():
+            dependencies = hardware_platform.get_init_dependencies()
+            if dependencies is None:
+                dependencies = list(previous_platforms)
+            init_tasks.add(name, getattr(hardware_platform, method), dependencies)
+            previous_platforms.append(name)
+        return init_tasks
+
     async def _initialize_platforms(self) -> None:
-        """Initialize all used hardware platforms."""
-        init_done = []
-        # collect all platform init futures
-        for hardware_platform in list(self.hardware_platforms.values()):
-            init_done.append(hardware_platform.initialize())
+        """Initialize all used hardware platforms.
 
-        # wait for all of them in parallel
-        results = await asyncio.wait([asyncio.create_task(init_done) for init_done in init_done])
-        for result in results[0]:
-            result.result()
+        Platforms which declare their dependencies are initialized in parallel. All others keep the load order.
+        """
+        await self._get_platform_init_tasks("platform_initialize", "initialize").run()
 
     async def _start_platforms(self) -> None:
-        """Start all used hardware platforms."""
-        for hardware_platform in list(self.hardware_platforms.values()):
-            await hardware_platform.start()
+        """Start all used hardware platforms in the same order as they were initialized."""
+        await self._get_platform_init_tasks("platform_start", "start").run()
+        for hardware_platform in self.hardware_platforms.values():
             if not hardware_platform.features['tickless']:
                 self.clock.schedule_interval(hardware_platform.tick, 1 / self.config['mpf']['default_platform_hz'])
 
@@ -374,6 +412,8 @@ class MachineController(LogMixin):
     def _validate_version(self):
         if not self.config['mpf']['min_mpf_version']:
             return
+        # pylint: disable-msg=import-outside-toplevel
+        from packaging import version
         min_version = version.parse(self.config['mpf']['min_mpf_version'])
         mpf_version = version.parse(__version__)
         if mpf_version < min_version:
@@ -410,8 +450,7 @@ class MachineController(LogMixin):
     def _register_plugin_config_players(self):
         """Register plugin config players."""
         self.debug_log("Registering Plugin Config Players")
-        for entry_point in iter_entry_points(group='mpf.config_player',
-                                             name=None):
+        for entry_point in Util.get_entry_points('mpf.config_player'):
             self.debug_log("Registering %s", entry_point)
             name, player = entry_point.load()(self)
             setattr(self, '{}_player'.format(name), player)
@@ -465,7 +504,8 @@ class MachineController(LogMixin):
         self.debug_log("Loading core modules...")
         for name, module_class in self.config['mpf']['core_modules'].items():
             self.debug_log("Loading '%s' core module", module_class)
-            m = Util.string_to_class(module_class)(self)
+            with self.startup_profiler.measure("core_module", name):
+                m = Util.string_to_class(module_class)(self)
             setattr(self, name, m)
 
     def _load_hardware_platforms(self) -> None:
@@ -503,7 +543,8 @@ class MachineController(LogMixin):
             plugin_obj = Util.string_to_class(plugin)(self)  # type: MpfPlugin
             if plugin_obj.is_plugin_enabled:
                 self.debug_log("Including plugin %s", plugin_obj.name)
-                plugin_obj.initialize()
+                with self.startup_profiler.measure("plugin", plugin_obj.name):
+                    plugin_obj.initialize()
                 self.plugins.append(plugin_obj)
             else:
                 self.debug_log("Excluding plugin %s because it's not enabled", plugin_obj.name)
@@ -517,9 +558,10 @@ class MachineController(LogMixin):
 
                 self.debug_log("Loading %s custom code", custom_code)
 
-                custom_code_obj = Util.string_to_class(custom_code)(
-                    machine=self,
-                    name=custom_code)
+                with self.startup_profiler.measure("custom_code", custom_code):
+                    custom_code_obj = Util.string_to_class(custom_code)(
+                        machine=self,
+                        name=custom_code)
 
                 self.custom_code.append(custom_code_obj)
 
@@ -605,7 +647,7 @@ class MachineController(LogMixin):
 
             else:
                 # check entry points
-                entry_points = list(iter_entry_points(group='mpf.platforms', name=name))
+                entry_points = Util.get_entry_points('mpf.platforms', name)
                 if entry_points:
                     # load platform from entry point
                     self.debug_log("Loading platform %s from external entry_point", name)
@@ -617,7 +659,8 @@ class MachineController(LogMixin):
                 else:
                     raise AssertionError("Unknown platform {}".format(name))
 
-            self.hardware_platforms[name] = hardware_platform(self)
+            with self.startup_profiler.measure("platform_load", name):
+                self.hardware_platforms[name] = hardware_platform(self)
 
     def set_default_platform(self, name: str) -> None:
         """Set the default platform.
@@ -1,5 +1,6 @@
 """Contains the MachineVariables class."""
 import copy
+from functools import partial
 from platform import platform, python_version, system, release, version, system_alias, machine as platform_machine
 from typing import Any, Dict, Optional
 
@@ -202,37 +203,46 @@ class MachineVariables(LogMixin):
             self.debug_log("Setting machine_var '%s' to: %s, (prior: %s, "
                            "change: %s)", name, value, prev_value,
                            change)
-            self.machine.events.post('machine_var_' + name,
-                                     value=value,
-                                     prev_value=prev_value,
-                                     change=change)
-            '''event: machine_var_(name)
-            config_section: machine_vars
-            class_label: machine_var
+            batcher = getattr(self.machine, "variable_batcher", None)
+            if batcher and batcher.is_machine_var_batched(name):
+                batcher.add_change(("machine", name), prev_value, value, {},
+                                   partial(self._send_machine_var_event, name), prev_value is None)
+            else:
+                self._send_machine_var_event(name, value, prev_value, change)
+        elif self.machine_vars[name]["expire_secs"]:
+            self._write_machine_var_to_disk(name)
 
-            desc: Posted when a machine variable is added or changes value.
-            (Machine variables are like player variables, except they're
-            maintained machine-wide instead of per-player or per-game.)
+    def _send_machine_var_event(self, name: str, value, prev_value, change) -> None:
+        """Post machine var event and call monitors."""
+        self.machine.events.post('machine_var_' + name,
+                                 value=value,
+                                 prev_value=prev_value,
+                                 change=change)
+        '''event: machine_var_(name)
+        config_section: machine_vars
+        class_label: machine_var
 
-            args:
+        desc: Posted when a machine variable is added or changes value.
+        (Machine variables are like player variables, except they're
+        maintained machine-wide instead of per-player or per-game.)
 
-            value: The new value of this machine variable.
+        args:
 
-            prev_value: The previous value of this machine variable, e.g. what
-            it was before the current value.
+        value: The new value of this machine variable.
 
-            change: If the machine variable just changed, this will be the
-            amount of the change. If it's not possible to determine a numeric
-            change (for example, if this machine variable is a list), then this
-            *change* value will be set to the boolean *True*.
-            '''
+        prev_value: The previous value of this machine variable, e.g. what
+        it was before the current value.
 
-            if self.machine_var_monitor:
-                for callback in self.machine.monitors['machine_vars']:
-                    callback(name=name, value=value,
-                             prev_value=prev_value, change=change)
-        elif self.machine_vars[name]["expire_secs"]:
-            self._write_machine_var_to_disk(name)
+        change: If the machine variable just changed, this will be the
+        amount of the change. If it's not possible to determine a numeric
+        change (for example, if this machine variable is a list), then this
+        *change* value will be set to the boolean *True*.
+        '''
+
+        if self.machine_var_monitor:
+            for callback in self.machine.monitors['machine_vars']:
+                callback(name=name, value=value,
+                         prev_value=prev_value, change=change)
 
     def remove_machine_var(self, name: str) -> None:
         """Remove a machine variable by name.
@@ -0,0 +1,216 @@
+"""Opt-in monitor for memory growth of caches and registries."""
+import gc
+import tracemalloc
+from collections import deque
+from typing import Callable, Deque, Dict, List, Optional
+
+from mpf.core.cache import cache_registry
+from mpf.core.mpf_controller import MpfController
+
+MYPY = False
+if MYPY:   # pragma: no cover
+    from mpf.core.machine import MachineController      # pylint: disable-msg=cyclic-import,unused-import
+
+
+class MemoryMonitor(MpfController):
+
+    """Periodically samples RSS, bounded caches and the sizes of registries which may grow unbounded.
+
+    The monitor is disabled by default. When enabled, it logs a line every log_interval and warns and posts
+    memory_growth when a source grew in alert_after_samples samples in a row. With tracemalloc enabled, every sample
+    also records the allocations which grew most since the previous sample.
+    """
+
+    config_name = "memory_monitor"
+
+    __slots__ = ["config", "enabled", "sources", "history", "first_sizes", "tracemalloc_diff", "_process",
+                 "_sample_task", "_last_log_time", "_alerted", "_snapshot", "_started_tracemalloc"]
+
+    def __init__(self, machine: "MachineController") -> None:
+        """Initialize memory monitor."""
+        super().__init__(machine)
+        self.machine.validate_machine_config_section('memory_monitor')
+        self.config = self.machine.config['memory_monitor']
+        self.enabled = self.config['enabled']
+        self.sources = {}           # type: Dict[str, Callable[[], int]]
+        # the last alert_after_samples + 1 sizes per source
+        self.history = {}           # type: Dict[str, Deque[int]]
+        self.first_sizes = {}       # type: Dict[str, int]
+        self.tracemalloc_diff = []  # type: List[str]
+        self._process = None
+        self._sample_task = None
+        self._last_log_time = None  # type: Optional[float]
+        self._alerted = set()
+        self._snapshot = None
+        self._started_tracemalloc = False
+
+        self.add_source("rss", self._get_rss)
+        self.add_source("gc_objects", lambda: len(gc.get_objects()))
+        self.add_source("event_handlers", self._get_event_handler_count)
+        self.add_source("device_tag_cache", self._get_device_tag_cache_size)
+        self.add_source("device_attribute_futures", self._get_device_attribute_future_count)
+        self.add_source("running_shows", self._get_running_show_count)
+
+        if not self.enabled:
+            return
+
+        self.machine.events.add_handler("init_phase_5", self._start)
+        self.machine.events.add_handler("shutdown", self._stop)
+        self.machine.events.add_handler("debug_dump_stats", self._dump_stats)
+
+    def add_source(self, name: str, callback: Callable[[], int]) -> None:
+        """Add a size which is sampled.
+
+        Callback is called on every sample and returns the current size.
+        """
+        self.sources[name] = callback
+
+    def _start(self, **kwargs):
+        """Start sampling."""
+        del kwargs
+        if self.config['tracemalloc'] and not tracemalloc.is_tracing():
+            tracemalloc.start(self.config['tracemalloc_frames'])
+            self._started_tracemalloc = True
+        self.sample()
+        self._sample_task = self.machine.clock.schedule_interval(self.sample,
+                                                                 self.config['sample_interval'] / 1000)
+
+    def _stop(self, **kwargs):
+        """Stop sampling."""
+        del kwargs
+        if self._sample_task:
+            self.machine.clock.unschedule(self._sample_task)
+            self._sample_task = None
+        self._snapshot = None
+        if self._started_tracemalloc:
+            self._started_tracemalloc = False
+            tracemalloc.stop()
+
+    def _get_rss(self):
+        if not self._process:
+            # psutil is only imported when memory is sampled
+            # pylint: disable-msg=import-outside-toplevel
+            from psutil import Process
+            self._process = Process()
+        return self._process.memory_info().rss
+
+    def _get_event_handler_count(self):
+        return sum(len(handlers) for handlers in self.machine.events.registered_handlers.values())
+
+    def _get_device_tag_cache_size(self):
+        # pylint: disable-msg=protected-access
+        return sum(len(collection._tag_cache) for collection in self.machine.device_manager.collections.values())
+
+    def _get_device_attribute_future_count(self):
+        registries = {}
+        for devices in self.machine.device_manager.get_monitorable_devices().values():
+            for device in devices.values():
+                registry = getattr(type(device), "attribute_futures", None)
+                if registry is not None:
+                    registries[id(registry)] = registry
+        return sum(len(futures) for registry in registries.values() for attributes in registry.values()
+                   for futures in attributes.values())
+
+    def _get_running_show_count(self):
+        show_player = getattr(self.machine, "show_player", None)
+        if not show_player:
+            return 0
+        return sum(len(shows) for context in show_player.instances.values() for shows in context.values())
+
+    def get_sizes(self) -> Dict[str, int]:
+        """Return the current size of all sources and all bounded caches."""
+        sizes = {name: callback() for name, callback in self.sources.items()}
+        for name, stats in cache_registry.get_stats().items():
+            sizes["cache_" + name] = stats["size"]
+        return sizes
+
+    def get_growth(self) -> Dict[str, int]:
+        """Return the growth of all sources since the first sample."""
+        return {name: values[-1] - self.first_sizes[name] for name, values in self.history.items()}
+
+    def sample(self) -> Dict[str, int]:
+        """Sample all sources, check for sustained growth and send them to monitors."""
+        sizes = self.get_sizes()
+        for name, size in sizes.items():
+            values = self.history.get(name)
+            if values is None:
+                self.first_sizes[name] = size
+                values = self.history[name] = deque(maxlen=self.config['alert_after_samples'] + 1)
+            values.append(size)
+            self._check_growth(name, values)
+
+        if self.config['tracemalloc'] and tracemalloc.is_tracing():
+            self._update_tracemalloc_diff()
+
+        now = self.machine.clock.get_time()
+        if self._last_log_time is None or now - self._last_log_time >= self.config['log_interval'] / 1000:
+            self._last_log_time = now
+            self.info_log("Memory: rss: %.1fMB %s", sizes["rss"] / 1024 / 1024,
+                          " ".join("{}: {}".format(name, size) for name, size in sizes.items() if name != "rss"))
+
+        self.send_stats_to_monitors(sizes)
+        return sizes
+
+    def _check_growth(self, name, values):
+        """Alert once when the last alert_after_samples samples all grew."""
+        growing = len(values) == values.maxlen and all(a < b for a, b in zip(values, list(values)[1:]))
+        if not growing:
+            self._alerted.discard(name)
+            return
+        if name in self._alerted:
+            return
+        self._alerted.add(name)
+        self.warning_log("%s grew in the last %s samples from %s to %s (%s since start).", name, len(values) - 1,
+                         values[0], values[-1], values[-1] - self.first_sizes[name])
+        self.machine.events.post("memory_growth", source=name, size=values[-1], growth=values[-1] - values[0])
+        '''event: memory_growth
+        desc: A cache or registry grew in the last alert_after_samples samples of the memory_monitor.
+
+        args:
+        source: Name of the cache or registry.
+        size: Current size.
+        growth: Growth during the last alert_after_samples samples.
+        '''
+
+    def _update_tracemalloc_diff(self):
+        snapshot = tracemalloc.take_snapshot()
+        if self._snapshot:
+            stats = snapshot.compare_to(self._snapshot, "lineno")[:self.config['tracemalloc_top']]
+            self.tracemalloc_diff = [str(stat) for stat in stats]
+        self._snapshot = snapshot
+
+    def get_stats(self) -> dict:
+        """Return current sizes, growth and the last tracemalloc diff."""
+        return {
+            "sizes": {name: values[-1] for name, values in self.history.items()},
+            "growth": self.get_growth(),
+            "alerts": sorted(self._alerted),
+            "tracemalloc": self.tracemalloc_diff,
+            "caches": cache_registry.get_stats(),
+        }
+
+    def send_stats_to_monitors(self, sizes=None) -> None:
+        """Send stats to all BCP clients which monitor memory."""
+        if not self.machine.bcp.transport.get_transports_for_handler("_memory_monitor"):
+            return
+        stats = self.get_stats()
+        if sizes:
+            stats["sizes"] = sizes
+        self.machine.bcp.transport.send_to_clients_with_handler(
+            handler="_memory_monitor", bcp_command="memory_stats", **stats)
+
+    def _dump_stats(self, **kwargs):
+        del kwargs
+        self.info_log("--- DEBUG DUMP MEMORY ---")
+        growth = self.get_growth()
+        for name, size in self.get_sizes().items():
+            self.info_log("%s: %s (growth since start: %s)", name, size, growth.get(name, 0))
+        for name, stats in cache_registry.get_stats().items():
+            self.info_log("Cache %s: size: %s/%s hits: %s misses: %s evictions: %s hit rate: %s", name,
+                          stats["size"], stats["max_size"], stats["hits"], stats["misses"], stats["evictions"],
+                          stats["hit_rate"])
+        if self.tracemalloc_diff:
+            self.info_log("Top allocations since last sample:")
+            for line in self.tracemalloc_diff:
+                self.info_log("  %s", line)
+        self.info_log("--- DEBUG DUMP MEMORY END ---")
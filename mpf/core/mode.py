@@ -1,6 +1,7 @@
 """Contains the Mode base class."""
 from typing import Any, Optional, Union
 from typing import Callable
+from typing import Iterable
 from typing import Dict
 from typing import List
 from typing import Set
@@ -17,6 +18,8 @@ if MYPY:   # pragma: no cover
     from mpf.core.mode_device import ModeDevice     # pylint: disable-msg=cyclic-import,unused-import
     from mpf.core.player import Player  # pylint: disable-msg=cyclic-import,unused-import
     from mpf.core.machine import MachineController  # pylint: disable-msg=cyclic-import,unused-import
+    from mpf.core.mode_controller import ModeActivationPlan     # pylint: disable-msg=cyclic-import,unused-import
+    from mpf.core.events import PreparedHandler     # pylint: disable-msg=cyclic-import,unused-import
 
 MODE_STARTING_EVENT_TEMPLATE = 'mode_{}_starting'
 
@@ -195,34 +198,23 @@ class Mode(LogMixin):
         # hook for custom code. called before any mode devices are set up
         self.mode_will_start(**self.start_event_kwargs)
 
-        self._add_mode_devices()
+        plan = self.machine.mode_controller.get_activation_plan(self)
 
-        self.debug_log("Registering mode_stop handlers")
-
-        # register mode stop events
-        if 'stop_events' in self.config['mode']:
+        self._add_mode_devices(plan.devices)
 
-            for event in self.config['mode']['stop_events']:
-                # stop priority is +1 so if two modes of the same priority
-                # start and stop on the same event, the one will stop before
-                # the other starts
-                self.add_mode_event_handler(event=event, handler=self.stop,
-                                            priority=self.config['mode']['stop_priority'] + 1)
+        self.debug_log("Registering mode_stop handlers")
+        self.add_prepared_mode_event_handlers(plan.stop_event_handlers)
 
         self.start_callback = callback
 
         self.debug_log("Calling mode_start handlers")
 
-        for item in self.machine.mode_controller.start_methods:
-            if item.config_section in self.config or not item.config_section:
-                result = item.method(config=self.config.get(item.config_section, self.config),
-                                     priority=self.priority,
-                                     mode=self,
-                                     **item.kwargs)
-                if result:
-                    self.stop_methods.append(result)
+        for method, config, method_kwargs in plan.start_methods:
+            result = method(config=config, priority=self.priority, mode=self, **method_kwargs)
+            if result:
+                self.stop_methods.append(result)
 
-        self._setup_device_control_events()
+        self._setup_device_control_events(plan)
 
         self.machine.events.post_queue(event=MODE_STARTING_EVENT_TEMPLATE.format(self.name),
                                        callback=self._started, **kwargs)
@@ -387,25 +379,15 @@ class Mode(LogMixin):
 
         self.stop_callbacks = []
 
-    def _add_mode_devices(self) -> None:
+    def _add_mode_devices(self, devices: Iterable["ModeDevice"]) -> None:
         """Add and initialize mode devices which get removed at the end of the mode."""
-        for config_key, config in self.config.items():
-            if config_key not in self.machine.config['mpf']['device_modules']:
-                continue
+        for device in devices:
+            # Track that this device was added via this mode so we
+            # can remove it when the mode ends.
+            self.mode_devices.add(device)
 
-            collection = getattr(self.machine, config_key)
-            for device_name in config.keys():
-                device = collection[device_name]
-                # Track that this device was added via this mode so we
-                # can remove it when the mode ends.
-                self.mode_devices.add(device)
-                if not self.config['mode']['game_mode'] and not device.can_exist_outside_of_game:
-                    raise AssertionError("Device {} cannot exist in non game-mode {}.".format(
-                        device, self.name
-                    ))
-
-                # This lets the device know it was added to a mode
-                device.device_loaded_in_mode(mode=self, player=self.player)
+            # This lets the device know it was added to a mode
+            device.device_loaded_in_mode(mode=self, player=self.player)
 
     def create_mode_devices(self) -> None:
         """Create new devices that are specified in a mode config that haven't been created in the machine-wide."""
@@ -462,38 +444,12 @@ class Mode(LogMixin):
 
         self.mode_devices = set()
 
-    def _setup_device_control_events(self) -> None:
+    def _setup_device_control_events(self, plan: "ModeActivationPlan") -> None:
         # registers mode handlers for control events for all devices specified
         # in this mode's config (not just newly-created devices)
+        self.add_prepared_mode_event_handlers(plan.control_event_handlers)
 
-        self.debug_log("Scanning mode-based config for device control_events")
-
-        for event, method, delay, device in (
-                self.machine.device_manager.get_device_control_events(
-                self.config)):
-
-            if not delay:
-                self.add_mode_event_handler(
-                    event=event,
-                    handler=method,
-                    blocking_facility=device.class_label)
-            else:
-                self.add_mode_event_handler(
-                    event=event,
-                    handler=self._control_event_handler,
-                    callback=method,
-                    ms_delay=delay,
-                    blocking_facility=device.class_label)
-
-        # get all devices in the mode
-        device_list = set()     # type: Set[ModeDevice]
-        for collection in self.machine.device_manager.collections:
-            if self.machine.device_manager.collections[collection].config_section in self.config:
-                for device, _ in \
-                        iter(self.config[self.machine.device_manager.collections[collection].config_section].items()):
-                    device_list.add(self.machine.device_manager.collections[collection][device])
-
-        for device in device_list:
+        for device in plan.control_event_devices:
             device.add_control_events_in_mode(self)
 
     def _control_event_handler(self, callback: Callable[..., None], ms_delay: int = 0, **kwargs) -> None:
@@ -540,9 +496,15 @@ class Mode(LogMixin):
 
         return key
 
+    def add_prepared_mode_event_handlers(self, prepared_handlers: Iterable["PreparedHandler"]) -> None:
+        """Register handlers from ``EventManager.prepare_handlers`` which are removed when this mode stops.
+
+        Priorities of the prepared handlers are relative to the priority of this mode.
+        """
+        self.event_handlers.update(self.machine.events.add_prepared_handlers(prepared_handlers, self.priority))
+
     def _remove_mode_event_handlers(self) -> None:
-        for key in self.event_handlers:
-            self.machine.events.remove_handler_by_key(key)
+        self.machine.events.remove_handlers_bulk(self.event_handlers)
         self.event_handlers = set()
 
     def _remove_mode_switch_handlers(self) -> None:
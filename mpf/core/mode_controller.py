@@ -18,6 +18,16 @@ be called on mode_start or mode_stop.
 
 """
 
+ModeActivationPlan = namedtuple('ModeActivationPlan', ['devices', 'stop_event_handlers', 'start_methods',
+                                                       'control_event_handlers', 'control_event_devices'])
+"""ModeActivationPlan contains everything a mode does on start.
+
+It is computed when a mode starts for the first time and reused on all later
+starts. Event handlers are already prepared by the event manager and their
+priorities are relative to the mode priority.
+
+"""
+
 
 class ModeController(MpfController):
 
@@ -26,7 +36,7 @@ class ModeController(MpfController):
     config_name = "mode_controller"
 
     __slots__ = ["queue", "active_modes", "mode_stop_count", "_machine_mode_folders", "_mpf_mode_folders",
-                 "loader_methods", "start_methods"]
+                 "loader_methods", "start_methods", "_activation_plans"]
 
     def __init__(self, machine: MachineController) -> None:
         """Initialize mode controller.
@@ -52,6 +62,7 @@ class ModeController(MpfController):
         # started.
         self.loader_methods = list()                # type: List[RemoteMethod]
         self.start_methods = list()                 # type: List[RemoteMethod]
+        self._activation_plans = dict()             # type: Dict[Mode, ModeActivationPlan]
 
         if 'modes' in self.machine.config:
             # priority needs to be higher than device_manager::_load_device_modules
@@ -307,6 +318,7 @@ class ModeController(MpfController):
                                                kwargs=kwargs))
 
         self.start_methods.sort(key=lambda x: x.priority, reverse=True)
+        self._activation_plans = dict()
 
     def remove_start_method(self, start_method, config_section_name=None, priority=0, **kwargs):
         """Remove an existing start method."""
@@ -315,6 +327,69 @@ class ModeController(MpfController):
 
         if method in self.start_methods:
             self.start_methods.remove(method)
+            self._activation_plans = dict()
+
+    def get_activation_plan(self, mode: Mode) -> ModeActivationPlan:
+        """Return the activation plan of a mode and create it on first use."""
+        try:
+            return self._activation_plans[mode]
+        except KeyError:
+            plan = self._create_activation_plan(mode)
+            self._activation_plans[mode] = plan
+            return plan
+
+    def _create_activation_plan(self, mode: Mode) -> ModeActivationPlan:
+        """Collect devices, event handlers and start methods for a mode."""
+        self.debug_log("Creating activation plan for mode %s", mode.name)
+        devices = []
+        for config_key, config in mode.config.items():
+            if config_key not in self.machine.config['mpf']['device_modules']:
+                continue
+
+            collection = getattr(self.machine, config_key)
+            for device_name in config.keys():
+                device = collection[device_name]
+                if not mode.config['mode']['game_mode'] and not device.can_exist_outside_of_game:
+                    raise AssertionError("Device {} cannot exist in non game-mode {}.".format(
+                        device, mode.name
+                    ))
+                devices.append(device)
+
+        # stop priority is +1 so if two modes of the same priority start and stop on the same event, the one will
+        # stop before the other starts
+        stop_event_handlers = [(event, mode.stop, mode.config['mode']['stop_priority'] + 1, {})
+                               for event in mode.config['mode'].get('stop_events', [])]
+
+        start_methods = tuple((item.method, mode.config.get(item.config_section, mode.config), item.kwargs)
+                              for item in self.start_methods
+                              if item.config_section in mode.config or not item.config_section)
+
+        control_event_handlers = []
+        for event, method, delay, device in self.machine.device_manager.get_device_control_events(mode.config):
+            if not delay:
+                control_event_handlers.append((event, method, 0, dict(blocking_facility=device.class_label)))
+            else:
+                # pylint: disable-msg=protected-access
+                control_event_handlers.append((event, mode._control_event_handler, 0,
+                                               dict(callback=method, ms_delay=delay,
+                                                    blocking_facility=device.class_label)))
+
+        control_event_devices = set()
+        for collection in self.machine.device_manager.collections.values():
+            if collection.config_section in mode.config:
+                for device_name in mode.config[collection.config_section]:
+                    control_event_devices.add(collection[device_name])
+
+        return ModeActivationPlan(devices=tuple(devices),
+                                  stop_event_handlers=self._prepare_mode_handlers(mode, stop_event_handlers),
+                                  start_methods=start_methods,
+                                  control_event_handlers=self._prepare_mode_handlers(mode, control_event_handlers),
+                                  control_event_devices=tuple(control_event_devices))
+
+    def _prepare_mode_handlers(self, mode: Mode, handlers):
+        """Prepare event handlers of a mode. Priorities stay relative to the mode priority."""
+        return self.machine.events.prepare_handlers(
+            (event, handler, priority, dict(kwargs, mode=mode)) for event, handler, priority, kwargs in handlers)
 
     def set_mode_state(self, mode: Mode, active: bool):
         """Remember mode state."""
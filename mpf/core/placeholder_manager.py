@@ -4,11 +4,11 @@ import string
 import asyncio
 import operator as op
 import abc
-from functools import lru_cache
 
 import re
 from typing import Tuple, List, Any, Union
 
+from mpf.core.cache import cached
 from mpf.core.utility_functions import Util
 
 from mpf.core.mpf_controller import MpfController
@@ -254,18 +254,24 @@ class MpfFormatter(string.Formatter):
 
 class TextTemplate:
 
-    """Text placeholder."""
+    """Text placeholder.
 
-    __slots__ = ["machine", "text", "_change_callback"]
+    Texts without braces are static and returned without formatting.
+    """
+
+    __slots__ = ["machine", "text", "_change_callback", "_static"]
 
     def __init__(self, machine: "MachineController", text: str) -> None:
         """Initialize placeholder."""
         self.machine = machine
         self.text = str(text)
         self._change_callback = None
+        self._static = "{" not in self.text and "}" not in self.text
 
     def evaluate(self, parameters) -> str:
         """Evaluate placeholder to string."""
+        if self._static:
+            return self.text
         try:
             f = MpfFormatter(self.machine, parameters, False)
             return f.format(self.text)
@@ -274,6 +280,8 @@ class TextTemplate:
 
     def evaluate_and_subscribe(self, parameters) -> Tuple[str, asyncio.Future]:
         """Evaluate placeholder to string and subscribe to changes."""
+        if self._static:
+            return self.text, asyncio.Future()
         f = MpfFormatter(self.machine, parameters, True)
         value = f.format(self.text)
         subscriptions = f.subscriptions
@@ -878,7 +886,7 @@ class BasePlaceholderManager(MpfController):
         future = asyncio.ensure_future(future)
         return value, future
 
-    @lru_cache(typed=True)
+    @cached("conditional_templates", 1024, typed=True)
     def parse_conditional_template(self, template, default_number=None):
         """Parse a template for condition and number and return a dict."""
         # The following regex will make a dict for event name, condition, and number
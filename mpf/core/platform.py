@@ -104,6 +104,14 @@ class BasePlatform(LogMixin, metaclass=abc.ABCMeta):
     async def start(self):
         """Start receiving switch changes from this platform."""
 
+    def get_init_dependencies(self) -> Optional[List[str]]:
+        """Return the names of platforms which have to be initialized and started before this platform.
+
+        None (the default) initializes and starts the platform after all platforms which were loaded before it.
+        Platforms which only talk to their own hardware return a list (usually empty) and run in parallel to others.
+        """
+        return None
+
     def tick(self):
         """Run task.
 
@@ -1,6 +1,7 @@
 """Contains the Player class which represents a player in a pinball game."""
 import copy
 import logging
+from functools import partial
 
 from mpf.core.utility_functions import Util
 
@@ -74,6 +75,14 @@ class Player:
     ``player_score`` with Args: ``value=500, change=500, prev_value=0``
     ``player_score`` with Args: ``value=1200, change=700, prev_value=500``
 
+    Once the machine has started, changes are batched by the variable batcher.
+    If the three lines above run in the same event handler, only one event
+    is posted after all queued events have been processed:
+
+    ``player_score`` with Args: ``value=1200, change=1200, prev_value=0``
+
+    Variables listed in ``unbatched_player_vars`` in the
+    ``variable_batching:`` section post an event for every change.
     """
 
     monitor_enabled = False
@@ -218,7 +227,9 @@ class Player:
 
         This event is posted for a single player variable changing, meaning
         if multiple player variables change at the same time, multiple
-        events will be posted, one for each change.
+        events will be posted, one for each variable. Multiple changes of
+        one variable while processing the event queue are combined into one
+        event unless the variable is listed in unbatched_player_vars.
 
         args:
 
@@ -286,7 +297,14 @@ class Player:
             self.log.debug("Setting '%s' to: %s, (prior: %s, change: %s)",
                            name, self.vars[name], prev_value, change)
 
-            if self._events_enabled:
+            if not self._events_enabled:
+                return
+            batcher = self.machine.variable_batcher
+            if batcher.is_player_var_batched(name):
+                batcher.add_change(("player", self.vars['number'], name), prev_value, value, kwargs,
+                                   partial(self._send_variable_event, name, player_num=self.vars['number']),
+                                   new_entry)
+            else:
                 self._send_variable_event(name, self.vars[name], prev_value, change, self.vars['number'], **kwargs)
 
     def __getitem__(self, name):
@@ -0,0 +1,235 @@
+"""Opt-in profiler for event handlers, switch handlers, delays and show steps."""
+import json
+from bisect import bisect_left
+from functools import partial
+from random import random
+from time import perf_counter
+
+from typing import Dict, List, Optional
+
+from mpf.core.mpf_controller import MpfController
+
+MYPY = False
+if MYPY:   # pragma: no cover
+    from mpf.core.machine import MachineController      # pylint: disable-msg=cyclic-import,unused-import
+    from mpf.core.startup_profiler import StartupProfiler   # pylint: disable-msg=cyclic-import,unused-import
+
+# upper bounds of all histogram buckets in ms. the last bucket catches everything above
+HISTOGRAM_BUCKETS_MS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, float("inf"))
+
+
+class LatencyHistogram:
+
+    """Histogram of durations with fixed buckets."""
+
+    __slots__ = ["count", "total", "max", "buckets"]
+
+    def __init__(self) -> None:
+        """Initialize empty histogram."""
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.buckets = [0] * len(HISTOGRAM_BUCKETS_MS)
+
+    def add(self, duration_ms: float) -> None:
+        """Add a sample in ms."""
+        self.count += 1
+        self.total += duration_ms
+        if duration_ms > self.max:
+            self.max = duration_ms
+        self.buckets[bisect_left(HISTOGRAM_BUCKETS_MS, duration_ms)] += 1
+
+    def percentile(self, percent: float) -> float:
+        """Return the upper bound of the bucket which contains the percentile.
+
+        The result is capped at the largest sample.
+        """
+        if not self.count:
+            return 0.0
+        needed = self.count * percent / 100
+        seen = 0
+        for bucket_max, bucket_count in zip(HISTOGRAM_BUCKETS_MS, self.buckets):
+            seen += bucket_count
+            if seen >= needed:
+                return min(bucket_max, self.max)
+        return self.max     # pragma: no cover
+
+    def to_dict(self) -> dict:
+        """Return histogram as simple dict."""
+        return {
+            "count": self.count,
+            "total_ms": round(self.total, 3),
+            "avg_ms": round(self.total / self.count, 3) if self.count else 0.0,
+            "max_ms": round(self.max, 3),
+            "p50_ms": round(self.percentile(50), 3),
+            "p95_ms": round(self.percentile(95), 3),
+            "p99_ms": round(self.percentile(99), 3),
+            "buckets": {str(bucket_max): bucket_count for bucket_max, bucket_count in
+                        zip(HISTOGRAM_BUCKETS_MS, self.buckets) if bucket_count}
+        }
+
+
+class Profiler(MpfController):
+
+    """Records wall time histograms of events and handlers and samples loop lag.
+
+    The profiler is disabled by default. When enabled, it attaches itself to the event manager. Event handlers, switch
+    handlers, delay callbacks and show steps are then timed. With a sample_rate below 1.0 every event, switch
+    change, delay and show step is timed with that probability so it can stay enabled in production. Sampling is
+    random so periodic events cannot alias with the sample rate.
+    """
+
+    config_name = "profiler"
+
+    __slots__ = ["config", "enabled", "stats", "slow_calls", "sample_rate", "_slow_threshold",
+                 "_loop_lag_handle", "_report_task"]
+
+    def __init__(self, machine: "MachineController") -> None:
+        """Initialize profiler."""
+        super().__init__(machine)
+        self.machine.validate_machine_config_section('profiler')
+        self.config = self.machine.config['profiler']
+        self.enabled = self.config['enabled']
+        self.stats = {}             # type: Dict[str, Dict[str, LatencyHistogram]]
+        self.slow_calls = 0
+        self.sample_rate = max(min(self.config['sample_rate'], 1.0), 0.0001)
+        self._slow_threshold = self.config['slow_handler_threshold']
+        self._loop_lag_handle = None
+        self._report_task = None
+
+        if not self.enabled:
+            return
+
+        # switch controller, delay managers and running shows use the profiler of the event manager
+        self.machine.events.profiler = self
+        self.machine.events.add_handler("init_phase_5", self._start)
+        self.machine.events.add_handler("shutdown", self._stop)
+        self.machine.events.add_handler("debug_dump_stats", self._dump_stats)
+
+    def _start(self, **kwargs):
+        """Start loop lag sampling and reporting."""
+        del kwargs
+        if self.config['loop_lag_interval']:
+            self._schedule_loop_lag_sample()
+        if self.config['report_interval']:
+            self._report_task = self.machine.clock.schedule_interval(self.send_stats_to_monitors,
+                                                                     self.config['report_interval'] / 1000)
+
+    def _stop(self, **kwargs):
+        """Stop loop lag sampling and reporting."""
+        del kwargs
+        if self._loop_lag_handle:
+            self._loop_lag_handle.cancel()
+            self._loop_lag_handle = None
+        if self._report_task:
+            self.machine.clock.unschedule(self._report_task)
+            self._report_task = None
+
+    def _schedule_loop_lag_sample(self):
+        interval = self.config['loop_lag_interval'] / 1000
+        expected = self.machine.clock.loop.time() + interval
+        self._loop_lag_handle = self.machine.clock.loop.call_at(expected, self._sample_loop_lag, expected)
+
+    def _sample_loop_lag(self, expected):
+        """Record how late this callback ran and schedule the next sample."""
+        self.add_sample("loop_lag", "loop", max(self.machine.clock.loop.time() - expected, 0.0))
+        self._schedule_loop_lag_sample()
+
+    def should_sample(self) -> bool:
+        """Return true if the next call should be timed."""
+        return self.sample_rate >= 1.0 or random() < self.sample_rate     # nosec
+
+    @staticmethod
+    def callback_name(callback) -> str:
+        """Return a readable name for a callback."""
+        while isinstance(callback, partial):
+            callback = callback.func
+        name = getattr(callback, "__qualname__", None) or repr(callback)
+        instance = getattr(callback, "__self__", None)
+        instance_name = getattr(instance, "name", None)
+        if isinstance(instance_name, str):
+            name = "{}({})".format(name, instance_name)
+        return name
+
+    def add_sample(self, category: str, name: str, duration: float) -> None:
+        """Record a duration in seconds."""
+        duration_ms = duration * 1000
+        try:
+            histogram = self.stats[category][name]
+        except KeyError:
+            histogram = self.stats.setdefault(category, {}).setdefault(name, LatencyHistogram())
+        histogram.add(duration_ms)
+
+        if duration_ms >= self._slow_threshold and category != "event":
+            self.slow_calls += 1
+            self.warning_log("Slow %s: %s took %.2fms", category, name, duration_ms)
+
+    def time_call(self, category: str, name: str, callback, kwargs: dict):
+        """Call callback with kwargs and record its duration."""
+        start = perf_counter()
+        try:
+            return callback(**kwargs)
+        finally:
+            self.add_sample(category, name, perf_counter() - start)
+
+    def get_stats(self, limit: Optional[int] = None) -> Dict[str, List[dict]]:
+        """Return stats per category sorted by total time."""
+        stats = {}
+        for category, histograms in self.stats.items():
+            entries = sorted(histograms.items(), key=lambda x: x[1].total, reverse=True)
+            if limit:
+                entries = entries[:limit]
+            stats[category] = [dict(name=name, **histogram.to_dict()) for name, histogram in entries]
+        return stats
+
+    def reset(self) -> None:
+        """Clear all recorded samples."""
+        self.stats = {}
+        self.slow_calls = 0
+
+    def send_stats_to_monitors(self) -> None:
+        """Send stats to all BCP clients which monitor the profiler."""
+        if not self.machine.bcp.transport.get_transports_for_handler("_profiler"):
+            return
+        self.machine.bcp.transport.send_to_clients_with_handler(
+            handler="_profiler", bcp_command="profiler_stats", slow_calls=self.slow_calls,
+            stats=self.get_stats(limit=25))
+
+    def report_startup(self, startup_profiler: "StartupProfiler") -> None:
+        """Log the slowest startup steps, write the startup report and send it to monitors."""
+        self.info_log("Startup took %.0fms. Slowest steps: %s", startup_profiler.total_ms,
+                      ", ".join("{}: {} ({:.0f}ms)".format(entry["category"], entry["name"], entry["duration_ms"])
+                                for entry in startup_profiler.get_slowest(5)))
+        if self.config['startup_report_file']:
+            startup_profiler.dump(self.config['startup_report_file'])
+            self.info_log("Startup report written to %s", self.config['startup_report_file'])
+        self.send_startup_report_to_monitors()
+
+    def send_startup_report_to_monitors(self, client=None) -> None:
+        """Send the startup report to a client or to all BCP clients which monitor the profiler."""
+        report = self.machine.startup_profiler.get_report()
+        if client:
+            self.machine.bcp.transport.send_to_client(client, "startup_profile", **report)
+        elif self.machine.bcp.transport.get_transports_for_handler("_profiler"):
+            self.machine.bcp.transport.send_to_clients_with_handler(
+                handler="_profiler", bcp_command="startup_profile", **report)
+
+    def dump(self, filename: str) -> None:
+        """Write all stats as JSON to a file."""
+        with open(filename, "w", encoding="utf-8") as f:
+            json.dump({"slow_calls": self.slow_calls, "sample_rate": self.sample_rate,
+                       "stats": self.get_stats()}, f, indent=2)
+
+    def _dump_stats(self, **kwargs):
+        del kwargs
+        self.info_log("--- DEBUG DUMP PROFILER ---")
+        self.info_log("Slow calls: %s. Sample rate: %s.", self.slow_calls, self.sample_rate)
+        for category, entries in self.get_stats(limit=10).items():
+            self.info_log("Top %s:", category)
+            for entry in entries:
+                self.info_log("  %s: count: %s avg: %sms p95: %sms max: %sms", entry["name"], entry["count"],
+                              entry["avg_ms"], entry["p95_ms"], entry["max_ms"])
+        if self.config['dump_file']:
+            self.dump(self.config['dump_file'])
+            self.info_log("Profiler stats written to %s", self.config['dump_file'])
+        self.info_log("--- DEBUG DUMP PROFILER END ---")
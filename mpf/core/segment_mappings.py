@@ -7,8 +7,9 @@ BCD were created by us.
 """
 from typing import Dict, Union, List, Tuple
 
+from mpf.core.cache import BoundedCache
 from mpf.core.rgb_color import NAMED_RGB_COLORS
-from mpf.devices.segment_display.segment_display_text import SegmentDisplayText
+from mpf.devices.segment_display.segment_display_text import SegmentDisplayText, get_colors_key
 
 MYPY = False
 if MYPY:   # pragma: no cover
@@ -17,11 +18,27 @@ if MYPY:   # pragma: no cover
 
 class TextToSegmentMapper:
 
-    """Helper to map text to segments."""
+    """Helper to map text to segments.
+
+    Segment display texts are mapped once per text, width and mapping. The results are cached and a copy is returned.
+    """
+
+    _cache = BoundedCache("segment_mappings", 1024)
 
     @classmethod
     def map_segment_text_to_segments(cls, text: SegmentDisplayText, display_width, segment_mapping) -> List["Segment"]:
         """Map a segment display text to a certain display mapping."""
+        # mappings are module level constants so their id is stable
+        key = (id(segment_mapping), display_width, tuple((char.char_code, char.dot) for char in text))
+        segments = cls._cache.get(key)
+        if segments is None:
+            segments = tuple(cls._map_segment_text_to_segments(text, display_width, segment_mapping))
+            cls._cache.put(key, segments)
+        return list(segments)
+
+    @classmethod
+    def _map_segment_text_to_segments(cls, text: SegmentDisplayText, display_width, segment_mapping) -> \
+            List["Segment"]:
         segments = []
         for char in text:
             mapping = segment_mapping.get(char.char_code, segment_mapping[None])
@@ -43,6 +60,17 @@ class TextToSegmentMapper:
     def map_segment_text_to_segments_with_color(cls, text: SegmentDisplayText, display_width, segment_mapping) ->\
             List[Tuple["Segment", "RGBColor"]]:
         """Map a segment display text to a certain display mapping."""
+        key = (id(segment_mapping), display_width, tuple((char.char_code, char.dot) for char in text),
+               get_colors_key(char.color for char in text))
+        segments = cls._cache.get(key)
+        if segments is None:
+            segments = tuple(cls._map_segment_text_to_segments_with_color(text, display_width, segment_mapping))
+            cls._cache.put(key, segments)
+        return list(segments)
+
+    @classmethod
+    def _map_segment_text_to_segments_with_color(cls, text: SegmentDisplayText, display_width, segment_mapping) ->\
+            List[Tuple["Segment", "RGBColor"]]:
         segments = []
         for char in text:
             mapping = segment_mapping.get(char.char_code, segment_mapping[None])
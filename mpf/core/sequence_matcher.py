@@ -0,0 +1,163 @@
+"""Shared matcher for all sequence shots."""
+import heapq
+from collections import namedtuple, deque
+from typing import Dict, List, Tuple, Deque, Optional
+
+from mpf.core.mpf_controller import MpfController
+
+MYPY = False
+if MYPY:   # pragma: no cover
+    from mpf.core.machine import MachineController      # pylint: disable-msg=cyclic-import,unused-import
+    from mpf.core.events import EventHandlerKey     # pylint: disable-msg=cyclic-import,unused-import
+    from mpf.devices.sequence_shot import SequenceShot     # pylint: disable-msg=cyclic-import,unused-import
+
+ActiveSequence = namedtuple("ActiveSequence", ["id", "current_position_index", "next_event"])
+
+
+class SequenceMatcher(MpfController):
+
+    """Matches events against the sequences of all enabled sequence shots.
+
+    Every event in any sequence has one event handler. Each event is indexed to the sequence shots which start with it
+    or contain it, and running sequences are indexed by the event they wait for. A hit therefore only touches the
+    sequences which can advance. All sequence timeouts share one loop timer.
+    """
+
+    config_name = "sequence_matcher"
+
+    __slots__ = ["_shots_by_event", "_event_handler_keys", "_active_sequences", "_waiting", "_timeouts",
+                 "_timeout_handle", "_timeout_time", "_next_sequence_id"]
+
+    def __init__(self, machine: "MachineController") -> None:
+        """Initialize sequence matcher."""
+        super().__init__(machine)
+        # event -> sequence shots which contain the event and whether it is their first event
+        self._shots_by_event = {}       # type: Dict[str, Dict[SequenceShot, bool]]
+        self._event_handler_keys = {}   # type: Dict[str, EventHandlerKey]
+        # running sequences per shot in the order they advanced last
+        self._active_sequences = {}     # type: Dict[SequenceShot, Dict[int, ActiveSequence]]
+        # ids of running sequences per shot and the event they wait for (may contain finished ids)
+        self._waiting = {}              # type: Dict[Tuple[SequenceShot, str], Deque[int]]
+        # heap of (timeout, sequence id, shot)
+        self._timeouts = []             # type: List[Tuple[float, int, SequenceShot]]
+        self._timeout_handle = None
+        self._timeout_time = None       # type: Optional[float]
+        self._next_sequence_id = 0
+
+    def add_sequence_shot(self, shot: "SequenceShot") -> None:
+        """Start matching the sequence of a shot."""
+        for index, event in enumerate(shot.sequence_events):
+            shots = self._shots_by_event.get(event)
+            if shots is None:
+                shots = self._shots_by_event[event] = {}
+                self._event_handler_keys[event] = self.machine.events.add_handler(
+                    event, self._event_hit, priority=1, event_name=event)
+            if shot not in shots:
+                shots[shot] = index == 0
+
+    def remove_sequence_shot(self, shot: "SequenceShot") -> None:
+        """Stop matching the sequence of a shot and drop its running sequences."""
+        self.reset_sequences(shot)
+        for event in set(shot.sequence_events):
+            shots = self._shots_by_event.get(event)
+            if not shots or shot not in shots:
+                continue
+            del shots[shot]
+            if not shots:
+                del self._shots_by_event[event]
+                self.machine.events.remove_handler_by_key(self._event_handler_keys.pop(event))
+
+    def get_active_sequences(self, shot: "SequenceShot") -> List[ActiveSequence]:
+        """Return the running sequences of a shot."""
+        return list(self._active_sequences.get(shot, {}).values())
+
+    def reset_sequences(self, shot: "SequenceShot") -> None:
+        """Drop all running sequences of a shot."""
+        self._active_sequences.pop(shot, None)
+        for event in shot.sequence_events:
+            self._waiting.pop((shot, event), None)
+
+    def _event_hit(self, event_name, **kwargs):
+        del kwargs
+        for shot, is_first_event in list(self._shots_by_event.get(event_name, {}).items()):
+            shot.sequence_step_hit(event_name)
+
+            # an event which starts a sequence never advances one of the same shot
+            if is_first_event:
+                if len(shot.sequence_events) > 1:
+                    self._start_sequence(shot)
+                elif not shot.active_delays:
+                    # if it only has one step it will finish right away
+                    shot.sequence_completed()
+                continue
+
+            # only advance the oldest sequence which waits for this event
+            waiting = self._waiting.get((shot, event_name))
+            active_sequences = self._active_sequences.get(shot)
+            while waiting:
+                sequence = active_sequences.get(waiting.popleft())
+                if sequence and sequence.next_event == event_name:
+                    self._advance_sequence(shot, sequence)
+                    break
+
+    def _start_sequence(self, shot: "SequenceShot"):
+        # If the sequence hasn't started, make sure we're not within the delay_switch hit window
+        if shot.active_delays:
+            shot.debug_log("There's a delay timer in effect from %s. Sequence will not be started.",
+                           shot.active_delays)
+            return
+
+        shot.sequence_started()
+        self._next_sequence_id += 1
+        sequence = ActiveSequence(self._next_sequence_id, 0, shot.sequence_events[1])
+        self._add_active_sequence(shot, sequence)
+
+        timeout = shot.config['sequence_timeout']
+        if timeout:
+            shot.debug_log("Setting up a sequence timer for %sms", timeout)
+            heapq.heappush(self._timeouts, (self.machine.clock.get_time() + timeout / 1000, sequence.id, shot))
+            self._schedule_timeout()
+
+    def _add_active_sequence(self, shot: "SequenceShot", sequence: ActiveSequence):
+        self._active_sequences.setdefault(shot, {})[sequence.id] = sequence
+        waiting = self._waiting.get((shot, sequence.next_event))
+        if waiting is None:
+            waiting = self._waiting[(shot, sequence.next_event)] = deque()
+        waiting.append(sequence.id)
+
+    def _advance_sequence(self, shot: "SequenceShot", sequence: ActiveSequence):
+        del self._active_sequences[shot][sequence.id]
+
+        if sequence.current_position_index == len(shot.sequence_events) - 2:
+            shot.debug_log("Sequence complete!")
+            # the timeout of this sequence will be ignored
+            shot.sequence_completed()
+            return
+
+        current_position_index = sequence.current_position_index + 1
+        next_event = shot.sequence_events[current_position_index + 1]
+        shot.debug_log("Advancing the sequence. Next: %s", next_event)
+        self._add_active_sequence(shot, ActiveSequence(sequence.id, current_position_index, next_event))
+
+    def _schedule_timeout(self):
+        """Make sure the loop timer fires at the next timeout."""
+        if not self._timeouts:
+            return
+        next_timeout = self._timeouts[0][0]
+        if self._timeout_handle and self._timeout_time <= next_timeout:
+            return
+        if self._timeout_handle:
+            self._timeout_handle.cancel()
+        self._timeout_time = next_timeout
+        self._timeout_handle = self.machine.clock.loop.call_at(next_timeout, self._process_timeouts)
+
+    def _process_timeouts(self):
+        self._timeout_handle = None
+        self._timeout_time = None
+        now = self.machine.clock.get_time()
+        while self._timeouts and self._timeouts[0][0] <= now:
+            _, sequence_id, shot = heapq.heappop(self._timeouts)
+            active_sequences = self._active_sequences.get(shot)
+            if active_sequences and active_sequences.pop(sequence_id, None):
+                shot.sequence_timed_out(sequence_id)
+        self._schedule_timeout()
@@ -0,0 +1,77 @@
+"""Records the duration of all startup steps of the machine."""
+import json
+from contextlib import contextmanager
+from functools import partial
+from time import perf_counter
+
+from typing import Dict, List, Optional
+
+from mpf.core.profiler import Profiler
+
+
+class StartupProfiler:
+
+    """Record how long every phase, init handler and platform took during startup.
+
+    Entries are recorded with a category (e.g. "phase", "core_module", "platform_initialize" or the name of the init
+    phase for init handlers), a name, the start offset since the profiler was created and the duration. The machine
+    finishes the profiler once all boot holds are cleared.
+    """
+
+    __slots__ = ["start_time", "end_time", "entries"]
+
+    def __init__(self) -> None:
+        """Initialize profiler and start the clock."""
+        self.start_time = perf_counter()
+        self.end_time = None    # type: Optional[float]
+        self.entries = []       # type: List[dict]
+
+    def add(self, category: str, name: str, start: float, duration: float) -> None:
+        """Add an entry with start (from perf_counter) and duration in seconds."""
+        self.entries.append({"category": category, "name": name,
+                             "start_ms": round((start - self.start_time) * 1000, 3),
+                             "duration_ms": round(duration * 1000, 3)})
+
+    @contextmanager
+    def measure(self, category: str, name: str):
+        """Record the duration of the with block."""
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self.add(category, name, start, perf_counter() - start)
+
+    def finish(self) -> None:
+        """Stop the clock."""
+        self.end_time = perf_counter()
+
+    @property
+    def total_ms(self) -> float:
+        """Return the time since start until finish (or now) in ms."""
+        end_time = self.end_time if self.end_time is not None else perf_counter()
+        return round((end_time - self.start_time) * 1000, 3)
+
+    def get_slowest(self, limit: int = 10) -> List[dict]:
+        """Return the slowest entries which are not phases."""
+        entries = [entry for entry in self.entries if entry["category"] != "phase"]
+        return sorted(entries, key=lambda x: x["duration_ms"], reverse=True)[:limit]
+
+    def get_report(self) -> Dict:
+        """Return all entries in the order they finished and the slowest steps."""
+        return {"total_ms": self.total_ms,
+                "phases": [entry for entry in self.entries if entry["category"] == "phase"],
+                "slowest": self.get_slowest(),
+                "entries": self.entries}
+
+    def dump(self, filename: str) -> None:
+        """Write the report as JSON to a file."""
+        with open(filename, "w", encoding="utf-8") as f:
+            json.dump(self.get_report(), f, indent=2)
+
+    @staticmethod
+    def handler_name(callback) -> str:
+        """Return a readable name for an event handler and unwrap async handlers."""
+        if isinstance(callback, partial) and callback.args and \
+                getattr(callback.func, "__name__", None) == "_async_handler_coroutine":
+            callback = callback.args[0]
+        return Profiler.callback_name(callback)
@@ -482,6 +482,10 @@ class SwitchController(MpfController):
             self._timed_switch_handler_delay[switch] = (handler, next_event_time)
 
     def _call_handlers(self, switch, state):
+        profiler = self.machine.events.profiler
+        if profiler and not profiler.should_sample():
+            profiler = None
+
         for entry in self.registered_switches[switch][state][:]:  # generator?
             # Found an entry.
 
@@ -501,6 +505,8 @@ class SwitchController(MpfController):
                     self.debug_log(
                         "Found timed switch handler for k/v %s / %s",
                         key, value)
+            elif profiler:
+                profiler.time_call("switch_handler", profiler.callback_name(entry.callback), entry.callback, {})
             else:
                 # This entry doesn't have a timed delay, so do the action
                 # now
@@ -2,27 +2,25 @@
 from collections import defaultdict
 
 from datetime import datetime
-from psutil import cpu_percent, virtual_memory, Process
 
 import mpf._version
 from mpf.core.delays import DelayManager
 from mpf.core.mpf_controller import MpfController
 
-try:
-    from asciimatics.scene import Scene
-    from asciimatics.widgets import Frame, Layout, Label, Divider, PopUpDialog, Widget
-    from asciimatics.widgets.utilities import THEMES
-    from asciimatics.screen import Screen
-except ImportError:
-    Scene = None
-    Frame = None
-    Layout = object
-    THEMES = None
-    Label = None
-    Divider = None
-    PopUpDialog = None
-    Widget = None
-    Screen = None
+# asciimatics and psutil are slow to import. they are imported by _import_ui_modules when the text UI is enabled
+Scene = None
+Frame = None
+Layout = None
+THEMES = None
+Label = None
+Divider = None
+PopUpDialog = None
+Widget = None
+Screen = None
+MpfLayout = None
+cpu_percent = None
+virtual_memory = None
+Process = None
 
 MYPY = False
 if MYPY:   # pragma: no cover
@@ -33,30 +31,21 @@ if MYPY:   # pragma: no cover
     from mpf.devices.switch import Switch   # pylint: disable-msg=cyclic-import,unused-import,ungrouped-imports
 
 
-class MpfLayout(Layout):
-
-    """Add clear function."""
-
-    def __init__(self, columns, fill_frame=False):
-        """Store max_height."""
-        self._columns = []
-        super().__init__(columns, fill_frame)
-        self.max_height = None
-
-    def clear_columns(self):
-        """Clear all columns."""
-        self._columns = [[] for _ in self._columns]
-
-    def set_max_height(self, max_height):
-        """Set max height."""
-        self.max_height = max_height
-
-    def fix(self, start_x, start_y, max_width, max_height):
-        """Limit height."""
-        if self.max_height:
-            return min(super().fix(start_x, start_y, max_width, max_height), self.max_height)
-
-        return super().fix(start_x, start_y, max_width, max_height)
+def _import_ui_modules() -> bool:
+    """Import asciimatics and psutil into this module. Return false if asciimatics is not installed."""
+    # pylint: disable-msg=global-statement,import-outside-toplevel,invalid-name,redefined-outer-name
+    global Scene, Frame, Layout, THEMES, Label, Divider, PopUpDialog, Widget, Screen, MpfLayout
+    global cpu_percent, virtual_memory, Process
+    try:
+        from asciimatics.scene import Scene
+        from asciimatics.widgets import Frame, Layout, Label, Divider, PopUpDialog, Widget
+        from asciimatics.widgets.utilities import THEMES
+        from asciimatics.screen import Screen
+        from mpf.core.text_ui_layout import MpfLayout
+    except ImportError:
+        return False
+    from psutil import cpu_percent, virtual_memory, Process
+    return True
 
 
 # pylint: disable-msg=too-many-instance-attributes
@@ -79,7 +68,7 @@ class TextUi(MpfController):
 
         self.screen = None
 
-        if not machine.options['text_ui'] or not Scene:
+        if not machine.options['text_ui'] or not _import_ui_modules():
             self.log.debug("Text UI is disabled. TUI option setting: %s, Asciimatics loaded: %s",
                            machine.options['text_ui'], Scene)
             return
@@ -0,0 +1,31 @@
+"""Asciimatics layout of the text UI.
+
+This module is only imported when the text UI is enabled because asciimatics is slow to import.
+"""
+from asciimatics.widgets import Layout
+
+
+class MpfLayout(Layout):
+
+    """Add clear function."""
+
+    def __init__(self, columns, fill_frame=False):
+        """Store max_height."""
+        self._columns = []
+        super().__init__(columns, fill_frame)
+        self.max_height = None
+
+    def clear_columns(self):
+        """Clear all columns."""
+        self._columns = [[] for _ in self._columns]
+
+    def set_max_height(self, max_height):
+        """Set max height."""
+        self.max_height = max_height
+
+    def fix(self, start_x, start_y, max_width, max_height):
+        """Limit height."""
+        if self.max_height:
+            return min(super().fix(start_x, start_y, max_width, max_height), self.max_height)
+
+        return super().fix(start_x, start_y, max_width, max_height)
@@ -642,6 +642,22 @@ class Util:
         m = getattr(m, parts[-1:][0])
         return m
 
+    @staticmethod
+    def get_entry_points(group: str, name: Optional[str] = None) -> list:
+        """Return all installed entry points of a group or only the ones with a certain name.
+
+        The entry points are not loaded. Call load() on them to import the referenced object.
+        """
+        # importlib.metadata is slow to import and only needed if we look for entry points
+        # pylint: disable-msg=import-outside-toplevel
+        from importlib.metadata import entry_points
+        try:
+            group_entry_points = entry_points(group=group)
+        except TypeError:   # pragma: no cover
+            # Python 3.8 and 3.9 return a dict of all groups
+            group_entry_points = entry_points().get(group, [])
+        return [entry_point for entry_point in group_entry_points if name is None or entry_point.name == name]
+
     @staticmethod
     def get_from_dict(dic, key_path):
         """Get a value from a nested dict (or dict-like object) from an iterable of key paths.
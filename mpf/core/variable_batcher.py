@@ -0,0 +1,103 @@
+"""Batches player and machine variable change notifications."""
+from typing import Any, Callable, Dict, Hashable, List
+
+from mpf.core.mpf_controller import MpfController
+
+MYPY = False
+if MYPY:   # pragma: no cover
+    from mpf.core.machine import MachineController      # pylint: disable-msg=cyclic-import,unused-import
+
+
+class PendingChange:
+
+    """Changes of one variable since the last flush."""
+
+    __slots__ = ["prev_value", "value", "kwargs", "callback", "new_entry"]
+
+    def __init__(self, prev_value, value, kwargs: dict, callback: Callable[..., None], new_entry: bool) -> None:
+        """Initialize pending change."""
+        self.prev_value = prev_value
+        self.value = value
+        self.kwargs = kwargs
+        self.callback = callback
+        self.new_entry = new_entry
+
+
+class VariableBatcher(MpfController):
+
+    """Collects variable changes during one run of the event queue and notifies once per variable.
+
+    When the event queue is drained, the callback of every changed variable is called once with the final value, the
+    value before the first change and the accumulated change. Kwargs of all changes are merged and later changes win.
+    Variables which went back to their previous value are only notified if they were created in this run. Variables
+    listed in unbatched_player_vars or unbatched_machine_vars are notified on every change. Batching starts after
+    reset_complete.
+    """
+
+    config_name = "variable_batcher"
+
+    __slots__ = ["enabled", "unbatched_player_vars", "unbatched_machine_vars", "_pending"]
+
+    def __init__(self, machine: "MachineController") -> None:
+        """Initialize variable batcher."""
+        super().__init__(machine)
+        self.machine.validate_machine_config_section('variable_batching')
+        config = self.machine.config['variable_batching']
+        # changes during startup are not batched so handlers added while initializing do not see earlier changes
+        self.enabled = False
+        self.unbatched_player_vars = set(config['unbatched_player_vars'])
+        self.unbatched_machine_vars = set(config['unbatched_machine_vars'])
+        self._pending = {}      # type: Dict[Hashable, PendingChange]
+        if config['enabled']:
+            self.machine.events.add_handler("reset_complete", self._enable)
+
+    def _enable(self, **kwargs):
+        del kwargs
+        self.enabled = True
+
+    def is_player_var_batched(self, name: str) -> bool:
+        """Return true if changes of a player var are batched."""
+        return self.enabled and name not in self.unbatched_player_vars
+
+    def is_machine_var_batched(self, name: str) -> bool:
+        """Return true if changes of a machine var are batched."""
+        return self.enabled and name not in self.unbatched_machine_vars
+
+    # pylint: disable-msg=too-many-arguments
+    def add_change(self, key: Hashable, prev_value, value, kwargs: dict, callback: Callable[..., None],
+                   new_entry: bool = False) -> None:
+        """Add a change of the variable identified by key.
+
+        Callback is called with value, prev_value, change and kwargs when the event queue is drained.
+        """
+        pending = self._pending.get(key)
+        if pending:
+            pending.value = value
+            pending.kwargs.update(kwargs)
+            return
+
+        if not self._pending:
+            self.machine.events.call_when_drained(self.flush)
+        self._pending[key] = PendingChange(prev_value, value, dict(kwargs), callback, new_entry)
+
+    def get_pending(self) -> List[Hashable]:
+        """Return the keys of all variables with pending changes."""
+        return list(self._pending)
+
+    def flush(self) -> None:
+        """Notify all pending changes."""
+        pending_changes = self._pending
+        self._pending = {}
+        for pending in pending_changes.values():
+            change = self.get_change(pending.prev_value, pending.value)
+            if change or pending.new_entry:
+                pending.callback(value=pending.value, prev_value=pending.prev_value, change=change,
+                                 **pending.kwargs)
+
+    @staticmethod
+    def get_change(prev_value, value) -> Any:
+        """Return the difference between two values or whether a non numeric value changed."""
+        try:
+            return value - prev_value
+        except TypeError:
+            return prev_value != value
@@ -1,9 +1,10 @@
 """Contains the Light class."""
 import asyncio
 
+from bisect import bisect_left
 from functools import partial
 
-from typing import Set, Dict, List, Tuple, Any
+from typing import Set, Dict, List, Tuple, Any, Optional
 
 from mpf.core.delays import DelayManager
 
@@ -47,6 +48,75 @@ class LightStackEntry:
             self.key, self.start_color, self.start_time, self.dest_color, self.dest_time, self.priority)
 
 
+class LightStack:
+
+    """Stack entries of a light indexed by key and ordered by priority and key.
+
+    Index 0 is the entry with the highest priority. Entries with the same priority are ordered by key (highest
+    first). Every key is only once in the stack. Entries are kept in ascending order internally so adding and
+    removing an entry is a binary search and the top entry is the last element.
+    """
+
+    __slots__ = ["_sort_keys", "_entries", "_by_key"]
+
+    def __init__(self) -> None:
+        """Initialize empty stack."""
+        self._sort_keys = []    # type: List[Tuple[Any, str]]
+        self._entries = []      # type: List[LightStackEntry]
+        self._by_key = {}       # type: Dict[str, LightStackEntry]
+
+    def __len__(self):
+        """Return number of entries."""
+        return len(self._entries)
+
+    def __getitem__(self, index):
+        """Return entry at index (0 is the top) or a list of entries for a slice."""
+        if isinstance(index, slice):
+            return list(self)[index]
+        return self._entries[-1 - index]
+
+    def __iter__(self):
+        """Iterate entries from top to bottom."""
+        return reversed(self._entries)
+
+    def __repr__(self):
+        """Return string representation."""
+        return repr(list(self))
+
+    def get(self, key: str) -> Optional[LightStackEntry]:
+        """Return the entry with a key or None."""
+        return self._by_key.get(key)
+
+    def index(self, entry: LightStackEntry) -> int:
+        """Return the index of an entry in the stack (0 is the top)."""
+        return len(self._entries) - 1 - bisect_left(self._sort_keys, (entry.priority, entry.key))
+
+    def add(self, entry: LightStackEntry) -> None:
+        """Add an entry. An entry with the same key is replaced."""
+        if entry.key in self._by_key:
+            self.remove(entry.key)
+        sort_key = (entry.priority, entry.key)
+        position = bisect_left(self._sort_keys, sort_key)
+        self._sort_keys.insert(position, sort_key)
+        self._entries.insert(position, entry)
+        self._by_key[entry.key] = entry
+
+    def remove(self, key: str) -> Optional[LightStackEntry]:
+        """Remove and return the entry with a key."""
+        entry = self._by_key.pop(key, None)
+        if entry is not None:
+            position = bisect_left(self._sort_keys, (entry.priority, key))
+            del self._sort_keys[position]
+            del self._entries[position]
+        return entry
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._sort_keys.clear()
+        self._entries.clear()
+        self._by_key.clear()
+
+
 @DeviceMonitor(_color="color", _do_not_overwrite_setter=True)
 class Light(SystemWideDevice, DevicePositionMixin):
 
@@ -75,10 +145,10 @@ class Light(SystemWideDevice, DevicePositionMixin):
         self._last_fade_target = None
         self._rbgw_style = None  # RGBW LED will be white_only, min_rgb, duck_rgb. Others are None
 
-        self.stack = list()     # type: List[LightStackEntry]
-        """A list of dicts which represents different commands that have come
-        in to set this light to a certain color (and/or fade). Each entry in the
-        list contains the following key/value pairs:
+        self.stack = LightStack()   # type: LightStack
+        """A stack of entries which represent different commands that have come
+        in to set this light to a certain color (and/or fade). Index 0 is the
+        active entry. Each entry has the following attributes:
 
         priority:
             The relative priority of this color command. Higher numbers
@@ -473,15 +543,12 @@ class Light(SystemWideDevice, DevicePositionMixin):
         if self.stack:
             self._remove_from_stack_by_key(key)
 
-        self.stack.append(LightStackEntry(priority,
-                                          key,
-                                          start_time,
-                                          color_below,
-                                          dest_time,
-                                          color))
-
-        if len(self.stack) > 1:
-            self.stack.sort(reverse=True)
+        self.stack.add(LightStackEntry(priority,
+                                       key,
+                                       start_time,
+                                       color_below,
+                                       dest_time,
+                                       color))
 
         if self._debug:
             self.debug_log("+-------------- Adding to stack ----------------+")
@@ -514,43 +581,38 @@ class Light(SystemWideDevice, DevicePositionMixin):
 
         key = str(key)
 
-        priority = None
+        entry = self.stack.get(key)
+        # key not in stack
+        if entry is None:
+            return
+
+        index = self.stack.index(entry)
         color_changes = True
-        stack = []
-        for i, entry in enumerate(self.stack):
-            if entry.key == key:
-                stack = self.stack[i:]
-                priority = entry.priority
-                break
-            if entry.dest_color is not None:
+        for i in range(index):
+            if self.stack[i].dest_color is not None:
                 # no transparency above key
                 color_changes = False
-
-        # key not in stack
-        if not stack:
-            return
+                break
 
         # this is already a fadeout. do not fade out the fade out.
-        if stack[0].dest_color is None:
+        if entry.dest_color is None:
             fade_ms = None
 
         if fade_ms:
             # fade to underlying color
-            color_of_key = self._get_color_and_fade(stack, 0)[0]
+            color_of_key = self._get_color_and_fade(index, 0)[0]
 
             self._remove_from_stack_by_key(key)
 
             start_time = self.machine.clock.get_time()
-            self.stack.append(LightStackEntry(priority,
-                                              key,
-                                              start_time,
-                                              color_of_key,
-                                              start_time + fade_ms / 1000.0,
-                                              None))
+            self.stack.add(LightStackEntry(entry.priority,
+                                           key,
+                                           start_time,
+                                           color_of_key,
+                                           start_time + fade_ms / 1000.0,
+                                           None))
             self.delay.reset(ms=fade_ms, callback=partial(self._remove_fade_out, key=key),
                              name="remove_fade_{}".format(key))
-            if len(self.stack) > 1:
-                self.stack.sort(reverse=True)
         else:
             # no fade -> just remove color from stack
             self._remove_from_stack_by_key(key)
@@ -560,42 +622,37 @@ class Light(SystemWideDevice, DevicePositionMixin):
 
     def _remove_fade_out(self, key):
         """Remove a timed out fade out."""
-        if not self.stack:
+        entry = self.stack.get(key)
+        if entry is None or entry.dest_color is not None:
             return
 
-        found = False
         color_change = True
-        for _, entry in enumerate(self.stack):
-            if entry.key == key and entry.dest_color is None:
-                found = True
-                break
-            if entry.dest_color is not None:
+        for i in range(self.stack.index(entry)):
+            if self.stack[i].dest_color is not None:
                 # found entry above the removed which is non-transparent
                 color_change = False
+                break
 
-        if found:
-            if self._debug:
-                self.debug_log("Removing fadeout for key '%s' from stack", key)
-            self.stack = [x for x in self.stack if x.key != key or x.dest_color is not None]
+        if self._debug:
+            self.debug_log("Removing fadeout for key '%s' from stack", key)
+        self.stack.remove(key)
 
-        if found and color_change:
+        if color_change:
             self._schedule_update()
 
     def _remove_from_stack_by_key(self, key):
         """Remove a key from stack."""
-        # tune the common case
         if not self.stack:
             return
         if self._debug:
             self.debug_log("Removing key '%s' from stack", key)
-        if len(self.stack) == 1:
-            if self.stack[0].key == key:
-                self.stack = []
-        else:
-            self.stack = [x for x in self.stack if x.key != key]
+        self.stack.remove(key)
 
     def _schedule_update(self):
-        start_color, start_time, target_color, target_time = self._get_color_and_target_time(self.stack)
+        if self.machine.light_controller.monitor_enabled:
+            self.machine.light_controller.mark_dirty(self)
+
+        start_color, start_time, target_color, target_time = self._get_color_and_target_time(0)
 
         # check if our fade target really changed
         if (start_color, start_time, target_color, target_time) == self._last_fade_target:
@@ -663,7 +720,7 @@ class Light(SystemWideDevice, DevicePositionMixin):
 
     def clear_stack(self):
         """Remove all entries from the stack and resets this light to 'off'."""
-        self.stack = []
+        self.stack.clear()
 
         if self._debug:
             self.debug_log("Clearing Stack")
@@ -671,14 +728,8 @@ class Light(SystemWideDevice, DevicePositionMixin):
         self._schedule_update()
 
     def _get_priority_from_key(self, key):
-        if not self.stack:
-            return 0
-        if self.stack[0].key == key:
-            return self.stack[0].priority
-        try:
-            return [x for x in self.stack if x.key == key][0].priority
-        except IndexError:
-            return 0
+        entry = self.stack.get(key)
+        return entry.priority if entry else 0
 
     def gamma_correct(self, color):
         """Apply max brightness correction to color.
@@ -719,9 +770,10 @@ class Light(SystemWideDevice, DevicePositionMixin):
 
         return self._color_correction_profile.apply(color)
 
-    def _get_color_and_target_time(self, stack) -> Tuple[RGBColor, int, RGBColor, int]:
+    def _get_color_and_target_time(self, index: int) -> Tuple[RGBColor, int, RGBColor, int]:
+        """Return start and target of the fade of the stack from index downwards."""
         try:
-            color_settings = stack[0]
+            color_settings = self.stack[index]
         except IndexError:
             # no stack
             return self._off_color, -1, self._off_color, -1
@@ -733,12 +785,12 @@ class Light(SystemWideDevice, DevicePositionMixin):
         if not dest_time:
             # if we are transparent just return the lower layer
             if dest_color is None:
-                return self._get_color_and_target_time(stack[1:])
+                return self._get_color_and_target_time(index + 1)
             return dest_color, -1, dest_color, -1
 
         # fade out
         if dest_color is None:
-            _, _, lower_dest_color, lower_dest_time = self._get_color_and_target_time(stack[1:])
+            _, _, lower_dest_color, lower_dest_time = self._get_color_and_target_time(index + 1)
             start_time = color_settings.start_time
             if lower_dest_time < 0:
                 # no fade going on below current layer
@@ -756,9 +808,10 @@ class Light(SystemWideDevice, DevicePositionMixin):
         return color_settings.start_color, color_settings.start_time, dest_color, dest_time
 
     # pylint: disable-msg=too-many-return-statements
-    def _get_color_and_fade(self, stack, max_fade_ms: int, *, current_time=None) -> Tuple[RGBColor, int, bool]:
+    def _get_color_and_fade(self, index: int, max_fade_ms: int, *, current_time=None) -> Tuple[RGBColor, int, bool]:
+        """Return color and fade of the stack from index downwards."""
         try:
-            color_settings = stack[0]
+            color_settings = self.stack[index]
         except IndexError:
             # no stack
             return self._off_color, -1, True
@@ -769,7 +822,7 @@ class Light(SystemWideDevice, DevicePositionMixin):
         if not color_settings.dest_time:
             # if we are transparent just return the lower layer
             if dest_color is None:
-                return self._get_color_and_fade(stack[1:], max_fade_ms)
+                return self._get_color_and_fade(index + 1, max_fade_ms)
             return dest_color, -1, True
 
         if current_time is None:
@@ -779,11 +832,11 @@ class Light(SystemWideDevice, DevicePositionMixin):
         if current_time >= color_settings.dest_time:
             # if we are transparent just return the lower layer
             if dest_color is None:
-                return self._get_color_and_fade(stack[1:], max_fade_ms)
+                return self._get_color_and_fade(index + 1, max_fade_ms)
             return color_settings.dest_color, -1, True
 
         if dest_color is None:
-            dest_color, lower_fade_ms, _ = self._get_color_and_fade(stack[1:], max_fade_ms)
+            dest_color, lower_fade_ms, _ = self._get_color_and_fade(index + 1, max_fade_ms)
             if lower_fade_ms > 0:
                 max_fade_ms = lower_fade_ms
 
@@ -806,7 +859,7 @@ class Light(SystemWideDevice, DevicePositionMixin):
         return RGBColor.blend(color_settings.start_color, dest_color, ratio), max_fade_ms, False
 
     def _get_brightness_and_fade(self, max_fade_ms: int, color: str, *, current_time=None) -> Tuple[float, int, bool]:
-        uncorrected_color, fade_ms, done = self._get_color_and_fade(self.stack, max_fade_ms, current_time=current_time)
+        uncorrected_color, fade_ms, done = self._get_color_and_fade(0, max_fade_ms, current_time=current_time)
         corrected_color = self.gamma_correct(uncorrected_color)
         corrected_color = self.color_correct(corrected_color)
 
@@ -834,14 +887,12 @@ class Light(SystemWideDevice, DevicePositionMixin):
 
         if self.stack[0].key == key and self.stack[0].priority == priority:
             # fast path for resetting the top element
-            return self._get_color_and_fade(self.stack, 0)[0]
+            return self._get_color_and_fade(0, 0)[0]
 
-        stack = []
         for i, entry in enumerate(self.stack):
             if entry.priority <= priority and entry.key <= key:
-                stack = self.stack[i:]
-                break
-        return self._get_color_and_fade(stack, 0)[0]
+                return self._get_color_and_fade(i, 0)[0]
+        return self._off_color
 
     def get_color(self):
         """Return an RGBColor() instance of the 'color' setting of the highest color setting in the stack.
@@ -851,7 +902,7 @@ class Light(SystemWideDevice, DevicePositionMixin):
 
         Also note the color returned is the "raw" color that does has not had the color correction profile applied.
         """
-        return self._get_color_and_fade(self.stack, 0)[0]
+        return self._get_color_and_fade(0, 0)[0]
 
     @property
     def fade_in_progress(self) -> bool:
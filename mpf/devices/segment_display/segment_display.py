@@ -215,7 +215,7 @@ class SegmentDisplay(SystemWideDevice):
             if self._current_text_stack_entry:
                 # update placeholder
                 if len(self._current_text_stack_entry.text) > 0:
-                    self._current_placeholder = TextTemplate(self.machine, self._current_text_stack_entry.text)
+                    self._current_placeholder = self._get_template(self._current_text_stack_entry)
                     self._current_placeholder_changed()
             else:
                 self._current_placeholder = None
@@ -231,6 +231,12 @@ class SegmentDisplay(SystemWideDevice):
 
         return colors
 
+    def _get_template(self, text_stack_entry: TextStackEntry) -> TextTemplate:
+        """Return the template of a stack entry. It is created once per entry."""
+        if text_stack_entry.template is None:
+            text_stack_entry.template = TextTemplate(self.machine, text_stack_entry.text)
+        return text_stack_entry.template
+
     def _update_stack(self) -> None:
         """Sort stack and show top entry on display."""
         # do nothing if stack is emtpy. set display empty
@@ -284,7 +290,7 @@ class SegmentDisplay(SystemWideDevice):
                                    self.config['default_transition_update_hz'], flashing, flash_mask)
         else:
             # no transition - subscribe to text template changes and update display
-            self._current_placeholder = TextTemplate(self.machine, top_text_stack_entry.text)
+            self._current_placeholder = self._get_template(top_text_stack_entry)
             new_text, future = self._current_placeholder.evaluate_and_subscribe({})
             future.add_done_callback(self._current_placeholder_changed)
 
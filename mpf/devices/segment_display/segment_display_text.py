@@ -3,6 +3,7 @@ import abc
 from collections import namedtuple
 from typing import Optional, List, Union
 
+from mpf.core.cache import BoundedCache
 from mpf.core.rgb_color import RGBColor
 
 DisplayCharacter = namedtuple("DisplayCharacter", ["char_code", "dot", "comma", "color"])
@@ -11,6 +12,14 @@ DOT_CODE = ord(".")
 COMMA_CODE = ord(",")
 SPACE_CODE = ord(" ")
 
+# characters per text, size, dot and comma settings and colors. score displays render the same texts again and again
+_character_cache = BoundedCache("segment_display_text", 1024)
+
+
+def get_colors_key(colors) -> tuple:
+    """Return a hashable key for a list of colors."""
+    return tuple(color.rgb if isinstance(color, RGBColor) else color for color in colors)
+
 
 class SegmentDisplayText(metaclass=abc.ABCMeta):
 
@@ -80,7 +89,23 @@ class SegmentDisplayText(metaclass=abc.ABCMeta):
         - The first color is used to pad the text to the left if text is shorter than the display - thus text is right
           aligned.
         - Dots and commas are embedded on the fly.
+
+        Results are cached. The returned list is a copy which may be changed.
         """
+        key = (text, display_size, collapse_dots, collapse_commas, use_dots_for_commas, get_colors_key(colors))
+        characters = _character_cache.get(key)
+        if characters is None:
+            characters = tuple(cls._create_characters_uncached(text, display_size, collapse_dots, collapse_commas,
+                                                               use_dots_for_commas, colors))
+            _character_cache.put(key, characters)
+        return list(characters)
+
+    # pylint: disable-msg=too-many-locals
+    @classmethod
+    def _create_characters_uncached(cls, text: str, display_size: int, collapse_dots: bool, collapse_commas: bool,
+                                    use_dots_for_commas: bool,
+                                    colors: List[Optional[RGBColor]]) -> List[DisplayCharacter]:
+        """Create characters from text and color them without the cache."""
         char_list = []
         left_pad_color = colors[0] if colors else None
         default_right_color = colors[len(colors) - 1] if colors else None
@@ -125,6 +150,10 @@ class SegmentDisplayText(metaclass=abc.ABCMeta):
         """Return length."""
         return self._text.__len__()
 
+    def __iter__(self):
+        """Iterate characters."""
+        return iter(self._text)
+
     def __getitem__(self, item):
         """Return item or slice."""
         if isinstance(item, slice):
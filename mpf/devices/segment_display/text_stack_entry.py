@@ -1,6 +1,7 @@
 """Text stack entry support class for segment displays."""
 from typing import Optional, List
 
+from mpf.core.placeholder_manager import TextTemplate
 from mpf.core.rgb_color import RGBColor
 from mpf.platforms.interfaces.segment_display_platform_interface import FlashingType
 
@@ -10,7 +11,8 @@ class TextStackEntry:
 
     """An entry in the text stack for a segment display."""
 
-    __slots__ = ["text", "colors", "flashing", "flash_mask", "transition", "transition_out", "priority", "key"]
+    __slots__ = ["text", "colors", "flashing", "flash_mask", "transition", "transition_out", "priority", "key",
+                 "template"]
 
     def __init__(self, text: str, color: Optional[List[RGBColor]],
                  flashing: Optional[FlashingType] = None, flash_mask: Optional[str] = None,
@@ -25,6 +27,7 @@ class TextStackEntry:
         self.transition_out = transition_out
         self.priority = priority
         self.key = key
+        self.template = None    # type: Optional[TextTemplate]
 
     def __repr__(self):
         """Return str representation."""
@@ -1,6 +1,4 @@
 """A shot in MPF."""
-import uuid
-from collections import namedtuple
 from typing import List, Dict, Set
 
 import mpf.core.delays
@@ -8,30 +6,31 @@ from mpf.core.events import event_handler
 from mpf.core.mode import Mode
 from mpf.core.player import Player
 from mpf.core.mode_device import ModeDevice
+from mpf.core.sequence_matcher import ActiveSequence
 from mpf.core.system_wide_device import SystemWideDevice
 
-ActiveSequence = namedtuple("ActiveSequence", ["id", "current_position_index", "next_event"])
-
 
 class SequenceShot(SystemWideDevice, ModeDevice):
 
-    """A device which represents a sequence shot."""
+    """A device which represents a sequence shot.
+
+    Matching is done by the shared sequence_matcher. This device only holds the config and posts events.
+    """
 
     config_section = 'sequence_shots'
     collection = 'sequence_shots'
     class_label = 'sequence_shot'
 
-    __slots__ = ["delay", "active_sequences", "active_delays", "_sequence_events", "_delay_events", "_start_time"]
+    __slots__ = ["delay", "active_delays", "sequence_events", "_delay_events", "_start_time"]
 
     def __init__(self, machine, name):
         """Initialize sequence shot."""
         super().__init__(machine, name)
 
         self.delay = mpf.core.delays.DelayManager(self.machine)
-        self.active_sequences = list()  # type: List[ActiveSequence]
         self.active_delays = set()      # type: Set[str]
 
-        self._sequence_events = []      # type: List[str]
+        self.sequence_events = []       # type: List[str]
         self._delay_events = {}         # type: Dict[str, int]
         self._start_time = None
 
@@ -62,14 +61,18 @@ class SequenceShot(SystemWideDevice, ModeDevice):
         if self.config['switch_sequence'] and self.config['event_sequence']:
             raise AssertionError("Sequence shot {} only supports switch_sequence or event_sequence".format(self.name))
 
-        self._sequence_events = self.config['event_sequence']
+        self.sequence_events = self.config['event_sequence']
 
         for switch in self.config['switch_sequence']:
-            self._sequence_events.append(self.machine.switch_controller.get_active_event_for_switch(switch.name))
+            self.sequence_events.append(self.machine.switch_controller.get_active_event_for_switch(switch.name))
+
+    @property
+    def active_sequences(self) -> List[ActiveSequence]:
+        """Return all running sequences of this shot."""
+        return self.machine.sequence_matcher.get_active_sequences(self)
 
     def _register_handlers(self):
-        for event in set(self._sequence_events):
-            self.machine.events.add_handler(event, self._sequence_advance, event_name=event)
+        self.machine.sequence_matcher.add_sequence_shot(self)
 
         for switch in self.config['cancel_switches']:
             self.machine.switch_controller.add_switch_handler_obj(
@@ -83,7 +86,7 @@ class SequenceShot(SystemWideDevice, ModeDevice):
             self.machine.events.add_handler(event, self._delay_switch_hit, name=event, ms=ms)
 
     def _remove_handlers(self):
-        self.machine.events.remove_handler(self._sequence_advance)
+        self.machine.sequence_matcher.remove_sequence_shot(self)
         self.machine.events.remove_handler(self._delay_switch_hit)
 
         for switch in self.config['cancel_switches']:
@@ -94,92 +97,26 @@ class SequenceShot(SystemWideDevice, ModeDevice):
             self.machine.switch_controller.remove_switch_handler(
                 switch.name, self._delay_switch_hit, 1)
 
-    def _sequence_advance(self, event_name, **kwargs):
-        # Since we can track multiple simultaneous sequences (e.g. two balls
-        # going into an orbit in a row), we first have to see whether this
-        # switch is starting a new sequence or continuing an existing one
-        del kwargs
-
-        # mark playfield active if a playfield is defined for this sequence
+    def sequence_step_hit(self, event_name):
+        """Mark the playfield active when any event of this sequence was hit."""
         if self.config['playfield']:
             self.config['playfield'].mark_playfield_active_from_device_action(self.name)
 
         self.debug_log("Sequence advance: %s", event_name)
 
-        if event_name == self._sequence_events[0]:
-            if len(self._sequence_events) > 1:
-                # start a new sequence
-                self._start_new_sequence()
-            elif not self.active_delays:
-                # if it only has one step it will finish right away
-                self._completed()
-        else:
-            # Get the seq_id of the first sequence this switch is next for.
-            # This is not a loop because we only want to advance 1 sequence
-            seq = next((x for x in self.active_sequences if
-                        x.next_event == event_name), None)
-
-            if seq:
-                # advance this sequence
-                self._advance_sequence(seq)
-
-    def _start_new_sequence(self):
-        # If the sequence hasn't started, make sure we're not within the
-        # delay_switch hit window
-
-        if self.active_delays:
-            self.debug_log("There's a delay timer in effect from %s. Sequence will not be started.",
-                           self.active_delays)
-            return
-
-        #record start time
+    def sequence_started(self):
+        """Record the start time of a new sequence."""
         self._start_time = self.machine.clock.get_time()
+        self.debug_log("Setting up a new sequence. Next: %s", self.sequence_events[1])
 
-        # create a new sequence
-        seq_id = uuid.uuid4()
-        next_event = self._sequence_events[1]
-
-        self.debug_log("Setting up a new sequence. Next: %s", next_event)
-
-        self.active_sequences.append(ActiveSequence(seq_id, 0, next_event))
-
-        # if this sequence has a time limit, set that up
-        if self.config['sequence_timeout']:
-            self.debug_log("Setting up a sequence timer for %sms",
-                           self.config['sequence_timeout'])
-
-            self.delay.reset(name=seq_id,
-                             ms=self.config['sequence_timeout'],
-                             callback=self._sequence_timeout,
-                             seq_id=seq_id)
-
-    def _advance_sequence(self, sequence: ActiveSequence):
-        # Remove this sequence from the list
-        self.active_sequences.remove(sequence)
-
-        if sequence.current_position_index == (len(self._sequence_events) - 2):  # complete
-
-            self.debug_log("Sequence complete!")
-
-            self.delay.remove(sequence.id)
-            self._completed()
-
-        else:
-            current_position_index = sequence.current_position_index + 1
-            next_event = self._sequence_events[current_position_index + 1]
-
-            self.debug_log("Advancing the sequence. Next: %s", next_event)
-
-            self.active_sequences.append(ActiveSequence(sequence.id, current_position_index, next_event))
-
-    def _completed(self):
+    def sequence_completed(self):
+        """Post the hit event for a completed sequence."""
         #measure the elapsed time between start and completion of the sequence
         if self._start_time is not None:
             elapsed = self.machine.clock.get_time() - self._start_time
         else:
             elapsed = 0
 
-        """Post sequence complete event including its elapsed time to complete."""
         self.machine.events.post("{}_hit".format(self.name), elapsed=elapsed)
         '''event: (name)_hit
         desc: The sequence_shot called (name) was just completed.
@@ -193,12 +130,7 @@ class SequenceShot(SystemWideDevice, ModeDevice):
 
     def reset_all_sequences(self):
         """Reset all sequences."""
-        seq_ids = [x.id for x in self.active_sequences]
-
-        for seq_id in seq_ids:
-            self.delay.remove(seq_id)
-
-        self.active_sequences = list()
+        self.machine.sequence_matcher.reset_sequences(self)
 
     def _delay_switch_hit(self, name, ms, **kwargs):
         del kwargs
@@ -213,11 +145,8 @@ class SequenceShot(SystemWideDevice, ModeDevice):
     def _release_delay(self, delay_name):
         self.active_delays.remove(delay_name)
 
-    def _sequence_timeout(self, seq_id):
-        """Sequence timeouted."""
+    def sequence_timed_out(self, seq_id):
+        """Post the timeout event for a sequence which the matcher already dropped."""
         self.debug_log("Sequence %s timeouted", seq_id)
 
-        self.active_sequences = [x for x in self.active_sequences
-                                 if x[0] != seq_id]
-
         self.machine.events.post("{}_timeout".format(self.name))
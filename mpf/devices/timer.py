@@ -10,7 +10,7 @@ from mpf.core.mode import Mode
 MYPY = False
 if MYPY:   # pragma: no cover
     from mpf.core.machine import MachineController  # pylint: disable-msg=cyclic-import,unused-import
-    from mpf.core.clock import PeriodicTask     # pylint: disable-msg=cyclic-import,unused-import
+    from mpf.core.clock import TickHandle     # pylint: disable-msg=cyclic-import,unused-import
     from mpf.core.events import EventHandlerKey     # pylint: disable-msg=cyclic-import,unused-import
 
 
@@ -47,7 +47,7 @@ class Timer(ModeDevice):
         self.max_value = None               # type: Optional[int]
         self.ticks_remaining = None         # type: Optional[int]
         self.direction = None               # type: Optional[str]
-        self.timer = None                   # type: Optional[PeriodicTask]
+        self.timer = None                   # type: Optional[TickHandle]
         self.event_keys = list()            # type: List[EventHandlerKey]
         self.delay = None                   # type: Optional[DelayManager]
 
@@ -500,16 +500,17 @@ class Timer(ModeDevice):
         return False
 
     def _create_system_timer(self):
-        # Creates the clock event which drives this mode timer's tick method.
-        self._remove_system_timer()
-        self.timer = self.machine.clock.schedule_interval(self._timer_tick,
-                                                          self.tick_secs)
+        # Starts ticking in the shared tick service. Timers with the same interval which start at the same time
+        # tick together.
+        if self.timer:
+            self.timer.set_interval(self.tick_secs)
+        else:
+            self.timer = self.machine.clock.tick_service.add(self._timer_tick, self.tick_secs)
 
     def _remove_system_timer(self):
-        # Removes the clock event associated with this mode timer.
+        # Stops ticking. The handle is kept for the next start.
         if self.timer:
-            self.machine.clock.unschedule(self.timer)
-            self.timer = None
+            self.timer.pause()
 
     @staticmethod
     def _get_timer_value(timer_value, in_ms=False, **kwargs):
@@ -1,10 +1,11 @@
 """Contains the YamlInterface class for reading & writing YAML files."""
 import copy
-from typing import Any, Iterable, Dict
+from typing import Iterable
 
 from ruamel import yaml
 from ruamel.yaml.error import MarkedYAMLError
 
+from mpf.core.cache import BoundedCache
 from mpf.core.file_interface import FileInterface
 
 _yaml = yaml.YAML(typ='safe')
@@ -17,7 +18,7 @@ class YamlInterface(FileInterface):
 
     file_types = ['.yaml', '.yml']
     cache = False
-    file_cache = dict()     # type: Dict[str, Any]
+    file_cache = BoundedCache("yaml_files", 4096)
 
     def load(self, filename, expected_version_str=None, halt_on_error=True) -> dict:
         """Load a YAML file from disk.
@@ -33,8 +34,10 @@ class YamlInterface(FileInterface):
 
         Returns a dictionary of the settings from this YAML file.
         """
-        if self.cache and filename in self.file_cache:
-            return copy.deepcopy(self.file_cache[filename])
+        if self.cache:
+            cached_config = self.file_cache.get(filename)
+            if cached_config is not None:
+                return copy.deepcopy(cached_config)
 
         config = dict()     # type: dict
 
@@ -67,7 +70,7 @@ class YamlInterface(FileInterface):
             self.log.warning(msg)
 
         if self.cache and config:
-            self.file_cache[filename] = copy.deepcopy(config)
+            self.file_cache.put(filename, copy.deepcopy(config))
 
         return config
 
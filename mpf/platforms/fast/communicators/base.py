@@ -201,9 +201,10 @@ class FastSerialCommunicator(LogMixin):
         """Start listening for commands and schedule watchdog."""
         if self.watchdog_cmd:
             self._watchdog_task()  # send one now
-            self.tasks.append(self.machine.clock.schedule_interval(
+            # watchdogs of all communicators share one aligned tick
+            self.tasks.append(self.machine.clock.tick_service.add(
                 self._watchdog_task,
-                self.config['watchdog'] / 2000))
+                self.config['watchdog'] / 2000, align=True))
 
     def start_tasks(self):
         """Start periodic tasks, etc.
@@ -35,8 +35,9 @@ class FastExpCommunicator(FastSerialCommunicator):
     def start_tasks(self):
         """Start listening for commands and schedule watchdog."""
         for board in self.exp_boards_by_address.values():
-            self.tasks.append(self.platform.machine.clock.schedule_interval(
-                              board.update_leds, 1 / board.config['led_hz']))
+            # boards with the same led_hz update their LEDs in the same tick
+            self.tasks.append(self.platform.machine.clock.tick_service.add(
+                              board.update_leds, 1 / board.config['led_hz'], align=True))
 
     def stopping(self):
         """Stop listening to the board and clear it."""
@@ -114,6 +114,10 @@ class FastHardwarePlatform(ServoPlatform, LightsPlatform, RgbDmdPlatform,
             info_string += board.get_description_string() + "\n"
         return info_string
 
+    def get_init_dependencies(self):
+        """Return no dependencies because this platform only talks to its own hardware."""
+        return []
+
     async def initialize(self):
         """Initialize platform."""
         # self.machine.events.add_async_handler('machine_reset_phase_1', self.soft_reset)
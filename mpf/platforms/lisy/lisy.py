@@ -179,7 +179,7 @@ class LisyDisplay(SegmentDisplaySoftwareFlashPlatformInterface):
 
     """A segment display in the LISY platform."""
 
-    __slots__ = ["platform", "_type_of_display", "_length_of_display"]
+    __slots__ = ["platform", "_type_of_display", "_length_of_display", "_last_frame"]
 
     def __init__(self, number: int, platform: "LisyHardwarePlatform", display_size) -> None:
         """Initialize segment display."""
@@ -187,6 +187,7 @@ class LisyDisplay(SegmentDisplaySoftwareFlashPlatformInterface):
         self.platform = platform
         self._type_of_display = None
         self._length_of_display = display_size
+        self._last_frame = None
 
     async def initialize(self):
         """Initialize segment display."""
@@ -235,12 +236,20 @@ class LisyDisplay(SegmentDisplaySoftwareFlashPlatformInterface):
     def _set_text(self, text: SegmentDisplayText):
         """Set text to display."""
         assert self.platform.api_version is not None
+        # texts which only differ in colors result in the same frame
         if self.platform.api_version >= version.parse("0.9"):
             formatted_text = self._format_text(text)
+            if formatted_text == self._last_frame:
+                return
+            self._last_frame = formatted_text
             self.platform.send_byte(LisyDefines.DisplaysSetDisplay0To + self.number,
                                     bytearray([len(formatted_text)]) + formatted_text)
         else:
-            self.platform.send_string(LisyDefines.DisplaysSetDisplay0To + self.number, text.convert_to_str())
+            text_str = text.convert_to_str()
+            if text_str == self._last_frame:
+                return
+            self._last_frame = text_str
+            self.platform.send_string(LisyDefines.DisplaysSetDisplay0To + self.number, text_str)
 
 
 class LisySound(HardwareSoundPlatformInterface):
@@ -373,6 +382,10 @@ class LisyHardwarePlatform(SwitchPlatform, LightsPlatform, DriverPlatform,
         # pylint: disable-msg=protected-access
         self._reader._maybe_resume_transport()
 
+    def get_init_dependencies(self):
+        """Return no dependencies because this platform only talks to its own hardware."""
+        return []
+
     # pylint: disable-msg=too-many-statements
     # pylint: disable-msg=too-many-branches
     async def initialize(self):
@@ -102,6 +102,10 @@ class OppHardwarePlatform(LightsPlatform, SwitchPlatform, DriverPlatform, ServoP
             ord(OppRs232Intf.READ_MATRIX_INP): self.read_matrix_inp_resp_initial,
         }
 
+    def get_init_dependencies(self):
+        """Return no dependencies because this platform only talks to its own hardware."""
+        return []
+
     async def initialize(self):
         """Initialize connections to OPP hardware."""
         await self._connect_to_hardware()
@@ -6,10 +6,11 @@ import logging
 from logging import Logger
 
 import sys
+from collections import deque
 from threading import Thread
 
 import time
-from typing import List, Union, Tuple, Optional, Set
+from typing import List, Union, Tuple, Optional, Set, Dict, Any
 
 from mpf._version import log_url
 from mpf.core.utility_functions import Util
@@ -61,6 +62,12 @@ class ProcProcess:
         self.stop_future = None
         self.trace = None
         self.log = None
+        # batches of commands from the MPF loop. append and popleft on a deque are atomic so no lock is needed
+        self.command_queue = deque()
+        self.flushed_batches = 0
+        self.flushed_commands = 0
+        self.last_flush_latency = 0.0
+        self.max_flush_latency = 0.0
 
     def start_pinproc(self, machine_type, loop, trace, log):
         """Initialize libpinproc."""
@@ -112,19 +119,45 @@ class ProcProcess:
             self.log.debug("pinproc.PinPROC.write_data(%s)", data)
             self.log.debug("pinproc.PinPROC.flush()")
 
+    def _run_command(self, cmd, args):
+        if cmd.startswith("_"):
+            return getattr(self, cmd)(*args)
+
+        if self.trace:
+            assert self.log is not None
+            result = getattr(self.proc, cmd)(*args)
+            self.log.debug("pinproc.PinPROC.%s%s -> %s", cmd, args, result)
+            return result
+
+        return getattr(self.proc, cmd)(*args)
+
+    def run_queued_commands(self) -> bool:
+        """Run all queued command batches. Return true if any command ran.
+
+        The caller has to flush pinproc afterwards.
+        """
+        ran_commands = False
+        while True:
+            try:
+                queue_time, commands = self.command_queue.popleft()
+            except IndexError:
+                return ran_commands
+            for cmd, args in commands:
+                self._run_command(cmd, args)
+            ran_commands = True
+            self.flushed_batches += 1
+            self.flushed_commands += len(commands)
+            self.last_flush_latency = time.perf_counter() - queue_time
+            if self.last_flush_latency > self.max_flush_latency:
+                self.max_flush_latency = self.last_flush_latency
+
     async def run_command(self, cmd, *args):
         """Run command in proc thread."""
         try:
-            if cmd.startswith("_"):
-                return getattr(self, cmd)(*args)
-
-            if self.trace:
-                assert self.log is not None
-                result = getattr(self.proc, cmd)(*args)
-                self.log.debug("pinproc.PinPROC.%s%s -> %s", cmd, args, result)
-                return result
-
-            return getattr(self.proc, cmd)(*args)
+            # run all commands which were queued earlier first to keep the order
+            if self.run_queued_commands():
+                self.proc.flush()
+            return self._run_command(cmd, args)
         except OSError as error:  # pragma: no cover
             raise MpfRuntimeError("Communication with P/P3-Roc broke down. Check USB cable and power supply.", 2,
                                   self.log.name) from error
@@ -137,19 +170,27 @@ class ProcProcess:
         self.dmd.set_data(data)
         self.proc.dmd_draw(self.dmd)
 
-    async def read_events_and_watchdog(self, poll_sleep):
-        """Return all events and tickle watchdog."""
+    async def deliver_events(self, poll_sleep, watchdog_interval, main_loop, callback):
+        """Poll events, tickle the watchdog and pass events to the MPF loop.
+
+        All events from one poll are passed to callback in the MPF loop as one batch as soon as they arrive.
+        """
         try:
+            next_watchdog_tickle = 0
             while not self.stop_future.done():
+                # queued commands are flushed together with the watchdog tickle
+                need_flush = self.run_queued_commands()
                 events = self.proc.get_events()
-                self.proc.watchdog_tickle()
-                self.proc.flush()
+                if self.loop.time() >= next_watchdog_tickle:
+                    self.proc.watchdog_tickle()
+                    next_watchdog_tickle = self.loop.time() + watchdog_interval
+                    need_flush = True
+                if need_flush:
+                    self.proc.flush()
                 if events:
-                    return list(events)
+                    main_loop.call_soon_threadsafe(callback, list(events))
 
                 await asyncio.sleep(poll_sleep)
-
-            return []
         except OSError as error:  # pragma: no cover
             raise MpfRuntimeError("Communication with P/P3-Roc broke down. Check USB cable and power supply.", 2,
                                   self.log.name) from error
@@ -170,7 +211,9 @@ class PROCBasePlatform(LightsPlatform, SwitchPlatform, DriverPlatform, ServoPlat
 
     __slots__ = ["pdbconfig", "pinproc", "proc", "hw_switch_rules", "version", "revision", "hardware_version",
                  "dipswitches", "machine_type", "event_task", "_late_init_futures",
-                 "proc_thread", "proc_process", "proc_process_instance", "_commands_running", "config", "_light_system"]
+                 "proc_thread", "proc_process", "proc_process_instance", "config", "_light_system",
+                 "_pending_commands", "_pending_command_count", "_flush_scheduled", "commands_queued",
+                 "commands_merged"]
 
     def __init__(self, machine):
         """Make sure pinproc was loaded."""
@@ -194,35 +237,95 @@ class PROCBasePlatform(LightsPlatform, SwitchPlatform, DriverPlatform, ServoPlat
         self.proc_thread = None
         self.proc_process = None
         self.proc_process_instance = None
-        self._commands_running = 0
+        self._pending_commands = {}         # type: Dict[Any, Tuple[str, tuple]]
+        self._pending_command_count = 0
+        self._flush_scheduled = False
+        self.commands_queued = 0
+        self.commands_merged = 0
         self.config = {}
         self._light_system = None
         self.machine_type = None
         self._late_init_futures = []
 
-    def _decrement_running_commands(self, future):
-        del future
-        self._commands_running -= 1
-
     def run_proc_cmd(self, cmd, *args):
         """Run a command in the p-roc thread and return a future."""
         if self.debug:
             self.debug_log("Calling P-Roc cmd: %s (%s)", cmd, args)
+        # the p-roc thread runs all queued commands before this one
+        self._flush_pending_commands()
         future = asyncio.wrap_future(
             asyncio.run_coroutine_threadsafe(self.proc_process.run_command(cmd, *args), self.proc_process_instance))
         future.add_done_callback(Util.raise_exceptions)
         return future
 
-    def run_proc_cmd_no_wait(self, cmd, *args):
-        """Run a command in the p-roc thread."""
+    @staticmethod
+    def _get_merge_key(cmd, args):
+        """Return a key for commands which replace earlier commands with the same key or None."""
+        if cmd in ("driver_disable", "driver_schedule", "driver_patter", "driver_pulse", "driver_pulsed_patter"):
+            # every driver command replaces the complete state of the driver
+            return "driver", args[0]
+        if cmd == "driver_update_state":
+            return "driver", args[0]['driverNum']
+        if cmd == "switch_update_rule" and (len(args) == 4 or not args[4]):
+            # rules without drive_now replace the rule for this switch and event type
+            return "rule", args[0], args[1]
+        return None
+
+    def run_proc_cmd_no_wait(self, cmd, *args, merge_key=None):
+        """Queue a command for the p-roc thread.
+
+        Commands are collected until the end of the current loop iteration and then sent to the p-roc thread as one
+        batch which runs together with the next watchdog tickle. A queued command replaces an earlier queued
+        command with the same merge key (e.g. multiple state changes of the same driver).
+        """
         if self.debug:
             self.debug_log("Calling P-Roc cmd (no wait): %s (%s)", cmd, args)
-        asyncio.run_coroutine_threadsafe(self.proc_process.run_command(cmd, *args), self.proc_process_instance)
+        if merge_key is None:
+            merge_key = self._get_merge_key(cmd, args)
+        if merge_key is None:
+            self._pending_command_count += 1
+            merge_key = self._pending_command_count
+        elif self._pending_commands.pop(merge_key, None):
+            # move the command to the end so it stays behind all commands which were queued in between
+            self.commands_merged += 1
+        self._pending_commands[merge_key] = (cmd, args)
+        self.commands_queued += 1
+
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.machine.clock.loop.call_soon(self._flush_pending_commands)
+
+    def _flush_pending_commands(self):
+        """Send all pending commands to the p-roc thread as one batch."""
+        self._flush_scheduled = False
+        if not self._pending_commands:
+            return
+        self.proc_process.command_queue.append((time.perf_counter(), tuple(self._pending_commands.values())))
+        self._pending_commands = {}
+
+    def get_command_queue_stats(self) -> Dict[str, Any]:
+        """Return stats about the command pipeline to the p-roc thread."""
+        if not self.proc_process:
+            return {}
+        return {
+            "queue_depth": len(self._pending_commands) + sum(
+                len(commands) for _, commands in list(self.proc_process.command_queue)),
+            "commands_queued": self.commands_queued,
+            "commands_merged": self.commands_merged,
+            "batches_flushed": self.proc_process.flushed_batches,
+            "commands_flushed": self.proc_process.flushed_commands,
+            "last_flush_latency_ms": round(self.proc_process.last_flush_latency * 1000, 3),
+            "max_flush_latency_ms": round(self.proc_process.max_flush_latency * 1000, 3),
+        }
 
     def run_proc_cmd_sync(self, cmd, *args):
         """Run a command in the p-roc thread and return the result."""
         return self.machine.clock.loop.run_until_complete(self.run_proc_cmd(cmd, *args))
 
+    def get_init_dependencies(self):
+        """Return no dependencies because this platform only talks to its own hardware."""
+        return []
+
     async def initialize(self):
         """Set machine vars."""
         await super().initialize()
@@ -293,21 +396,27 @@ class PROCBasePlatform(LightsPlatform, SwitchPlatform, DriverPlatform, ServoPlat
         self.event_task = asyncio.create_task(self._poll_events())
         self.event_task.add_done_callback(Util.raise_exceptions)
         self._light_system.start()
+        self.machine.events.add_handler("debug_dump_stats", self._dump_command_queue_stats)
+
+    def _dump_command_queue_stats(self, **kwargs):
+        del kwargs
+        self.info_log("P-Roc command pipeline: %s", self.get_command_queue_stats())
 
     def process_events(self, events):
         """Process events from the P-Roc."""
         raise NotImplementedError()
 
     async def _poll_events(self):
-        poll_sleep = 1 / self.machine.config['mpf']['default_platform_hz']
-        while True:
-            events = await asyncio.wrap_future(
-                asyncio.run_coroutine_threadsafe(self.proc_process.read_events_and_watchdog(poll_sleep),
-                                                 self.proc_process_instance))
-            if events:
-                self.process_events(events)
-
-            await asyncio.sleep(poll_sleep)
+        """Run the event poller in the p-roc thread until it stops."""
+        if self.config['switch_poll_interval']:
+            poll_sleep = self.config['switch_poll_interval'] / 1000
+        else:
+            poll_sleep = 1 / self.machine.config['mpf']['default_platform_hz']
+        await asyncio.wrap_future(
+            asyncio.run_coroutine_threadsafe(
+                self.proc_process.deliver_events(poll_sleep, self.config['watchdog_tickle_interval'] / 1000,
+                                                 self.machine.clock.loop, self.process_events),
+                self.proc_process_instance))
 
     def stop(self):
         """Stop proc."""
@@ -437,7 +546,7 @@ class PROCBasePlatform(LightsPlatform, SwitchPlatform, DriverPlatform, ServoPlat
         command_buffer = []
         self._write_addr_buffered(board_addr, addr, command_buffer)
         self._write_color_buffered(board_addr, color, command_buffer)
-        self.run_proc_cmd_no_wait("_write_data_batch", command_buffer)
+        self.run_proc_cmd_no_wait("_write_data_batch", command_buffer, merge_key=("pdled", board_addr, addr))
 
     def _write_addr(self, board_addr, addr):
         """Write an address to pdled."""
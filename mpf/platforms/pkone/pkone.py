@@ -64,6 +64,10 @@ class PKONEHardwarePlatform(SwitchPlatform, DriverPlatform, LightsPlatform, Serv
         self._configure_device_logging_and_debug("PKONE", self.config)
         self.debug_log("Configuring PKONE hardware.")
 
+    def get_init_dependencies(self):
+        """Return no dependencies because this platform only talks to its own hardware."""
+        return []
+
     async def initialize(self):
         """Initialize connection to PKONE Nano hardware."""
         await self._connect_to_hardware()
@@ -283,6 +283,10 @@ class SmartVirtualHardwarePlatform(VirtualPlatform):
         self.log = logging.getLogger("Smart Virtual Platform")
         self.debug_log("Configuring smart_virtual hardware interface.")
 
+    def get_init_dependencies(self):
+        """Keep the load order because this sets up actions for devices and drivers of other platforms."""
+        return None
+
     async def start(self):
         """Initialize platform when all devices are ready."""
         self._initialize_ball_devices()
@@ -866,6 +866,10 @@ class SpikePlatform(SwitchPlatform, LightsPlatform, DriverPlatform, DmdPlatform,
                 curr_bit <<= 1
         return hw_states
 
+    def get_init_dependencies(self):
+        """Return no dependencies because this platform only talks to its own hardware."""
+        return []
+
     async def initialize(self):
         """Initialize platform."""
         port = self.config['port']
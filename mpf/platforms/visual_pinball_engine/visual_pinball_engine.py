@@ -1,9 +1,9 @@
 """VPE platform."""
 import asyncio
-from typing import Optional, List
+from typing import Optional, List, Dict, Tuple
 
 from mpf.core.segment_mappings import TextToSegmentMapper, FOURTEEN_SEGMENTS
-from mpf.devices.segment_display.segment_display_text import ColoredSegmentDisplayText
+from mpf.devices.segment_display.segment_display_text import ColoredSegmentDisplayText, get_colors_key
 from mpf.platforms.interfaces.segment_display_platform_interface import SegmentDisplaySoftwareFlashPlatformInterface
 from mpf.platforms.visual_pinball_engine.platform_pb2 import SetSegmentDisplayFrameRequest
 
@@ -47,30 +47,21 @@ class VisualPinballEngineLight(LightPlatformInterface):
 
     """A light in VPE."""
 
-    __slots__ = ["platform", "clock", "config"]
+    __slots__ = ["platform", "config"]
 
     def __init__(self, number, platform, config):
         """Initialize LED."""
         super().__init__(number)
         self.platform = platform    # type: VisualPinballEnginePlatform
-        self.clock = self.platform.machine.clock
         self.config = config
 
     def set_fade(self, start_brightness, start_time, target_brightness, target_time):
-        """Set fade."""
-        # TODO: batch all fades
-        current_time = self.clock.get_time()
-        if target_time > 0:
-            fade_ms = int((target_time - current_time) * 1000)
-        else:
-            fade_ms = 0
+        """Set fade.
 
-        command = platform_pb2.Commands()
-        command.fade_light.common_fade_ms = fade_ms
-        command.fade_light.fades.append(platform_pb2.FadeLightRequest.ChannelFade(
-            light_number=self.number,
-            target_brightness=target_brightness))
-        self.platform.send_command(command)
+        Fades are collected by the platform and sent in one command per tick.
+        """
+        del start_brightness, start_time
+        self.platform.add_fade(self.number, target_brightness, target_time)
 
     def get_board_name(self):
         """Return the name of the board of this light."""
@@ -178,27 +169,33 @@ class VisualPinballEngineSegmentDisplay(SegmentDisplaySoftwareFlashPlatformInter
 
     """VPE segment display."""
 
-    __slots__ = ["platform", "length_of_display"]
+    __slots__ = ["platform", "length_of_display", "_last_frame"]
 
     def __init__(self, number, display_size, platform):
         """Initialize segment display."""
         super().__init__(number)
         self.platform = platform
         self.length_of_display = display_size
+        self._last_frame = None
 
     def _set_text(self, text: ColoredSegmentDisplayText) -> None:
-        """Set text to VPE segment displays."""
+        """Set text to VPE segment displays. Nothing is sent if the frame and colors did not change."""
         assert not text.embed_commas
         mapping = TextToSegmentMapper.map_segment_text_to_segments(text, self.length_of_display, FOURTEEN_SEGMENTS)
-        result = map(lambda x: x.get_vpe_encoding(), mapping)
+        frame = b''.join(x.get_vpe_encoding() for x in mapping)
+        colors = text.get_colors()
+        last_frame = (frame, get_colors_key(colors))
+        if last_frame == self._last_frame:
+            return
+        self._last_frame = last_frame
         command = platform_pb2.Commands()
         command.segment_display_frame_request.name = self.number
-        command.segment_display_frame_request.frame = b''.join(result)
+        command.segment_display_frame_request.frame = frame
         command.segment_display_frame_request.colors.extend(
             [SetSegmentDisplayFrameRequest.SegmentDisplayColor(r=color.red / 255.0,
                                                                b=color.blue / 255.0,
                                                                g=color.green / 255.0)
-             for color in text.get_colors()])
+             for color in colors])
 
         self.platform.send_command(command)
 
@@ -210,7 +207,7 @@ class VisualPinballEnginePlatform(LightsPlatform, SwitchPlatform, DriverPlatform
 
     __slots__ = ["config", "_configured_switches", "_configured_lights", "_configured_coils", "_initial_switch_state",
                  "_switch_poll_task", "platform_rpc", "platform_server", "_configured_dmds",
-                 "_configured_segment_displays"]
+                 "_configured_segment_displays", "_pending_fades", "_fade_flush_scheduled"]
 
     def __init__(self, machine):
         """Initialize VPE platform."""
@@ -224,6 +221,8 @@ class VisualPinballEnginePlatform(LightsPlatform, SwitchPlatform, DriverPlatform
         self._configured_dmds = []      # type: List[VisualPinballEngineDmd]
         self._configured_segment_displays = []  # type: List[VisualPinballEngineSegmentDisplay]
         self._switch_poll_task = None
+        self._pending_fades = {}        # type: Dict[str, Tuple[float, float]]
+        self._fade_flush_scheduled = False
         self.platform_rpc = None        # type: Optional[MpfHardwareService]
         self.platform_server = None
 
@@ -305,6 +304,41 @@ class VisualPinballEnginePlatform(LightsPlatform, SwitchPlatform, DriverPlatform
         """Send command to VPE."""
         self.platform_rpc.send_command(command)
 
+    def add_fade(self, light_number: str, target_brightness: float, target_time: float):
+        """Add a light fade which will be sent at the end of this tick.
+
+        Later fades for the same channel within one tick replace earlier ones.
+        """
+        self._pending_fades[light_number] = (target_brightness, target_time)
+        if not self._fade_flush_scheduled:
+            self._fade_flush_scheduled = True
+            self.machine.clock.loop.call_soon(self._flush_fades)
+
+    def _flush_fades(self):
+        """Send all pending fades in one command per fade duration."""
+        self._fade_flush_scheduled = False
+        if not self._pending_fades:
+            return
+        current_time = self.machine.clock.get_time()
+        commands = {}   # type: Dict[int, platform_pb2.Commands]
+        for light_number, (target_brightness, target_time) in self._pending_fades.items():
+            if target_time > 0:
+                fade_ms = max(int((target_time - current_time) * 1000), 0)
+            else:
+                fade_ms = 0
+            command = commands.get(fade_ms)
+            if not command:
+                command = platform_pb2.Commands()
+                command.fade_light.common_fade_ms = fade_ms
+                commands[fade_ms] = command
+            command.fade_light.fades.append(platform_pb2.FadeLightRequest.ChannelFade(
+                light_number=light_number,
+                target_brightness=target_brightness))
+        self._pending_fades = {}
+
+        for command in commands.values():
+            self.send_command(command)
+
     def configure_switch(self, number: str, config: SwitchConfig, platform_config: dict) -> VisualPinballEngineSwitch:
         """Configure VPE switch."""
         number = str(number)
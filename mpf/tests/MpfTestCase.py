@@ -3,8 +3,10 @@ import copy
 import inspect
 import logging
 import os
+import pickle
 import sys
 import time
+import traceback
 import unittest
 
 from mpf.core.config_loader import YamlMultifileConfigLoader
@@ -100,6 +102,144 @@ def test_config_directory(config_directory):
     return test_decorator
 
 
+def machine_snapshot(obj):
+
+    """Decorator to run a test class or a single test from a machine snapshot.
+
+    The machine is booted once per test class and config. Every test then runs in a forked copy of the booted
+    machine instead of booting its own machine in setUp. On platforms without os.fork tests run as usual.
+    """
+    obj.use_machine_snapshot = True
+    return obj
+
+
+class ForkedTestError(Exception):
+
+    """Error or failure raised in a forked test."""
+
+
+class MachineSnapshot:
+
+    """A booted test case which is used as template for forked tests."""
+
+    # (test class, config file, machine path) -> snapshot
+    snapshots = dict()
+
+    __slots__ = ["test_case"]
+
+    def __init__(self, test_case):
+        """Initialize snapshot."""
+        self.test_case = test_case
+
+    @classmethod
+    def get(cls, test: "MpfTestCase"):
+        """Return a snapshot for a test and boot it if needed."""
+        key = (test.__class__, test._get_config_file(), test.get_absolute_machine_path())
+        if key in cls.snapshots:
+            return cls.snapshots[key]
+
+        test_case = test.__class__(test._testMethodName)
+        try:
+            test_case.setUp()
+        # pylint: disable-msg=broad-except
+        except Exception:
+            test_case = None
+        else:
+            if test_case.startup_error:
+                test_case = None
+            else:
+                test_case.restore_sys_path()
+
+        if not any(snapshot_key[0] is test.__class__ for snapshot_key in cls.snapshots):
+            test.addClassCleanup(cls.clear, test.__class__)
+        snapshot = cls(test_case) if test_case else None
+        cls.snapshots[key] = snapshot
+        return snapshot
+
+    @classmethod
+    def clear(cls, test_class):
+        """Stop all booted machines of a test class."""
+        for key in [key for key in cls.snapshots if key[0] is test_class]:
+            snapshot = cls.snapshots.pop(key)
+            if snapshot:
+                snapshot.test_case.machine._do_stop()
+                snapshot.test_case.loop.close()
+        events.set_event_loop(None)
+
+    def run_forked(self, test: "MpfTestCase", result):
+        """Run a test in a forked copy of the booted machine and report it to result."""
+        sys.stdout.flush()
+        sys.stderr.flush()
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(read_fd)
+            try:
+                outcome = self._run_in_child(test._testMethodName)
+            # pylint: disable-msg=broad-except
+            except BaseException:
+                outcome = {"errors": [traceback.format_exc()]}
+            with os.fdopen(write_fd, "wb") as f:
+                pickle.dump(outcome, f)
+            sys.stdout.flush()
+            sys.stderr.flush()
+            os._exit(0)     # pylint: disable-msg=protected-access
+
+        os.close(write_fd)
+        with os.fdopen(read_fd, "rb") as f:
+            data = f.read()
+        os.waitpid(pid, 0)
+        try:
+            outcome = pickle.loads(data)
+        # pylint: disable-msg=broad-except
+        except Exception:
+            outcome = {"errors": ["Forked test process died without reporting a result."]}
+
+        self._report(test, outcome, result)
+
+    def _run_in_child(self, test_method_name):
+        """Run the test on the copy of the snapshot in this process."""
+        test_case = self.test_case
+        test_case._testMethodName = test_method_name
+
+        def set_up():
+            test_case.save_and_prepare_sys_path()
+            test_case.test_start_time = time.time()
+            events.set_event_loop(test_case.loop)
+
+        test_case.setUp = set_up
+        child_result = unittest.TestResult()
+        unittest.TestCase.run(test_case, child_result)
+        return {
+            "errors": [error for _, error in child_result.errors],
+            "failures": [failure for _, failure in child_result.failures],
+            "skipped": [reason for _, reason in child_result.skipped],
+            "expected_failures": [failure for _, failure in child_result.expectedFailures],
+            "unexpected_success": bool(child_result.unexpectedSuccesses),
+        }
+
+    @staticmethod
+    def _report(test, outcome, result):
+        """Replay the outcome of a forked test to result."""
+        result.startTest(test)
+        try:
+            for error in outcome.get("errors", []):
+                result.addError(test, (ForkedTestError, ForkedTestError(error), None))
+            for failure in outcome.get("failures", []):
+                result.addFailure(test, (test.failureException, test.failureException(failure), None))
+            for reason in outcome.get("skipped", []):
+                result.addSkip(test, reason)
+            for failure in outcome.get("expected_failures", []):
+                result.addExpectedFailure(test, (ForkedTestError, ForkedTestError(failure), None))
+            if outcome.get("unexpected_success"):
+                result.addUnexpectedSuccess(test)
+            if not any(outcome.get(kind) for kind in ("errors", "failures", "skipped", "expected_failures",
+                                                      "unexpected_success")):
+                result.addSuccess(test)
+        finally:
+            result.stopTest(test)
+
+
 class TestMachineController(MachineController):
 
     """A patched version of the MachineController used in tests.
@@ -145,6 +285,9 @@ class MpfTestCase(unittest.TestCase):
 
     """Primary TestCase class used for all MPF unit tests."""
 
+    # maps config files and patches to pickled configs. None disables the cache.
+    config_cache = None
+
     def __init__(self, methodName='runTest'):
         LogMixin.unit_test = True
 
@@ -169,6 +312,62 @@ class MpfTestCase(unittest.TestCase):
         self._events = {}
         self.expected_duration = 0.5
 
+    def _get_config_cache_key(self, machine_path):
+        """Return the key of this test in the shared config cache."""
+        return repr((machine_path, self._get_config_file(), self.machine_config_defaults,
+                     self.machine_config_patches, self.machine_spec_patches))
+
+    def load_config(self, machine_path):
+        """Load the config for this test.
+
+        If the shared config cache is enabled (see parallel_runner) the config is only loaded once per config file
+        and patches. Every test gets its own copy.
+        """
+        cache = MpfTestCase.config_cache
+        if cache is not None:
+            key = self._get_config_cache_key(machine_path)
+            if key in cache:
+                return pickle.loads(cache[key])
+
+        config_loader = UnitTestConfigLoader(machine_path, [self._get_config_file()], self.machine_config_defaults,
+                                             self.machine_config_patches, self.machine_spec_patches)
+
+        config = config_loader.load_mpf_config()
+
+        if cache is not None:
+            try:
+                cache[key] = pickle.dumps(config, protocol=4)
+            # pylint: disable-msg=broad-except
+            except Exception:
+                pass
+
+        return config
+
+    def _use_machine_snapshot(self):
+        """Return true if this test should run from a machine snapshot."""
+        if not hasattr(os, "fork"):
+            return False
+        if getattr(getattr(self, self._testMethodName), "use_machine_snapshot", False):
+            return True
+        return getattr(self, "use_machine_snapshot", False)
+
+    def run(self, result=None):
+        """Run test and fork it from a booted machine snapshot if enabled."""
+        test_method = getattr(self, self._testMethodName)
+        if result is None or not self._use_machine_snapshot() or \
+                getattr(self.__class__, "__unittest_skip__", False) or \
+                getattr(test_method, "__unittest_skip__", False) or \
+                getattr(test_method, "expect_startup_error", False):
+            return super().run(result)
+
+        snapshot = MachineSnapshot.get(self)
+        if not snapshot:
+            # could not boot the machine. run normally to report the error
+            return super().run(result)
+
+        snapshot.run_forked(self, result)
+        return result
+
     def start_mode(self, mode):
         """Start mode."""
         self.assertIn(mode, self.machine.modes)
@@ -547,11 +746,7 @@ class MpfTestCase(unittest.TestCase):
             # no logging by default
             logging.basicConfig(level=99)
 
-        # load config
-        config_loader = UnitTestConfigLoader(machine_path, [self._get_config_file()], self.machine_config_defaults,
-                                             self.machine_config_patches, self.machine_spec_patches)
-
-        config = config_loader.load_mpf_config()
+        config = self.load_config(machine_path)
 
         try:
             self.machine = TestMachineController(
@@ -0,0 +1,217 @@
+"""Run the MPF test suite in parallel shards.
+
+Usage: python -m mpf.tests.parallel_runner [-s mpf/tests] [-j 8] [--slowest 20]
+
+Test classes are distributed across a pool of worker processes. Shards are balanced using the durations of previous
+runs. Configs of all MpfTestCase tests are loaded once upfront and shared read-only with all workers.
+"""
+import argparse
+import heapq
+import json
+import logging
+import os
+import pickle   # nosec
+import sys
+import tempfile
+import time
+import unittest
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Tuple
+
+from mpf.tests.MpfTestCase import MpfTestCase
+
+# duration used for tests without history
+DEFAULT_TEST_DURATION = 0.1
+
+
+class TimingTestResult(unittest.TestResult):
+
+    """Test result which records the duration of every test."""
+
+    def __init__(self):
+        """Initialize result."""
+        super().__init__()
+        self.timings = {}   # type: Dict[str, float]
+        self._start_time = 0
+
+    def startTest(self, test):
+        """Remember start time."""
+        super().startTest(test)
+        self._start_time = time.perf_counter()
+
+    def stopTest(self, test):
+        """Record duration."""
+        self.timings[test.id()] = time.perf_counter() - self._start_time
+        super().stopTest(test)
+
+
+def iterate_tests(suite):
+    """Yield all test cases in a suite."""
+    for test in suite:
+        if isinstance(test, unittest.TestSuite):
+            yield from iterate_tests(test)
+        else:
+            yield test
+
+
+def build_config_cache(tests) -> Dict[str, bytes]:
+    """Load the configs of all MpfTestCase tests once."""
+    MpfTestCase.config_cache = {}
+    for test in tests:
+        if not isinstance(test, MpfTestCase):
+            continue
+        try:
+            test.load_config(test.get_absolute_machine_path())
+        # tests for broken configs will report the error when they run
+        # pylint: disable-msg=broad-except
+        except Exception:
+            pass
+    return MpfTestCase.config_cache
+
+
+def create_shards(test_classes: Dict[str, List[str]], durations: Dict[str, float], jobs: int) -> List[List[str]]:
+    """Distribute test classes to shards with about the same total duration.
+
+    All tests of a class end up in the same shard so class fixtures only run once.
+    """
+    def class_duration(test_ids):
+        return sum(durations.get(test_id, DEFAULT_TEST_DURATION) for test_id in test_ids)
+
+    classes = sorted(test_classes.values(), key=class_duration, reverse=True)
+    shards = [(0.0, num, []) for num in range(jobs)]     # type: List[Tuple[float, int, List[str]]]
+    for test_ids in classes:
+        # longest classes first. always add to the shard with the smallest duration
+        duration, num, shard = heapq.heappop(shards)
+        shard.extend(test_ids)
+        heapq.heappush(shards, (duration + class_duration(test_ids), num, shard))
+
+    return [shard for _, _, shard in sorted(shards, key=lambda x: x[1]) if shard]
+
+
+def _init_worker(top_level_dir, config_cache_file):
+    """Prepare worker process."""
+    if top_level_dir not in sys.path:
+        sys.path.insert(0, top_level_dir)
+    logging.basicConfig(level=99)
+    with open(config_cache_file, "rb") as f:
+        MpfTestCase.config_cache = pickle.load(f)   # nosec
+
+
+def _run_shard(test_ids):
+    """Run a shard in a worker process and return a picklable outcome."""
+    suite = unittest.defaultTestLoader.loadTestsFromNames(test_ids)
+    result = TimingTestResult()
+    suite.run(result)
+    return {
+        "tests_run": result.testsRun,
+        "timings": result.timings,
+        "errors": [(str(test), error) for test, error in result.errors],
+        "failures": [(str(test), failure) for test, failure in result.failures],
+        "skipped": len(result.skipped),
+        "expected_failures": len(result.expectedFailures),
+        "unexpected_successes": [str(test) for test in result.unexpectedSuccesses],
+    }
+
+
+def load_durations(filename) -> Dict[str, float]:
+    """Load durations of previous runs."""
+    try:
+        with open(filename, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_durations(filename, durations: Dict[str, float]):
+    """Store durations for the next run."""
+    try:
+        with open(filename, "w", encoding="utf-8") as f:
+            json.dump(durations, f, indent=0, sort_keys=True)
+    except OSError:
+        pass
+
+
+def parse_args(argv):
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Run MPF tests in parallel.")
+    parser.add_argument("-s", dest="start_dir", default="mpf/tests", help="Directory to start discovery")
+    parser.add_argument("-p", dest="pattern", default="test*.py", help="Pattern to match test files")
+    parser.add_argument("-t", dest="top_level_dir", default=None, help="Top level directory of project")
+    parser.add_argument("-j", dest="jobs", type=int, default=os.cpu_count() or 1, help="Number of worker processes")
+    parser.add_argument("--slowest", dest="slowest", type=int, default=10,
+                        help="Number of slowest tests to report")
+    parser.add_argument("--durations-file", dest="durations_file",
+                        default=os.path.join(tempfile.gettempdir(), "mpf_test_durations.json"),
+                        help="File which stores test durations to balance shards")
+    parser.add_argument("--timings-file", dest="timings_file", default=None,
+                        help="Write the duration of every test as JSON to this file")
+    return parser.parse_args(argv)
+
+
+# pylint: disable-msg=too-many-locals
+def main(argv=None):
+    """Discover, shard and run tests. Return true if all tests passed."""
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    start_time = time.perf_counter()
+    logging.basicConfig(level=99)
+
+    loader = unittest.TestLoader()
+    suite = loader.discover(args.start_dir, pattern=args.pattern, top_level_dir=args.top_level_dir)
+    top_level_dir = loader._top_level_dir     # pylint: disable-msg=protected-access
+    tests = list(iterate_tests(suite))
+
+    test_classes = {}   # type: Dict[str, List[str]]
+    for test in tests:
+        test_classes.setdefault(test.id().rsplit(".", 1)[0], []).append(test.id())
+
+    config_cache = build_config_cache(tests)
+    with tempfile.NamedTemporaryFile(suffix=".mpf_test_configs", delete=False) as f:
+        pickle.dump(config_cache, f, protocol=4)
+        config_cache_file = f.name
+    print("Loaded {} configs in {:.1f}s".format(len(config_cache), time.perf_counter() - start_time))
+
+    durations = load_durations(args.durations_file)
+    shards = create_shards(test_classes, durations, max(args.jobs, 1))
+
+    outcomes = []
+    try:
+        with ProcessPoolExecutor(max_workers=len(shards) or 1, initializer=_init_worker,
+                                 initargs=(top_level_dir, config_cache_file)) as executor:
+            outcomes = list(executor.map(_run_shard, shards))
+    finally:
+        os.remove(config_cache_file)
+
+    timings = {}
+    for outcome in outcomes:
+        timings.update(outcome["timings"])
+        for test, error in outcome["errors"]:
+            print("=" * 70 + "\nERROR: {}\n".format(test) + "-" * 70 + "\n" + error)
+        for test, failure in outcome["failures"]:
+            print("=" * 70 + "\nFAIL: {}\n".format(test) + "-" * 70 + "\n" + failure)
+
+    durations.update(timings)
+    save_durations(args.durations_file, durations)
+    if args.timings_file:
+        save_durations(args.timings_file, timings)
+
+    if args.slowest:
+        print("Slowest tests:")
+        for test_id, duration in sorted(timings.items(), key=lambda x: x[1], reverse=True)[:args.slowest]:
+            print("{:8.3f}s {}".format(duration, test_id))
+
+    tests_run = sum(outcome["tests_run"] for outcome in outcomes)
+    errors = sum(len(outcome["errors"]) for outcome in outcomes)
+    failures = sum(len(outcome["failures"]) for outcome in outcomes)
+    skipped = sum(outcome["skipped"] for outcome in outcomes)
+    unexpected_successes = sum(len(outcome["unexpected_successes"]) for outcome in outcomes)
+    print("-" * 70)
+    print("Ran {} tests in {:.3f}s using {} shards\n".format(tests_run, time.perf_counter() - start_time,
+                                                             len(shards)))
+    success = not errors and not failures and not unexpected_successes
+    print("{} (failures={}, errors={}, skipped={})".format("OK" if success else "FAILED", failures, errors, skipped))
+    return success
+
+
+if __name__ == '__main__':
+    sys.exit(not main())
@@ -0,0 +1,70 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from mpf.core.asset_index import AssetIndex
+
+
+class TestAssetIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.root = os.path.join(self.tmp_dir.name, "shows")
+        self.index_file = os.path.join(self.tmp_dir.name, "index")
+        os.makedirs(os.path.join(self.root, "sub", "subsub"))
+        for file_name in ("show1.yaml", os.path.join("sub", "show2.yaml"), os.path.join("sub", "subsub", "show3.yaml")):
+            with open(os.path.join(self.root, file_name), "w"):
+                pass
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def _walk(self, asset_index):
+        return sorted((os.path.relpath(path, self.root), sorted(files)) for path, files in asset_index.walk(self.root))
+
+    def _age_folders(self):
+        """Move mtimes into the past so they are not considered racy."""
+        for path, _, _ in os.walk(self.root):
+            os.utime(path, (1000000, 1000000))
+
+    def test_walk_matches_os_walk(self):
+        expected = sorted((os.path.relpath(path, self.root), sorted(files)) for path, _, files in os.walk(self.root))
+        self.assertEqual(expected, self._walk(AssetIndex(self.index_file)))
+        self.assertEqual([], list(AssetIndex(self.index_file).walk(os.path.join(self.root, "missing"))))
+
+    def test_persistence_and_revalidation(self):
+        self._age_folders()
+        asset_index = AssetIndex(self.index_file)
+        expected = self._walk(asset_index)
+        asset_index.save()
+        self.assertTrue(os.path.isfile(self.index_file))
+
+        # unchanged folders are not listed again
+        asset_index = AssetIndex(self.index_file)
+        with patch("os.scandir") as scandir:
+            self.assertEqual(expected, self._walk(asset_index))
+            scandir.assert_not_called()
+
+        # adding a file only rescans the changed folder
+        with open(os.path.join(self.root, "sub", "show4.yaml"), "w"):
+            pass
+        asset_index = AssetIndex(self.index_file)
+        self.assertIn(("sub", ["show2.yaml", "show4.yaml"]), self._walk(asset_index))
+
+        # removed folders are dropped from the index
+        os.remove(os.path.join(self.root, "sub", "subsub", "show3.yaml"))
+        os.rmdir(os.path.join(self.root, "sub", "subsub"))
+        self.assertEqual([(".", ["show1.yaml"]), ("sub", ["show2.yaml", "show4.yaml"])], self._walk(asset_index))
+
+    def test_trusted_index(self):
+        asset_index = AssetIndex(self.index_file)
+        expected = self._walk(asset_index)
+        asset_index.rebase(self.tmp_dir.name, "/production")
+        asset_index.save()
+
+        self.root = "/production/shows"
+        asset_index = AssetIndex(self.index_file, store_cache=False, trusted=True)
+        with patch("os.stat") as stat:
+            self.assertEqual(expected, self._walk(asset_index))
+            stat.assert_not_called()
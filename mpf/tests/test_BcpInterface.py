@@ -1,6 +1,5 @@
 """Test the bcp interface."""
 import asyncio
-from unittest import mock
 
 from mpf.core.events import RegisteredHandler
 from mpf.tests.MpfBcpTestCase import MpfBcpTestCase
@@ -35,8 +34,7 @@ class TestBcpInterface(MpfBcpTestCase):
     def test_monitor_events(self):
 
         handler = CallHandler()
-        with mock.patch("uuid.uuid4", return_value="abc"):
-            self.machine.events.add_handler("test2", handler)
+        key = self.machine.events.add_handler("test2", handler)
         self._bcp_external_client.reset_and_return_queue()
         self._bcp_external_client.send('monitor_start', {'category': 'events'})
         self.advance_time_and_run()
@@ -54,7 +52,7 @@ class TestBcpInterface(MpfBcpTestCase):
         self.assertIn(
             ('monitored_event', dict(event_name='test2', event_type=None,
                                      event_callback=None, event_kwargs={},
-                                     registered_handlers=[RegisteredHandler(callback='handler', priority=1, kwargs={}, key='abc', condition=None, blocking_facility=None)])),
+                                     registered_handlers=[RegisteredHandler(callback='handler', priority=1, kwargs={}, key=key.key, condition=None, blocking_facility=None)])),
             queue)
 
         self.machine.events.post("test3", callback=handler)
@@ -142,6 +140,52 @@ class TestBcpInterface(MpfBcpTestCase):
         queue = self._bcp_external_client.reset_and_return_queue()
         self.assertFalse(queue)
 
+    def _get_light_changes(self):
+        return [(message[1]["name"], message[1]["changes"])
+                for message in self._bcp_external_client.reset_and_return_queue()
+                if message[0] == "device" and message[1]["type"] == "light" and message[1]["changes"]]
+
+    def test_light_monitor(self):
+        self.machine.lights["l_test"].color("red")
+        self.advance_time_and_run(.1)
+
+        # lights are not tracked without a monitor
+        self.assertFalse(self.machine.light_controller.monitor_enabled)
+        self._bcp_external_client.send('monitor_start', {'category': 'devices'})
+        self.advance_time_and_run(.1)
+        self.assertTrue(self.machine.light_controller.monitor_enabled)
+
+        # all lights are checked once. lights which are off are already in the initial state
+        self.assertEqual([("l_test", ("color", None, (255, 0, 0)))], self._get_light_changes())
+
+        # nothing changed
+        self.advance_time_and_run(1)
+        self.assertEqual([], self._get_light_changes())
+
+        # only the changed light is reported
+        self.machine.lights["l_test2"].color("blue")
+        self.machine.lights["l_test2"].color("green")
+        self.advance_time_and_run(.1)
+        self.assertEqual([("l_test2", ("color", None, (0, 128, 0)))], self._get_light_changes())
+
+        # fades are sampled until they finished
+        self.machine.lights["l_test"].color("off", fade_ms=1000)
+        self.advance_time_and_run(2)
+        changes = self._get_light_changes()
+        self.assertGreater(len(changes), 10)
+        self.assertEqual(("l_test", ("color", (255, 0, 0), changes[0][1][2])), changes[0])
+        self.assertEqual((0, 0, 0), changes[-1][1][2])
+        self.advance_time_and_run(1)
+        self.assertEqual([], self._get_light_changes())
+
+        # stop monitoring after the last monitor stopped
+        self._bcp_external_client.send('monitor_stop', {'category': 'devices'})
+        self.advance_time_and_run(.1)
+        self.assertFalse(self.machine.light_controller.monitor_enabled)
+        self.machine.lights["l_test"].color("red")
+        self.advance_time_and_run(.1)
+        self.assertEqual([], self._get_light_changes())
+
     def test_switch_monitor(self):
         self._bcp_external_client.reset_and_return_queue()
 
@@ -272,6 +316,7 @@ class TestBcpInterface(MpfBcpTestCase):
 
         # Create a new machine variable
         self.machine.variables.set_machine_var("test_var", "testing")
+        self.machine_run()
         queue = self._bcp_external_client.reset_and_return_queue()
 
         self.assertIn(
@@ -282,6 +327,7 @@ class TestBcpInterface(MpfBcpTestCase):
             queue)
 
         self.machine.variables.set_machine_var("test_var", "2nd")
+        self.machine_run()
         queue = self._bcp_external_client.reset_and_return_queue()
         self.assertIn(
             ("machine_variable", {"value": "2nd",
@@ -295,6 +341,7 @@ class TestBcpInterface(MpfBcpTestCase):
         self.advance_time_and_run()
         self._bcp_external_client.reset_and_return_queue()
         self.machine.variables.set_machine_var("test_var", "3rd")
+        self.machine_run()
 
         # The BCP queue should be empty
         queue = self._bcp_external_client.reset_and_return_queue()
@@ -321,6 +368,7 @@ class TestBcpInterface(MpfBcpTestCase):
 
         # Create a new player variable
         self.machine.game.player.test_var = "testing"
+        self.machine_run()
         queue = self._bcp_external_client.reset_and_return_queue()
 
         self.assertIn(
@@ -332,6 +380,7 @@ class TestBcpInterface(MpfBcpTestCase):
             queue)
 
         self.machine.game.player.test_var = "2nd"
+        self.machine_run()
         queue = self._bcp_external_client.reset_and_return_queue()
         self.assertIn(
             ("player_variable", {"player_num": 1,
@@ -341,11 +390,25 @@ class TestBcpInterface(MpfBcpTestCase):
                                  "change": True}),
             queue)
 
+        # all changes during one run of the event queue are sent once
+        self.machine.game.player.score += 100
+        self.machine.game.player.score += 50
+        self.machine_run()
+        queue = self._bcp_external_client.reset_and_return_queue()
+        self.assertEqual(
+            [("player_variable", {"player_num": 1,
+                                  "value": 150,
+                                  "prev_value": 0,
+                                  "name": "score",
+                                  "change": 150})],
+            [message for message in queue if message[0] == "player_variable"])
+
         # Now stop monitoring machine variables
         self._bcp_external_client.send('monitor_stop', {'category': 'player_vars'})
         self.advance_time_and_run()
         self._bcp_external_client.reset_and_return_queue()
         self.machine.variables.set_machine_var("test_var", "3rd")
+        self.machine_run()
 
         # The BCP queue should be empty
         queue = self._bcp_external_client.reset_and_return_queue()
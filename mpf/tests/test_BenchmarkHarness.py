@@ -0,0 +1,56 @@
+import json
+import os
+import tempfile
+import unittest
+
+from mpf.benchmarks import harness
+from mpf.benchmarks import scenarios
+
+
+class TestBenchmarkHarness(unittest.TestCase):
+
+    def test_stats(self):
+        stats = harness.get_stats([i / 1000 for i in range(100, 0, -1)])
+        self.assertEqual(100, stats["count"])
+        self.assertAlmostEqual(1, stats["min"])
+        self.assertAlmostEqual(100, stats["max"])
+        self.assertAlmostEqual(50.5, stats["mean"])
+        self.assertAlmostEqual(51, stats["p50"])
+        self.assertAlmostEqual(95, stats["p95"])
+        self.assertAlmostEqual(99, stats["p99"])
+
+        stats = harness.get_stats([.002])
+        self.assertAlmostEqual(2, stats["p50"])
+        self.assertAlmostEqual(2, stats["p99"])
+
+    def test_compare(self):
+        baseline = {"results": {"a": {"p50": 10.0}, "b": {"p50": 10.0}, "c": {"p50": 10.0}}}
+        results = {"results": {"a": {"p50": 11.0}, "b": {"p50": 13.0}, "d": {"p50": 100.0}}}
+
+        regressions = harness.compare(results, baseline, tolerance=20)
+        self.assertEqual(1, len(regressions))
+        self.assertEqual("b", regressions[0].scenario)
+        self.assertAlmostEqual(30, regressions[0].change)
+
+        self.assertEqual(["a", "b"], [r.scenario for r in harness.compare(results, baseline, tolerance=5)])
+
+    def test_run_and_save(self):
+        self.assertIn("simulated_game", harness.SCENARIOS)
+        progress = []
+        results = harness.run_benchmarks(["bcp_encode_decode", "serial_frame_parsing"], 2,
+                                         lambda name, stats: progress.append(name))
+        self.assertEqual(["bcp_encode_decode", "serial_frame_parsing"], progress)
+        self.assertEqual(2, results["results"]["serial_frame_parsing"]["count"])
+
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, "baseline.json")
+            harness.save_results(results, filename)
+            loaded = harness.load_results(filename)
+        self.assertEqual(json.loads(json.dumps(results)), loaded)
+        self.assertEqual([], harness.compare(results, loaded))
+
+        with self.assertRaises(KeyError):
+            harness.run_benchmarks(["does_not_exist"])
+
+    def test_simulated_game(self):
+        self.assertEqual(1, len(scenarios.simulated_game(1)))
@@ -0,0 +1,86 @@
+"""Test bounded caches."""
+import gc
+import unittest
+
+from mpf.core.cache import BoundedCache, cache_registry, cached
+
+
+class TestBoundedCache(unittest.TestCase):
+
+    def test_lru(self):
+        cache = BoundedCache("test_lru", max_size=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        self.assertEqual(1, cache.get("a"))
+        cache.put("c", 3)
+        # b was used least recently
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(1, cache.get("a"))
+        self.assertEqual(3, cache.get("c"))
+        self.assertEqual(2, len(cache))
+        self.assertEqual({"size": 2, "max_size": 2, "ttl": None, "hits": 3, "misses": 1, "evictions": 1,
+                          "hit_rate": 0.75}, cache.get_stats())
+
+        self.assertEqual(2, cache.clear())
+        self.assertNotIn("a", cache)
+
+    def test_ttl(self):
+        now = [100.0]
+        cache = BoundedCache("test_ttl", max_size=None, ttl=10, time_func=lambda: now[0])
+        cache.put("a", 1)
+        now[0] += 5
+        self.assertIn("a", cache)
+        self.assertEqual(1, cache.get("a"))
+        now[0] += 5
+        self.assertNotIn("a", cache)
+        self.assertEqual("missing", cache.get("a", "missing"))
+        self.assertEqual(1, cache.evictions)
+        self.assertEqual(0, len(cache))
+
+    def test_registry(self):
+        cache1 = BoundedCache("test_registry", max_size=10)
+        cache2 = BoundedCache("test_registry", max_size=10)
+        unregistered = BoundedCache("test_registry", register=False)
+        cache1.put(1, 1)
+        cache2.put(1, 1)
+        cache2.put(2, 2)
+        unregistered.put(1, 1)
+        cache1.get(1)
+        cache2.get(3)
+
+        stats = cache_registry.get_stats()["test_registry"]
+        self.assertEqual(2, stats["caches"])
+        self.assertEqual(3, stats["size"])
+        self.assertEqual(0.5, stats["hit_rate"])
+
+        self.assertEqual(3, cache_registry.clear("test_registry"))
+        self.assertEqual(0, len(cache2))
+        self.assertEqual(1, len(unregistered))
+
+        # the registry does not keep caches alive
+        del cache1, cache2
+        gc.collect()
+        self.assertNotIn("test_registry", cache_registry.get_stats())
+
+    def test_cached(self):
+        calls = []
+
+        @cached("test_cached", max_size=2, typed=True)
+        def func(value, other=None):
+            calls.append((value, other))
+            return None
+
+        func(1)
+        func(1)
+        func(1.0)
+        func(1, other=2)
+        func(1, other=2)
+        # None results are cached and typed keys keep 1 and 1.0 apart
+        self.assertEqual([(1, None), (1.0, None), (1, 2)], calls)
+        self.assertEqual(2, len(func.cache))
+        self.assertEqual(1, func.cache.evictions)
+
+        func.cache_clear()
+        func(1, other=2)
+        self.assertEqual(4, len(calls))
+        self.assertIn("test_cached", cache_registry.get_stats())
@@ -5,6 +5,7 @@ import unittest
 import asyncio
 
 from mpf.core.clock import ClockBase
+from mpf.tests.loop import TimeTravelLoop
 from functools import partial
 
 counter = 0
@@ -64,3 +65,78 @@ class ClockTestCase(unittest.TestCase):
         self.clock.unschedule(cb1)
         self.advance_time_and_run(0.001)
         self.assertEqual(counter, 1)
+
+
+class TickServiceTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.loop = TimeTravelLoop()
+        asyncio.set_event_loop(self.loop)
+        self.clock = ClockBase(loop=self.loop)
+        self.ticks = []
+
+    def tearDown(self):
+        self.loop.close()
+
+    def advance_time_and_run(self, delta=1.0):
+        self.loop.run_until_complete(asyncio.sleep(delay=delta))
+
+    def tick(self, name):
+        self.ticks.append((name, round(self.loop.time(), 3)))
+
+    def test_grouping(self):
+        service = self.clock.tick_service
+        service.add(partial(self.tick, 1), 1)
+        service.add(partial(self.tick, 2), 1)
+        self.assertEqual(1, service.get_group_count())
+        self.advance_time_and_run(.5)
+
+        # different phase -> new group
+        service.add(partial(self.tick, 3), 1)
+        # aligned -> ticks with the first group
+        service.add(partial(self.tick, 4), 1, align=True)
+        self.assertEqual(2, service.get_group_count())
+        self.advance_time_and_run(1.1)
+        self.assertEqual([(1, 1), (2, 1), (4, 1), (3, 1.5)], self.ticks)
+
+    def test_pause_resume_and_interval(self):
+        service = self.clock.tick_service
+        handle = service.add(partial(self.tick, 1), 1)
+        self.advance_time_and_run(1.5)
+        self.assertEqual([(1, 1)], self.ticks)
+
+        handle.pause()
+        self.assertFalse(handle.active)
+        self.assertEqual(0, service.get_group_count())
+        self.advance_time_and_run(2)
+        self.assertEqual([(1, 1)], self.ticks)
+
+        handle.resume()
+        self.advance_time_and_run(1.1)
+        self.assertEqual([(1, 1), (1, 4.5)], self.ticks)
+
+        handle.set_interval(.5)
+        self.advance_time_and_run(1.1)
+        self.assertEqual([(1, 1), (1, 4.5), (1, 5.1), (1, 5.6)], self.ticks)
+
+        handle.cancel()
+        self.advance_time_and_run(1)
+        self.assertEqual(4, len(self.ticks))
+
+    def test_exception_in_callback(self):
+        exceptions = []
+        self.loop.set_exception_handler(lambda loop, context: exceptions.append(context['exception']))
+
+        def fail():
+            raise ValueError()
+
+        service = self.clock.tick_service
+        service.add(fail, 1)
+        service.add(partial(self.tick, 1), 1)
+        self.assertEqual(1, service.get_group_count())
+        self.advance_time_and_run(2.5)
+
+        # the other member keeps ticking and the group is rescheduled
+        self.assertEqual([(1, 1), (1, 2)], self.ticks)
+        self.assertEqual(2, len(exceptions))
+        self.assertIsInstance(exceptions[0], ValueError)
@@ -1,7 +1,7 @@
 from unittest import TestCase
 from unittest.mock import patch, MagicMock, call
 
-from mpf.commands import game
+from mpf.commands import game, CommandLineUtility
 
 
 class TestCommands(TestCase):
@@ -22,7 +22,7 @@ class TestCommands(TestCase):
     def test_game(self):
         loader_mock = MagicMock()
 
-        with patch("mpf.commands.game.signal"):
+        with patch("mpf.commands.game.signal"), patch("mpf.commands.game.LogPipeline") as log_pipeline:
             with patch("mpf.commands.game.logging"):
                 with patch("mpf.commands.game.os"):
                     with patch("mpf.commands.game.sys") as sys:
@@ -34,3 +34,19 @@ class TestCommands(TestCase):
                                     self.assertEqual(loader_mock.load_mpf_config(), controller.call_args[0][1])
                                     sys.exit.assert_called_once_with()
                                     self.assertEqual(call(), sys.exit.call_args)
+                                    log_pipeline.return_value.start.assert_called_once_with()
+                                    log_pipeline.return_value.stop.assert_called_once_with()
+
+    def test_external_command(self):
+        command = MagicMock()
+        entry_point = MagicMock()
+        entry_point.load.return_value = lambda: ("mc", command)
+        with patch("mpf.commands.sys.argv", ["mpf", "mc"]), \
+                patch("mpf.commands.Util.get_entry_points", return_value=[entry_point]) as get_entry_points, \
+                patch("mpf.commands.CommandLineUtility.parse_args", return_value=("machine", [])):
+            utility = CommandLineUtility(path="/")
+            # external commands are only loaded when used
+            get_entry_points.assert_not_called()
+            utility.execute()
+        get_entry_points.assert_called_once_with("mpf.command", "mc")
+        command.assert_called_once_with(utility.mpf_path, "machine", [])
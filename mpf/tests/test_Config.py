@@ -449,6 +449,28 @@ class TestConfig(MpfTestCase):
             validation_string, validation_failure_info, False)
         self.assertEqual('no', results)
 
+    def test_compiled_spec(self):
+        validator = self.machine.config_validator
+        compiled_spec = validator.compile_spec("switches", None)
+        # specs are compiled once
+        self.assertIs(compiled_spec, validator.compile_spec("switches", None))
+        self.assertIn("number", [key for key, _, _ in compiled_spec.entries])
+        # validators are shared between specs
+        self.assertIs(validator._get_item_validator(["single", "str", "None"]),
+                      validator._get_item_validator(("single", "str", "None")))
+
+        # errors in specs are reported with the path of the item which uses them
+        for path in ("a", "b"):
+            with self.assertRaises(AssertionError) as e:
+                validator.validate_config_item(["single", "invalid", "None"], ValidationPath(None, path), 1)
+            self.assertEqual("Config File Error in ConfigValidator: Invalid Validator 'invalid' in config spec {} "
+                             "Error Code: CFE-ConfigValidator-4 ({})".format(
+                                 path, log_url.format("CFE-ConfigValidator-4")), str(e.exception))
+
+        with self.assertRaises(ValueError) as e:
+            validator.validate_config_item(["single", "int"], "path", 1)
+        self.assertEqual("Error in validator spec: path:['single', 'int']", str(e.exception))
+
     def test_config_merge(self):
         a = {"test": {"a": [1], "b": [2, 3]}, "test2": 2}
         b = {"test": {"a": [3], "c": 7}}
@@ -133,3 +133,60 @@ class TestDelay(MpfTestCase):
         self.callback = MagicMock()
         self.advance_time_and_run(1)
         self.callback.assert_not_called()
+
+    def test_handles(self):
+        self.callback = MagicMock()
+        handle = self.machine.delay.schedule(1000, self.callback, value=1)
+        self.assertTrue(handle.active)
+        self.assertTrue(self.machine.delay.check(handle))
+        # anonymous delays are not listed by name
+        self.assertFalse(self.machine.delay.delays)
+
+        self.advance_time_and_run(1.1)
+        self.callback.assert_called_once_with(value=1)
+        self.assertFalse(handle.active)
+        self.assertFalse(self.machine.delay.check(handle))
+
+        # cancel
+        self.callback = MagicMock()
+        handle = self.machine.delay.schedule(1000, self.callback)
+        handle.cancel()
+        handle.cancel()
+        self.assertFalse(handle.active)
+        self.advance_time_and_run(1.1)
+        self.callback.assert_not_called()
+
+        # run now
+        handle = self.machine.delay.schedule(1000, self.callback, value=2)
+        handle.run_now()
+        self.callback.assert_called_once_with(value=2)
+        self.assertFalse(handle.active)
+        self.advance_time_and_run(1.1)
+        self.callback.assert_called_once_with(value=2)
+
+        # add without name returns a handle which works with remove and run_now
+        self.callback = MagicMock()
+        handle = self.machine.delay.add(1000, self.callback, value=3)
+        self.assertTrue(handle.active)
+        self.machine.delay.remove(handle)
+        self.assertFalse(handle.active)
+        handle = self.machine.delay.add(1000, self.callback, value=4)
+        self.machine.delay.run_now(handle)
+        self.callback.assert_called_once_with(value=4)
+
+        # released handles are reused
+        handle = self.machine.delay.schedule(1000, self.callback)
+        handle.release()
+        handle.release()
+        handle2 = self.machine.delay.schedule(1000, self.callback, value=5)
+        self.assertIs(handle, handle2)
+        handle3 = self.machine.delay.schedule(1000, self.callback, value=6)
+        self.assertIsNot(handle2, handle3)
+
+        # clear cancels anonymous delays as well
+        self.callback = MagicMock()
+        self.machine.delay.clear()
+        self.assertFalse(handle2.active)
+        self.assertFalse(handle3.active)
+        self.advance_time_and_run(1.1)
+        self.callback.assert_not_called()
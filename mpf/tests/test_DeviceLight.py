@@ -228,6 +228,29 @@ class TestDeviceLight(MpfTestCase):
         self.assertEqual(RGBColor('green'), led1.stack[2].dest_color)
         self.assertEqual(RGBColor('orange'), led1.stack[3].dest_color)
 
+    def test_stack_order(self):
+        led1 = self.machine.lights["led1"]
+        for i in range(200):
+            key = "key{}".format(i * 7 % 13)
+            if i % 3 == 2:
+                led1.remove_from_stack_by_key(key, fade_ms=100 if i % 2 else 0)
+            else:
+                led1.color('red', priority=i * 5 % 4, key=key, fade_ms=i % 50)
+            self.advance_time_and_run(.03)
+
+            # stack is ordered by priority and key and every key is only once in the stack
+            entries = list(led1.stack)
+            self.assertEqual(sorted(entries, reverse=True), entries)
+            self.assertEqual(len(entries), len({entry.key for entry in entries}))
+            for index, entry in enumerate(entries):
+                self.assertIs(entry, led1.stack[index])
+                self.assertIs(entry, led1.stack.get(entry.key))
+                self.assertEqual(index, led1.stack.index(entry))
+
+        led1.clear_stack()
+        self.assertFalse(led1.stack)
+        self.assertIsNone(led1.stack.get("key1"))
+
     def test_named_colors(self):
         led1 = self.machine.lights["led1"]
         led1.color('jans_red')
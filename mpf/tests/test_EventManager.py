@@ -1,6 +1,7 @@
 """Test event manager."""
 from mpf.core.delays import DelayManager
 from mpf.core.settings_controller import SettingEntry
+from mpf.exceptions.config_file_error import ConfigFileError
 from mpf.tests.MpfFakeGameTestCase import MpfFakeGameTestCase
 from mpf.tests.MpfTestCase import MpfTestCase
 from unittest.mock import patch
@@ -341,6 +342,58 @@ class TestEventManager(MpfFakeGameTestCase, MpfTestCase):
         self.assertEqual(tuple(), self._handler2_args)
         self.assertEqual(dict(), self._handler2_kwargs)
 
+    def test_handler_order_with_same_priority(self):
+        # handlers with the same priority are called in the order they were added
+        self.machine.events.add_handler('test_event', self.event_handler1, priority=5)
+        self.machine.events.add_handler('test_event', self.event_handler2, priority=10)
+        self.machine.events.add_handler('test_event', self.event_handler3, priority=5)
+        self.machine.events.add_handler('test_event', self.event_handler1, priority=1)
+
+        self.machine.events.post('test_event')
+        self.advance_time_and_run(1)
+
+        self.assertEqual([self.event_handler2, self.event_handler1, self.event_handler3, self.event_handler1],
+                         self._handlers_called)
+
+    def test_add_and_remove_handlers_bulk(self):
+        self.machine.events.add_handler('test_event1', self.event_handler3, priority=5)
+        keys = self.machine.events.add_handlers_bulk([
+            ('test_event1', self.event_handler1, 5, {}),
+            ('test_event1', self.event_handler2, 10, {"blocking_facility": "test"}),
+            ('test_event2', self.event_handler1, 1, {"test": 1}),
+        ])
+        self.assertEqual(3, len(keys))
+        self.assertEqual(["test_event1", "test_event1", "test_event2"], [key.event for key in keys])
+        self.assertEqual("test", self.machine.events.registered_handlers['test_event1'][0].blocking_facility)
+
+        self.machine.events.post('test_event1')
+        self.advance_time_and_run(1)
+        self.assertEqual([self.event_handler2, self.event_handler3, self.event_handler1], self._handlers_called)
+
+        self.machine.events.post('test_event2')
+        self.advance_time_and_run(1)
+        self.assertEqual(dict(test=1), self._handler1_kwargs)
+
+        self.machine.events.remove_handlers_bulk(keys)
+        self.assertFalse(self.machine.events.does_event_exist('test_event2'))
+        self.assertEqual(1, len(self.machine.events.registered_handlers['test_event1']))
+
+        # removing keys twice is fine
+        self.machine.events.remove_handlers_bulk(keys)
+
+        # remove by method removes the remaining handler
+        self.machine.events.remove_handler(self.event_handler3)
+        self.assertFalse(self.machine.events.does_event_exist('test_event1'))
+
+    def test_switch_name_in_handlers_bulk(self):
+        # the handler is only validated once but every event is checked
+        with patch.object(self.machine, "switches", {"s_test": None}):
+            with self.assertRaises(ConfigFileError):
+                self.machine.events.add_handlers_bulk([
+                    ('test_event1', self.event_handler1, 1, {}),
+                    ('s_test', self.event_handler1, 1, {}),
+                ])
+
     def test_does_event_exist(self):
         self.machine.events.add_handler('test_event', self.event_handler1)
 
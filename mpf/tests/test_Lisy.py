@@ -1,5 +1,6 @@
 import time
 
+from mpf.core.rgb_color import RGBColor
 from mpf.platforms.interfaces.segment_display_platform_interface import FlashingType
 from mpf.platforms.lisy import lisy
 
@@ -336,6 +337,11 @@ Display count: 5
         self._wait_for_processing()
         self.assertFalse(self.serialMock.expected_commands)
 
+        # lisy has no colors. the frame does not change and is not sent again
+        self.machine.segment_displays["player1_display"].set_color([RGBColor("red")])
+        self._wait_for_processing()
+        self.assertFalse(self.serialMock.crashed)
+
         # test sound
         self.serialMock.expected_commands = {
             b'\x32\x02': None
@@ -0,0 +1,105 @@
+"""Test the logging pipeline."""
+import logging
+import threading
+import unittest
+
+from mpf.core.log_pipeline import LogPipeline, DROP
+from mpf.core.logging import LogMixin
+
+
+class ListHandler(logging.Handler):
+
+    def __init__(self, level=logging.NOTSET):
+        super().__init__(level)
+        self.lines = []
+        self.threads = set()
+        self.unblocked = threading.Event()
+        self.unblocked.set()
+        self.setFormatter(logging.Formatter("%(levelname)s:%(name)s:%(message)s"))
+
+    def emit(self, record):
+        self.unblocked.wait()
+        self.threads.add(threading.current_thread())
+        self.lines.append(self.format(record))
+
+
+class LoggingDevice(LogMixin):
+
+    machine = None
+
+
+class TestLogPipeline(unittest.TestCase):
+
+    def setUp(self):
+        self.logger = logging.getLogger("test_log_pipeline")
+        self.logger.setLevel(logging.DEBUG)
+        self.logger.propagate = False
+
+    def test_write_in_background(self):
+        handler = ListHandler()
+        warnings = ListHandler(logging.WARNING)
+        pipeline = LogPipeline([handler, warnings], logger=self.logger)
+        pipeline.start()
+
+        # loggers from configure_logging propagate to the pipeline
+        device = LoggingDevice()
+        device.configure_logging("test_log_pipeline.device", "full", "full")
+        device.debug_log("Value %s", 42)
+        device.warning_log("Warning %s", 23)
+        self.logger.info("Info")
+        pipeline.stop()
+
+        self.assertEqual(["DEBUG:test_log_pipeline.device:Value 42", "WARNING:test_log_pipeline.device:Warning 23",
+                          "INFO:test_log_pipeline:Info"], handler.lines)
+        self.assertEqual(["WARNING:test_log_pipeline.device:Warning 23"], warnings.lines)
+        self.assertNotIn(threading.current_thread(), handler.threads)
+        self.assertNotIn(pipeline.handler, self.logger.handlers)
+
+    def test_drop(self):
+        handler = ListHandler()
+        handler.unblocked.clear()
+        pipeline = LogPipeline([handler], queue_size=3, policy=DROP, logger=self.logger)
+        pipeline.start()
+
+        # the background thread takes the first record and blocks. the queue holds three more
+        for i in range(10):
+            self.logger.info("Line %s", i)
+        self.assertGreaterEqual(pipeline.dropped, 6)
+        dropped = pipeline.dropped
+
+        handler.unblocked.set()
+        pipeline.stop()
+        self.assertEqual(10 - dropped, len([line for line in handler.lines if "Line" in line]))
+        self.assertEqual("WARNING:test_log_pipeline:Log queue was full. Dropped {0} log records ({0} in total)."
+                         .format(dropped), handler.lines[-1])
+
+    def test_block(self):
+        handler = ListHandler()
+        pipeline = LogPipeline([handler], queue_size=1, logger=self.logger)
+        pipeline.start()
+        for i in range(100):
+            self.logger.info("Line %s", i)
+        pipeline.stop()
+
+        self.assertEqual(0, pipeline.dropped)
+        self.assertEqual(["INFO:test_log_pipeline:Line {}".format(i) for i in range(100)], handler.lines)
+
+    def test_mutable_args(self):
+        handler = ListHandler()
+        handler.unblocked.clear()
+        pipeline = LogPipeline([handler], logger=self.logger)
+        pipeline.start()
+
+        state = {"balls": 1}
+        self.logger.info("State %s %s", state, 2)
+        self.logger.info("Count %s", 3)
+        state["balls"] = 2
+
+        handler.unblocked.set()
+        pipeline.stop()
+        self.assertEqual(["INFO:test_log_pipeline:State {'balls': 1} 2", "INFO:test_log_pipeline:Count 3"],
+                         handler.lines)
+
+    def test_invalid_policy(self):
+        with self.assertRaises(ValueError):
+            LogPipeline([], policy="wait")
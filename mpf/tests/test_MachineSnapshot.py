@@ -0,0 +1,38 @@
+"""Test forked machine snapshots."""
+import os
+import unittest
+
+from mpf.tests.MpfTestCase import MpfTestCase, machine_snapshot, test_config
+
+
+@unittest.skipUnless(hasattr(os, "fork"), "Requires os.fork")
+@machine_snapshot
+class TestMachineSnapshot(MpfTestCase):
+
+    boot_pid = None
+
+    def get_config_file(self):
+        return 'config.yaml'
+
+    def get_machine_path(self):
+        return 'tests/machine_files/machine_vars/'
+
+    def _assert_fresh_machine(self):
+        self.assertNotEqual(os.getpid(), self.boot_pid)
+        self.assertFalse(self.machine.variables.is_machine_var("snapshot_test"))
+        self.assertEqual(0.001, round(self.machine.clock.get_time(), 3))
+        self.machine.variables.set_machine_var("snapshot_test", 1)
+        self.advance_time_and_run(10)
+
+    def test_first(self):
+        self._assert_fresh_machine()
+
+    def test_second(self):
+        self._assert_fresh_machine()
+
+    @test_config('config.yaml')
+    def test_decorated_config(self):
+        self._assert_fresh_machine()
+
+
+TestMachineSnapshot.boot_pid = os.getpid()
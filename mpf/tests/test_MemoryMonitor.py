@@ -0,0 +1,106 @@
+"""Test the memory monitor."""
+import gc
+from unittest.mock import patch
+
+from mpf.core.memory_monitor import MemoryMonitor
+from mpf.tests.MpfBcpTestCase import MpfBcpTestCase
+from mpf.tests.MpfTestCase import test_config
+
+
+class TestMemoryMonitor(MpfBcpTestCase):
+
+    def get_config_file(self):
+        return 'config.yaml'
+
+    def get_machine_path(self):
+        return 'tests/machine_files/memory_monitor/'
+
+    def test_sources(self):
+        sizes = self.machine.memory_monitor.get_sizes()
+        for name in ("rss", "gc_objects", "event_handlers", "cache_event_strings", "cache_show_steps",
+                     "device_tag_cache", "device_attribute_futures", "running_shows"):
+            self.assertIn(name, sizes)
+        self.assertGreater(sizes["rss"], 0)
+
+        # every new token combination is cached in the show. collect shows of previous tests first
+        gc.collect()
+        cache_size = self.machine.memory_monitor.get_sizes()["cache_show_steps"]
+        for i in range(3):
+            self.machine.shows["flash"].get_show_steps_with_token({"light": "l_test", "dummy": i})
+        self.assertEqual(cache_size + 3, self.machine.memory_monitor.get_sizes()["cache_show_steps"])
+
+        # futures of subscribed device attributes are counted
+        futures = self.machine.memory_monitor.get_sizes()["device_attribute_futures"]
+        self.machine.lights["l_test"].subscribe_attribute("color", self.machine)
+        self.assertEqual(futures + 1, self.machine.memory_monitor.get_sizes()["device_attribute_futures"])
+
+    def test_growth_alert(self):
+        self.mock_event("memory_growth")
+        size = [0]
+        # only sample the test source. real sources may grow while the tests run
+        patcher = patch.object(MemoryMonitor, "get_sizes", lambda monitor: {"rss": 1, "test_registry": size[0]})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        # growth with pauses does not alert
+        for i in range(8):
+            if i % 2 == 0:
+                size[0] += 1
+            self.advance_time_and_run(1)
+        self.assertEventNotCalled("memory_growth")
+        alert_size = size[0] + 30
+
+        # sustained growth alerts once
+        with patch.object(MemoryMonitor, "warning_log") as warning_log:
+            for _ in range(6):
+                size[0] += 10
+                self.advance_time_and_run(1)
+        self.assertEventCalledWith("memory_growth", source="test_registry", size=alert_size, growth=30)
+        self.assertEqual(1, self._events["memory_growth"])
+        self.assertEqual(1, warning_log.call_count)
+        self.assertEqual(["test_registry"], self.machine.memory_monitor.get_stats()["alerts"])
+        # the first sample of the source happened after the first increment
+        self.assertEqual(size[0] - 1, self.machine.memory_monitor.get_growth()["test_registry"])
+
+        # it alerts again after the growth stopped and started again
+        self.advance_time_and_run(1)
+        self.assertEqual([], self.machine.memory_monitor.get_stats()["alerts"])
+        for _ in range(3):
+            size[0] += 1
+            self.advance_time_and_run(1)
+        self.assertEqual(2, self._events["memory_growth"])
+
+    def test_log_and_dump(self):
+        with patch.object(MemoryMonitor, "info_log") as info_log:
+            self.advance_time_and_run(10)
+        log_lines = [call for call in info_log.call_args_list if call[0][0].startswith("Memory:")]
+        self.assertEqual(2, len(log_lines))
+
+        with patch.object(MemoryMonitor, "info_log") as info_log:
+            self.post_event("debug_dump_stats")
+        messages = [call[0][0] for call in info_log.call_args_list]
+        self.assertIn("--- DEBUG DUMP MEMORY ---", messages)
+
+    def test_monitor(self):
+        self._bcp_external_client.reset_and_return_queue()
+        self._bcp_external_client.send('monitor_start', {'category': 'memory'})
+        self.advance_time_and_run(1.5)
+        queue = self._bcp_external_client.reset_and_return_queue()
+        stats = [args for command, args in queue if command == "memory_stats"]
+        self.assertEqual(2, len(stats))
+        self.assertIn("event_handlers", stats[-1]["sizes"])
+        self.assertIn("rss", stats[-1]["growth"])
+
+        self._bcp_external_client.send('monitor_stop', {'category': 'memory'})
+        self.advance_time_and_run(2)
+        queue = self._bcp_external_client.reset_and_return_queue()
+        self.assertNotIn("memory_stats", [command for command, _ in queue])
+
+    @test_config("tracemalloc.yaml")
+    def test_tracemalloc(self):
+        self.advance_time_and_run(1)
+        allocations = [object() for _ in range(1000)]
+        self.advance_time_and_run(1)
+        del allocations
+        self.assertTrue(self.machine.memory_monitor.tracemalloc_diff)
+        self.assertLessEqual(len(self.machine.memory_monitor.tracemalloc_diff), 5)
@@ -112,12 +112,37 @@ class TestModes(MpfFakeGameTestCase):
         self.assertEqual(self.machine.modes["mode1"].priority, 500)
         self.advance_time_and_run()
 
+        # the activation plan is reused but stop priority follows the mode priority
+        for handler in self.machine.events.registered_handlers['stop_mode1']:
+            if handler.callback == self.machine.modes["mode1"].stop:
+                self.assertEqual(handler.priority, 501)
+
         # test the order of the active modes list
         self.assertEqual(self.machine.modes["mode1"],
                          self.machine.mode_controller.active_modes[0])
         self.assertEqual(self.machine.modes["attract"],
                          self.machine.mode_controller.active_modes[1])
 
+    def test_activation_plan(self):
+        mode = self.machine.modes["mode1"]
+        mode.start()
+        self.advance_time_and_run()
+        plan = self.machine.mode_controller.get_activation_plan(mode)
+        handler_count = len(self.machine.events.registered_handlers['stop_mode1'])
+        mode.stop()
+        self.advance_time_and_run()
+        self.assertModeNotRunning("mode1")
+
+        # the second start uses the same plan and registers the same handlers
+        mode.start()
+        self.advance_time_and_run()
+        self.assertModeRunning("mode1")
+        self.assertIs(plan, self.machine.mode_controller.get_activation_plan(mode))
+        self.assertEqual(handler_count, len(self.machine.events.registered_handlers['stop_mode1']))
+
+        self.post_event("stop_mode1")
+        self.assertModeNotRunning("mode1")
+
     def test_mode_start_with_callback(self):
         self.mode_start_callback = MagicMock()
 
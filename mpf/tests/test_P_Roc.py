@@ -273,6 +273,49 @@ class TestPRoc(MpfTestCase):
         self.pinproc.driver_pulsed_patter.assert_called_with(
             number, 9, 1, 20, True)
 
+    def test_command_merging(self):
+        number = self.machine.coils["c_test"].hw_driver.number
+        self.wait_for_platform()
+        self.pinproc.driver_pulse = MagicMock(return_value=True)
+        self.pinproc.driver_disable = MagicMock(return_value=True)
+        stats = self.machine.default_platform.get_command_queue_stats()
+
+        # all commands to the same driver in one loop iteration end up as the last one
+        self.machine.coils["c_test"].pulse()
+        self.machine.coils["c_test"].pulse()
+        self.machine.coils["c_test"].disable()
+        self.assertEqual(1, self.machine.default_platform.get_command_queue_stats()["queue_depth"])
+        self.wait_for_platform()
+        assert not self.pinproc.driver_pulse.called
+        self.pinproc.driver_disable.assert_called_once_with(number)
+
+        new_stats = self.machine.default_platform.get_command_queue_stats()
+        self.assertEqual(0, new_stats["queue_depth"])
+        self.assertEqual(3, new_stats["commands_queued"] - stats["commands_queued"])
+        self.assertEqual(2, new_stats["commands_merged"] - stats["commands_merged"])
+        self.assertEqual(1, new_stats["commands_flushed"] - stats["commands_flushed"])
+
+        # queued commands are sent together with the next watchdog tickle
+        self.machine.coils["c_test"].pulse()
+        self.advance_time_and_run(.1)
+        self.pinproc.driver_pulse.assert_called_once_with(number, 23)
+
+    def test_event_polling(self):
+        self.pinproc.watchdog_tickle = MagicMock(return_value=True)
+        self.pinproc.get_events = MagicMock(return_value=[])
+        self.advance_time_and_run(1)
+        # events are polled at default_platform_hz but the watchdog is only tickled every 100ms
+        self.assertAlmostEqual(100, self.pinproc.get_events.call_count, delta=2)
+        self.assertAlmostEqual(10, self.pinproc.watchdog_tickle.call_count, delta=1)
+
+        # events are passed to the switch controller in the next loop iteration
+        self.assertSwitchState("s_test", 0)
+        events = [[{'type': 1, 'value': 23}]]
+        self.pinproc.get_events = MagicMock(side_effect=lambda: events.pop() if events else [])
+        self.advance_time_and_run(.01)
+        self.assertSwitchState("s_test", 1)
+        self.assertFalse(events)
+
     def _test_alpha_display(self):
         self.pinproc.aux_send_commands = MagicMock(return_value=True)
         self.machine.segment_displays["display1"].add_text("1234", key="score")
@@ -0,0 +1,23 @@
+import unittest
+
+from mpf.tests.parallel_runner import create_shards
+
+
+class TestParallelRunner(unittest.TestCase):
+
+    def test_create_shards(self):
+        test_classes = {
+            "a.A": ["a.A.test_1", "a.A.test_2"],
+            "b.B": ["b.B.test_1"],
+            "c.C": ["c.C.test_1"],
+            "d.D": ["d.D.test_1"],
+        }
+        durations = {"a.A.test_1": 3, "a.A.test_2": 3, "b.B.test_1": 4, "c.C.test_1": 2}
+        shards = create_shards(test_classes, durations, 2)
+
+        # classes are never split and shards are balanced by duration
+        self.assertEqual([["a.A.test_1", "a.A.test_2", "d.D.test_1"], ["b.B.test_1", "c.C.test_1"]], shards)
+
+        # more jobs than classes
+        shards = create_shards(test_classes, {}, 8)
+        self.assertEqual(4, len(shards))
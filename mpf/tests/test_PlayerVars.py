@@ -57,3 +57,51 @@ class TestPlayerVars(MpfGameTestCase):
                                     change=-9,
                                     player_num=1,
                                     bar='foo')
+
+    def test_batched_events(self):
+        self.fill_troughs()
+        self.start_game()
+        self.mock_event('player_some_var')
+        self.mock_event('player_some_float')
+        self.mock_event('player_some_string')
+
+        # all changes during one run of the event queue are posted once
+        self.machine.game.player.add_with_kwargs('some_var', 6, foo='bar')
+        self.machine.game.player.add_with_kwargs('some_var', 2, bar='foo')
+        self.machine.game.player['some_var'] = 20
+        self.machine.game.player.some_float = 5.0
+        self.machine.game.player.some_float = 6.0
+        self.machine.game.player.some_string = "5"
+        self.machine.game.player.some_string = "4"
+        self.advance_time_and_run()
+
+        self.assertEqual(1, self._events['player_some_var'])
+        self.assertEventCalledWith('player_some_var', value=20, prev_value=4, change=16, player_num=1,
+                                   foo='bar', bar='foo')
+        # unbatched vars post every change
+        self.assertEqual(2, self._events['player_some_float'])
+        self.assertEventCalledWith('player_some_float', value=6.0, prev_value=5.0, change=1.0, player_num=1)
+        # no event when the value did not change in the end
+        self.assertEqual(0, self._events['player_some_string'])
+
+        # changes by handlers of batched events are batched again in the same run
+        self.machine.events.add_handler('player_some_var', self._change_string)
+        self.machine.game.player.some_var = 21
+        self.machine_run()
+        self.assertEqual(2, self._events['player_some_var'])
+        self.assertEventCalledWith('player_some_string', value="4!", prev_value="4", change=True, player_num=1)
+
+        self.mock_event('machine_var_test1')
+        self.mock_event('machine_var_test2')
+        self.machine.variables.set_machine_var("test1", 5)
+        self.machine.variables.set_machine_var("test1", 7)
+        self.machine.variables.set_machine_var("test2", "6")
+        self.machine.variables.set_machine_var("test2", "7")
+        self.advance_time_and_run()
+        self.assertEqual(1, self._events['machine_var_test1'])
+        self.assertEventCalledWith('machine_var_test1', value=7, prev_value=4, change=3)
+        self.assertEqual(2, self._events['machine_var_test2'])
+
+    def _change_string(self, **kwargs):
+        del kwargs
+        self.machine.game.player.some_string += "!"
@@ -0,0 +1,121 @@
+"""Test the profiler."""
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from mpf.core.profiler import LatencyHistogram, Profiler
+from mpf.tests.MpfBcpTestCase import MpfBcpTestCase
+from mpf.tests.MpfTestCase import test_config
+
+
+class TestLatencyHistogram(unittest.TestCase):
+
+    def test_histogram(self):
+        histogram = LatencyHistogram()
+        self.assertEqual(0, histogram.percentile(50))
+        for _ in range(90):
+            histogram.add(0.3)
+        for _ in range(10):
+            histogram.add(30)
+        self.assertEqual(100, histogram.count)
+        self.assertEqual(0.5, histogram.percentile(50))
+        self.assertEqual(30, histogram.percentile(95))
+        self.assertEqual(30, histogram.max)
+        self.assertEqual({"0.5": 90, "50": 10}, histogram.to_dict()["buckets"])
+
+
+class TestProfiler(MpfBcpTestCase):
+
+    def get_config_file(self):
+        return 'config.yaml'
+
+    def get_machine_path(self):
+        return 'tests/machine_files/profiler/'
+
+    def _handler(self, **kwargs):
+        del kwargs
+
+    def _get_names(self, category):
+        return [entry["name"] for entry in self.machine.profiler.get_stats().get(category, [])]
+
+    def test_profiler(self):
+        self.assertEqual(self.machine.profiler, self.machine.events.profiler)
+        self.machine.events.add_handler("test_event", self._handler)
+        self.post_event("test_event")
+        self.assertIn("test_event", self._get_names("event"))
+        self.assertIn("TestProfiler._handler", self._get_names("handler"))
+
+        self.machine.switch_controller.add_switch_handler("s_test", self._handler)
+        self.hit_switch_and_run("s_test", 1)
+        self.assertIn("TestProfiler._handler", self._get_names("switch_handler"))
+
+        self.machine.delay.add(100, self._handler)
+        self.advance_time_and_run(1)
+        self.assertIn("TestProfiler._handler", self._get_names("delay"))
+
+        self.machine.shows["flash"].play()
+        self.advance_time_and_run(3)
+        self.assertIn("flash", self._get_names("show_step"))
+        self.assertIn("loop", self._get_names("loop_lag"))
+
+    def test_slow_handler(self):
+        self.machine.events.add_handler("test_event", self._handler)
+        with patch("mpf.core.profiler.perf_counter", side_effect=[1.0, 1.5]), \
+                patch.object(Profiler, "warning_log") as warning_log:
+            self.machine.events.post("test_event")
+            self.advance_time_and_run()
+        warning_log.assert_called_once_with("Slow %s: %s took %.2fms", "handler", "TestProfiler._handler",
+                                            500.0)
+        self.assertEqual(1, self.machine.profiler.slow_calls)
+
+    def test_dump_file(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            dump_file = os.path.join(tmp_dir, "profile.json")
+            self.machine.profiler.config['dump_file'] = dump_file
+            self.post_event("debug_dump_stats")
+            with open(dump_file, encoding="utf-8") as f:
+                data = json.load(f)
+        self.assertIn("event", data["stats"])
+        self.assertEqual(1.0, data["sample_rate"])
+
+    def test_monitor(self):
+        self._bcp_external_client.reset_and_return_queue()
+        self._bcp_external_client.send('monitor_start', {'category': 'profiler'})
+        self.advance_time_and_run(1.5)
+        queue = self._bcp_external_client.reset_and_return_queue()
+        stats = [args for command, args in queue if command == "profiler_stats"]
+        self.assertEqual(2, len(stats))
+        self.assertIn("event", stats[-1]["stats"])
+
+        self._bcp_external_client.send('monitor_stop', {'category': 'profiler'})
+        self.advance_time_and_run(2)
+        queue = self._bcp_external_client.reset_and_return_queue()
+        self.assertNotIn("profiler_stats", [command for command, _ in queue])
+
+    @test_config("sampled.yaml")
+    def test_sampled(self):
+        self.machine.profiler.reset()
+        self.machine.events.add_handler("test_event", self._handler)
+        for _ in range(400):
+            self.machine.events.post("test_event")
+        self.advance_time_and_run()
+        stats = {entry["name"]: entry for entry in self.machine.profiler.get_stats()["event"]}
+        # about a quarter of all posts is timed
+        self.assertTrue(50 < stats["test_event"]["count"] < 150, stats["test_event"]["count"])
+
+    @test_config("sampled.yaml")
+    def test_sampled_event_cycle(self):
+        # a cycle of four events must not alias with a sample rate of 0.25
+        self.machine.profiler.reset()
+        events = ["cycle_event{}".format(i) for i in range(4)]
+        for event in events:
+            self.machine.events.add_handler(event, self._handler)
+        for _ in range(100):
+            for event in events:
+                self.machine.events.post(event)
+        self.advance_time_and_run()
+        stats = {entry["name"]: entry for entry in self.machine.profiler.get_stats()["event"]}
+        for event in events:
+            self.assertIn(event, stats)
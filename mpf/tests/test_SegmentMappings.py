@@ -1,6 +1,8 @@
 import unittest
 
-from mpf.core.segment_mappings import TextToSegmentMapper, BCD_SEGMENTS
+from mpf.core.rgb_color import RGBColor
+from mpf.core.segment_mappings import TextToSegmentMapper, BCD_SEGMENTS, SEVEN_SEGMENTS
+from mpf.devices.segment_display.segment_display_text import SegmentDisplayText
 
 
 class TestSegmentDisplay(unittest.TestCase):
@@ -20,3 +22,41 @@ class TestSegmentDisplay(unittest.TestCase):
              BCD_SEGMENTS[ord("2")], BCD_SEGMENTS[ord("3")], ],
             mapping
         )
+
+    def test_cached_mapping(self):
+        TextToSegmentMapper._cache.clear()
+        hits = TextToSegmentMapper._cache.hits
+        text = SegmentDisplayText.from_str("42.", 4, True, False, False)
+        mapping = TextToSegmentMapper.map_segment_text_to_segments(text, 4, SEVEN_SEGMENTS)
+        self.assertEqual([SEVEN_SEGMENTS[ord(" ")], SEVEN_SEGMENTS[ord(" ")], SEVEN_SEGMENTS[ord("4")],
+                          SEVEN_SEGMENTS[ord("2")].copy_with_dp_on()], mapping)
+
+        # changing the result does not change the cache
+        mapping.clear()
+        self.assertEqual(4, len(TextToSegmentMapper.map_segment_text_to_segments(text, 4, SEVEN_SEGMENTS)))
+        self.assertEqual(hits + 1, TextToSegmentMapper._cache.hits)
+
+        # width and mapping are part of the key
+        self.assertEqual(3, len(TextToSegmentMapper.map_segment_text_to_segments(text, 3, SEVEN_SEGMENTS)))
+        self.assertEqual(BCD_SEGMENTS[ord("4")],
+                         TextToSegmentMapper.map_segment_text_to_segments(text, 4, BCD_SEGMENTS)[2])
+
+        # colors are part of the key of colored mappings
+        red = SegmentDisplayText.from_str("42", 4, True, False, False, [RGBColor("red")])
+        blue = SegmentDisplayText.from_str("42", 4, True, False, False, [RGBColor("blue")])
+        self.assertEqual(RGBColor("red"),
+                         TextToSegmentMapper.map_segment_text_to_segments_with_color(red, 4, SEVEN_SEGMENTS)[3][1])
+        self.assertEqual(RGBColor("blue"),
+                         TextToSegmentMapper.map_segment_text_to_segments_with_color(blue, 4, SEVEN_SEGMENTS)[3][1])
+
+    def test_cached_text(self):
+        text = SegmentDisplayText.from_str("1.2", 3, True, False, False, [RGBColor("red")])
+        text.extend(SegmentDisplayText.from_str("3", 1, True, False, False))
+
+        # texts are copies of the cached characters
+        text = SegmentDisplayText.from_str("1.2", 3, True, False, False, [RGBColor("red")])
+        self.assertEqual(3, len(text))
+        self.assertEqual(" 1.2", text.convert_to_str())
+        self.assertEqual([RGBColor("red")] * 3, text.get_colors())
+        self.assertEqual([RGBColor("green")] * 3,
+                         SegmentDisplayText.from_str("1.2", 3, True, False, False, [RGBColor("green")]).get_colors())
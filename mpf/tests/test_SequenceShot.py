@@ -232,3 +232,19 @@ class TestShots(MpfTestCase):
         self.machine_run()
         self.assertEventCalled("sequence4_hit")
 
+
+    def test_shared_matcher(self):
+        self.start_mode("mode1")
+        # sequence1 and sequence_mode_event share one handler for event1
+        self.assertEqual(1, len(self.machine.events.registered_handlers["event1"]))
+        self.post_event("event1")
+        self.assertEqual(["event2"], [x.next_event for x in self.machine.sequence_shots["sequence1"].active_sequences])
+        self.assertEqual(1, len(self.machine.sequence_shots["sequence_mode_event"].active_sequences))
+
+        self.stop_mode("mode1")
+        self.assertEqual(1, len(self.machine.events.registered_handlers["event1"]))
+        self.assertEqual([], self.machine.sequence_shots["sequence_mode_event"].active_sequences)
+        self.assertEqual(1, len(self.machine.sequence_shots["sequence1"].active_sequences))
+
+        self.post_event("cancel")
+        self.assertEqual([], self.machine.sequence_shots["sequence1"].active_sequences)
@@ -848,6 +848,36 @@ class TestShows(MpfTestCase):
         self.advance_time_and_run()
         self.assertLightColor("led_02", "blue")
 
+    def test_static_show_config_is_reused(self):
+        instances = self.machine.show_player.instances['_global']['show_player']
+        self.post_event("play_on_led1")
+        self.advance_time_and_run()
+        show_config = instances['on_led_01'].show_config
+        self.assertEqual({"lights": "led_01"}, show_config.show_tokens)
+
+        self.post_event("stop_on_led1")
+        self.advance_time_and_run()
+        self.assertNotIn('on_led_01', instances)
+        self.post_event("play_on_led1")
+        self.advance_time_and_run()
+        self.assertIs(show_config, instances['on_led_01'].show_config)
+        self.assertLightColor("led_01", "white")
+
+    def test_placeholder_in_token_is_evaluated_on_play(self):
+        instances = self.machine.show_player.instances['_global']['show_player']
+        self.machine.variables.set_machine_var("test_color", "blue")
+        self.machine.variables.set_machine_var("test_num", "02")
+        self.post_event("play_show_with_placeholder_in_token")
+        self.advance_time_and_run()
+        self.assertEqual({"num": "02", "color": "blue"}, instances['test_show_key_token'].show_config.show_tokens)
+        self.assertLightColor("led_02", "blue")
+
+        self.machine.variables.set_machine_var("test_color", "red")
+        self.post_event("play_show_with_placeholder_in_token")
+        self.advance_time_and_run()
+        self.assertEqual({"num": "02", "color": "red"}, instances['test_show_key_token'].show_config.show_tokens)
+        self.assertLightColor("led_02", "red")
+
     def test_placeholder_in_token_and_events(self):
         self.assertNotLightColor("led_02", "red")
         self.post_event_with_params("play_show_with_placeholder_in_token_and_event_args", test_color="red",
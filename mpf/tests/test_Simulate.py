@@ -0,0 +1,46 @@
+import os
+import unittest
+
+import mpf.core
+from mpf.commands.simulate import Simulator, SimulationError
+
+
+class TestSimulate(unittest.TestCase):
+
+    def _get_machine_path(self):
+        return os.path.abspath(os.path.join(mpf.core.__path__[0], os.pardir, "tests/machine_files/simulate/"))
+
+    def _simulate(self, games, seed, script=None):
+        # do not load plugins which other tests import with mocked dependencies
+        simulator = Simulator(self._get_machine_path(), ["config.yaml"], script, seed=seed,
+                              config_patches={"mpf": {"plugins": []}})
+        try:
+            samples = simulator.run(games=games, sample_interval=60)
+            self.assertEqual(games, simulator.games)
+            self.assertIsNone(simulator.machine.game)
+            self.assertTrue(simulator.machine.modes["attract"].active)
+        finally:
+            simulator.stop()
+        return samples
+
+    def test_play_games(self):
+        samples = self._simulate(3, seed=1)
+        first, last = samples[0], samples[-1]
+        self.assertEqual(0, first.games)
+        self.assertEqual(3, last.games)
+        self.assertGreater(len(samples), 2)
+        self.assertGreater(last.simulated_time, 60)
+        # all game and mode handlers are removed after the games
+        self.assertEqual(first.event_handlers, last.event_handlers)
+        self.assertEqual(first.switch_handlers, last.switch_handlers)
+
+        # the same seed plays the same games
+        self.assertEqual(last.simulated_time, self._simulate(3, seed=1)[-1].simulated_time)
+        self.assertNotEqual(last.simulated_time, self._simulate(3, seed=2)[-1].simulated_time)
+
+    def test_script(self):
+        samples = self._simulate(1, seed=1, script={"switches": {"s_ramp": 1}, "players": 2, "ball_duration": "5s"})
+        self.assertEqual(1, samples[-1].games)
+
+        with self.assertRaises(SimulationError):
+            Simulator(self._get_machine_path(), ["config.yaml"], {"unknown": 1})
@@ -0,0 +1,160 @@
+"""Test the startup profiler and init steps."""
+import asyncio
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from mpf.core.init_tasks import InitTaskGraph
+from mpf.core.startup_profiler import StartupProfiler
+from mpf.tests.MpfBcpTestCase import MpfBcpTestCase
+
+
+class TestInitTaskGraph(unittest.TestCase):
+
+    def test_parallel_and_dependencies(self):
+        order = []
+        b_started = asyncio.Event()
+
+        async def step_a():
+            # only finishes if b runs at the same time
+            await b_started.wait()
+            order.append("a")
+
+        async def step_b():
+            b_started.set()
+            order.append("b")
+
+        async def step_c():
+            order.append("c")
+
+        profiler = StartupProfiler()
+        graph = InitTaskGraph("test", profiler)
+        graph.add("c", step_c, after=["a", "b"])
+        graph.add("a", step_a)
+        graph.add("b", step_b)
+        asyncio.run(asyncio.wait_for(graph.run(), 1))
+
+        self.assertEqual(["b", "a", "c"], order)
+        self.assertEqual(["b", "a", "c"], [entry["name"] for entry in profiler.entries])
+        self.assertEqual({"test"}, {entry["category"] for entry in profiler.entries})
+
+    def test_invalid_dependencies(self):
+        async def step():
+            pass
+
+        graph = InitTaskGraph("test")
+        graph.add("a", step, after=["b"])
+        with self.assertRaises(AssertionError):
+            graph.add("a", step)
+        with self.assertRaises(AssertionError):
+            graph.validate()
+
+        graph.add("b", step, after=["c"])
+        graph.add("c", step, after=["a"])
+        with self.assertRaisesRegex(AssertionError, "a -> b -> c -> a"):
+            asyncio.run(graph.run())
+
+    def test_failure_cancels_steps(self):
+        cancelled = []
+
+        async def fail():
+            raise ValueError()
+
+        async def wait_forever():
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+
+        graph = InitTaskGraph("test")
+        graph.add("wait", wait_forever)
+        graph.add("fail", fail)
+        graph.add("never", fail, after=["wait"])
+
+        async def run():
+            with self.assertRaises(ValueError):
+                await graph.run()
+            await asyncio.sleep(0)
+
+        asyncio.run(run())
+        self.assertEqual([True], cancelled)
+
+
+class TestStartupProfiler(MpfBcpTestCase):
+
+    def get_config_file(self):
+        return 'config.yaml'
+
+    def get_machine_path(self):
+        return 'tests/machine_files/profiler/'
+
+    def _get_names(self, category):
+        return [entry["name"] for entry in self.machine.startup_profiler.entries if entry["category"] == category]
+
+    def test_report(self):
+        self.assertIsNotNone(self.machine.startup_profiler.end_time)
+        self.assertIsNone(self.machine.events.startup_profiler)
+        phases = self._get_names("phase")
+        for phase in ("load_hardware_platforms", "load_core_modules", "initialize_platforms", "init_phase_1",
+                      "init_phase_5", "start_platforms", "wait_for_boot_holds"):
+            self.assertIn(phase, phases)
+        self.assertIn("events", self._get_names("core_module"))
+        self.assertIn("virtual", self._get_names("platform_initialize"))
+        self.assertIn("virtual", self._get_names("platform_start"))
+        self.assertIn("switches", self._get_names("create_devices"))
+        # async handlers are reported with the name of the coroutine
+        self.assertIn("DeviceManager._load_device_modules", self._get_names("init_phase_1"))
+        self.assertIn("SwitchController._initialize_switches", self._get_names("init_phase_2"))
+
+        report = self.machine.startup_profiler.get_report()
+        self.assertGreaterEqual(report["total_ms"], max(entry["duration_ms"] for entry in report["entries"]))
+        self.assertNotIn("phase", [entry["category"] for entry in report["slowest"]])
+
+    def test_platform_order(self):
+        order = []
+
+        class Platform:
+
+            def __init__(self, name, dependencies):
+                self.name = name
+                self.dependencies = dependencies
+
+            def get_init_dependencies(self):
+                return self.dependencies
+
+            async def initialize(self):
+                order.append(self.name + "_start")
+                await asyncio.sleep(0)
+                order.append(self.name + "_done")
+
+        platforms = {"sequential1": Platform("sequential1", None),
+                     "parallel": Platform("parallel", []),
+                     "sequential2": Platform("sequential2", None)}
+        with patch.object(self.machine, "hardware_platforms", platforms):
+            self.loop.run_until_complete(self.machine._get_platform_init_tasks("test", "initialize").run())
+
+        # platforms without dependencies wait for all platforms loaded before them
+        self.assertEqual(["sequential1_start", "parallel_start", "sequential1_done", "parallel_done",
+                          "sequential2_start", "sequential2_done"], order)
+
+    def test_report_file(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            report_file = os.path.join(tmp_dir, "startup.json")
+            self.machine.profiler.config['startup_report_file'] = report_file
+            self.machine.profiler.report_startup(self.machine.startup_profiler)
+            with open(report_file, encoding="utf-8") as f:
+                data = json.load(f)
+        self.assertEqual(self.machine.startup_profiler.total_ms, data["total_ms"])
+        self.assertIn("init_phase_1", [entry["name"] for entry in data["phases"]])
+
+    def test_monitor(self):
+        self._bcp_external_client.reset_and_return_queue()
+        self._bcp_external_client.send('monitor_start', {'category': 'profiler'})
+        self.advance_time_and_run(.1)
+        queue = self._bcp_external_client.reset_and_return_queue()
+        reports = [args for command, args in queue if command == "startup_profile"]
+        self.assertEqual(1, len(reports))
+        self.assertEqual(self.machine.startup_profiler.total_ms, reports[0]["total_ms"])
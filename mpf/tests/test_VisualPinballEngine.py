@@ -111,6 +111,16 @@ class TestVPE(MpfTestCase):
         self.advance_time_and_run(.1)
         self.assertAlmostEqual(0.8, self.simulator.lights["light-0"])
 
+        # fades within one tick are sent in one command
+        fade_commands = self.simulator.fade_commands
+        self.machine.lights["test_light1"].color("333333")
+        self.machine.lights["test_light2"].color("666666")
+        self.machine.lights["test_light1"].color("999999")
+        self.advance_time_and_run(.1)
+        self.assertEqual(fade_commands + 1, self.simulator.fade_commands)
+        self.assertAlmostEqual(0.6, self.simulator.lights["light-0"])
+        self.assertAlmostEqual(0.4, self.simulator.lights["light-1"])
+
         self.machine.coils["c_flipper"].pulse()
         self.advance_time_and_run(.1)
         self.assertEqual("pulsed-10-1.0", self.simulator.coils["1"])
@@ -17,6 +17,7 @@ class VpeSimulation:
         self.rules = {}
         self.dmd_frames = {}
         self.segment_displays = {}
+        self.fade_commands = 0
         self._command_task = None
         self._switch_task = None
 
@@ -66,6 +67,7 @@ class VpeSimulation:
         self.change_queue.put_nowait((switch, state))
 
     def handle_fade_light(self, request):
+        self.fade_commands += 1
         for fade in request.fades:
             if request.common_fade_ms > 0:
                 self.lights[fade.light_number] = (asyncio.get_event_loop().time() +